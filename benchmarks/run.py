@@ -0,0 +1,307 @@
+"""Benchmarks for permission evaluation hot paths.
+
+Run from the repository root:
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare results.json
+
+The benchmarks use models, views and serializers from `tests.app`.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from tests.conftest import pytest_configure
+
+
+pytest_configure()
+
+from django.conf import settings  # noqa: E402
+
+
+# Paginated responses build absolute links for the test request host
+settings.ALLOWED_HOSTS = ['testserver']
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from rest_framework.request import Request  # noqa: E402
+from rest_framework.response import Response  # noqa: E402
+from rest_framework.serializers import ModelSerializer  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from permission_manager_drf import (  # noqa: E402
+    ManagerPermission,
+    PermissionField,
+)
+from permission_manager_drf.utils import get_list_permissions  # noqa: E402
+from tests.app.models import TestModel, TestModelStatus  # noqa: E402
+from tests.app.pagination import TestPagination  # noqa: E402
+from tests.app.views import TestModelSerializer, TestModelViewSet  # noqa: E402
+
+
+PAGE_SIZES = (10, 100, 1000)
+
+
+class BenchmarkViewSet(TestModelViewSet):
+    permission_manager_list_actions = ('create', 'custom_non_detail')
+
+
+class WithoutChildrenSerializer(ModelSerializer):
+    permissions = PermissionField(actions=('update', 'publish'))
+
+    class Meta:
+        model = TestModel
+        fields = '__all__'
+
+
+def get_package_version(name: str) -> str | None:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def setup_database() -> tuple[User, list[TestModel]]:
+    call_command('migrate', run_syncdb=True, verbosity=0)
+    user = User.objects.create_user(username='admin', is_staff=True)
+    TestModel.objects.bulk_create(
+        TestModel(
+            title=f'Test {i}',
+            status=(
+                TestModelStatus.PUBLISHED if i % 2 else TestModelStatus.DRAFT
+            ),
+        )
+        for i in range(max(PAGE_SIZES))
+    )
+    return user, list(TestModel.objects.all())
+
+
+def get_view(user: User, action: str) -> BenchmarkViewSet:
+    request = Request(APIRequestFactory().get('/model/'))
+    request.user = user
+    return BenchmarkViewSet(
+        request=request,
+        action=action,
+        format_kwarg=None,
+        args=(),
+        kwargs={},
+    )
+
+
+def measure(
+    fn: Callable[[], Any],
+    *,
+    min_time: float,
+    repeat: int,
+) -> dict[str, float | int]:
+    # Calibrate the number of calls per round
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if (elapsed := time.perf_counter() - start) >= min_time / repeat:
+            break
+        number *= 2 if elapsed else 10
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+
+    # Memory allocated while the call runs, the result is held until the
+    # peak is read, so it is counted even if the call returns it
+    gc.collect()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        'calls': number * repeat,
+        'mean': statistics.mean(timings),
+        'min': min(timings),
+        'stdev': statistics.stdev(timings) if repeat > 1 else 0.0,
+        'ops_per_second': 1 / statistics.mean(timings),
+        'peak_memory': peak - baseline,
+    }
+
+
+def get_benchmarks(
+    user: User,
+    instances: list[TestModel],
+) -> dict[str, Callable[[], Any]]:
+    permission = ManagerPermission()
+    instance = instances[0]
+
+    def has_permission() -> None:
+        view = get_view(user, 'list')
+        permission.has_permission(view.request, view)
+
+    def has_object_permission() -> None:
+        view = get_view(user, 'update')
+        permission.has_object_permission(view.request, view, instance)
+
+    def list_permissions() -> None:
+        get_list_permissions(get_view(user, 'list'))
+
+    benchmarks = {
+        'manager_permission.has_permission': has_permission,
+        'manager_permission.has_object_permission': has_object_permission,
+        'get_list_permissions': list_permissions,
+    }
+
+    for serializer_class, suffix in (
+        (TestModelSerializer, 'with_children'),
+        (WithoutChildrenSerializer, 'without_children'),
+    ):
+        for page_size in PAGE_SIZES:
+            page = instances[:page_size]
+
+            def serialize(
+                serializer_class: type = serializer_class,
+                page: list = page,
+            ) -> dict:
+                view = get_view(user, 'list')
+                return serializer_class(
+                    page,
+                    many=True,
+                    context={'view': view, 'request': view.request},
+                ).data
+
+            benchmarks[f'permission_field.{suffix}.{page_size}'] = serialize
+
+    queryset = TestModel.objects.order_by('pk')
+    for page_size in PAGE_SIZES:
+
+        def paginated_list(page_size: int = page_size) -> Response:
+            view = get_view(user, 'list')
+            paginator = TestPagination()
+            paginator.page_size = page_size
+            page = paginator.paginate_queryset(queryset, view.request, view)
+            data = TestModelSerializer(
+                page,
+                many=True,
+                context={'view': view, 'request': view.request},
+            ).data
+            return paginator.get_paginated_response(data)
+
+        benchmarks[f'paginated_list.{page_size}'] = paginated_list
+
+    return benchmarks
+
+
+def run(
+    *,
+    min_time: float,
+    repeat: int,
+    select: str | None,
+) -> dict[str, Any]:
+    user, instances = setup_database()
+
+    results = {}
+    for name, fn in get_benchmarks(user, instances).items():
+        if select and select not in name:
+            continue
+        results[name] = measure(fn, min_time=min_time, repeat=repeat)
+        sys.stderr.write(
+            f'{name}: {results[name]["mean"] * 1e6:.1f} us, '
+            f'{results[name]["peak_memory"] / 1024:.1f} KiB peak memory\n'
+        )
+
+    return {
+        'meta': {
+            'created': datetime.now(tz=timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'django': get_package_version('django'),
+            'djangorestframework': get_package_version('djangorestframework'),
+            'permission_manager': get_package_version('permission-manager'),
+            'permission_manager_drf': get_package_version(
+                'permission-manager-drf'
+            ),
+        },
+        'results': results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> str:
+    header = (
+        f'{"benchmark":<50} {"baseline, us":>14} {"current, us":>14} '
+        f'{"ratio":>7}'
+    )
+    lines = [header]
+    for name, result in current['results'].items():
+        if not (baseline_result := baseline['results'].get(name)):
+            continue
+        lines.append(
+            f'{name:<50} {baseline_result["mean"] * 1e6:>14.1f} '
+            f'{result["mean"] * 1e6:>14.1f} '
+            f'{result["mean"] / baseline_result["mean"]:>7.2f}'
+        )
+    return '\n'.join(lines) + '\n'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--output',
+        type=Path,
+        help='Path to the JSON file for results (stdout by default).',
+    )
+    parser.add_argument(
+        '--compare',
+        type=Path,
+        help='Path to the JSON file with baseline results to compare with.',
+    )
+    parser.add_argument(
+        '--min-time',
+        type=float,
+        default=1.0,
+        help='Minimum time in seconds for each benchmark.',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Number of rounds for each benchmark.',
+    )
+    parser.add_argument(
+        '--select',
+        help='Run only benchmarks containing this string.',
+    )
+    args = parser.parse_args()
+
+    results = run(
+        min_time=args.min_time,
+        repeat=args.repeat,
+        select=args.select,
+    )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    elif not args.compare:
+        sys.stdout.write(json.dumps(results, indent=2) + '\n')
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        sys.stdout.write(compare(results, baseline))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,27 @@
 from .fields import PermissionField, PermissionFieldChild
-from .managers import DRFPermissionManager
-from .pagination import PermissionManagerPaginationMixin
-from .permissions import ManagerPermission
+from .filters import ManagerFilterBackend
+from .managers import AsyncDRFPermissionManager, DRFPermissionManager
+from .mixins import PermissionManagerQuerysetMixin
+from .pagination import (
+    PermissionManagerCursorPagination,
+    PermissionManagerPaginationMixin,
+)
+from .permissions import AsyncManagerPermission, ManagerPermission
+from .streaming import PermissionManagerStreamingMixin
+from .versions import CacheDependency
 
 
 __all__ = [
+    'AsyncDRFPermissionManager',
+    'AsyncManagerPermission',
+    'CacheDependency',
     'DRFPermissionManager',
+    'ManagerFilterBackend',
     'ManagerPermission',
     'PermissionField',
     'PermissionFieldChild',
+    'PermissionManagerCursorPagination',
     'PermissionManagerPaginationMixin',
+    'PermissionManagerQuerysetMixin',
+    'PermissionManagerStreamingMixin',
 ]
@@ -0,0 +1,245 @@
+import hashlib
+from collections.abc import Iterable
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from django.core.cache import caches
+
+from permission_manager_drf import settings
+
+
+if TYPE_CHECKING:
+    from django.core.cache.backends.base import BaseCache
+    from django.db.models import QuerySet
+    from permission_manager import BasePermissionManager
+    from rest_framework.viewsets import GenericViewSet
+
+
+# Prefix of all cache keys of the package
+CACHE_KEY_PREFIX = 'permission_manager_drf'
+
+# Sentinel for missing cache values, cached results can be falsy
+MISSING = object()
+
+# Types of context values with a stable `repr`
+STABLE_REPR_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    Decimal,
+    UUID,
+    date,
+    time,
+    timedelta,
+    Enum,
+)
+
+
+def get_result_cache() -> 'BaseCache':
+    """Get the cache for permission results.
+
+    Returns:
+        BaseCache: The cache defined by `PERMISSION_MANAGER_DRF_CACHE_ALIAS`
+            setting.
+    """
+    return caches[settings.PERMISSION_MANAGER_DRF_CACHE_ALIAS]
+
+
+def get_object_key(obj: Any) -> str | None:
+    """Get a part of a cache key for an object.
+
+    Args:
+        obj: The object (a user, an instance or a parent).
+
+    Returns:
+        str | None: The model and the primary key of the object (or just the
+            primary key if it isn't a model instance), '-' if there is no
+            object, or None if the object isn't saved and can't be cached.
+    """
+    if obj is None:
+        return '-'
+    if (pk := getattr(obj, 'pk', None)) is None:
+        return None
+    if meta := getattr(obj, '_meta', None):
+        return f'{meta.label_lower}:{pk}'
+    return str(pk)
+
+
+def get_result_cache_key(
+    manager: 'BasePermissionManager',
+    action: str,
+) -> str | None:
+    """Get a cache key for a permission result.
+
+    The key depends on the manager class, the action, the user, the instance,
+    the parent, the context fingerprint and the cache version of the manager.
+    The parent permission manager of a child manager is left out of the
+    context, since it's built for the user and the parent.
+
+    Args:
+        manager (BasePermissionManager): The permission manager.
+        action (str): The action name.
+
+    Returns:
+        str | None: The cache key, or None if the result can't be cached.
+    """
+    user_key = get_object_key(manager.user)
+    if user_key is None:
+        user_key = 'anonymous'
+
+    context = manager.context.copy()
+    instance_key = get_object_key(manager.instance)
+    parent_key = get_object_key(context.pop('parent', None))
+    context.pop('parent_permission_manager', None)
+    if (
+        instance_key is None
+        or parent_key is None
+        or (fingerprint := get_context_fingerprint(context)) is None
+    ):
+        return None
+
+    manager_class = type(manager)
+    return ':'.join(
+        (
+            CACHE_KEY_PREFIX,
+            'result',
+            f'{manager_class.__module__}.{manager_class.__qualname__}',
+            action,
+            user_key,
+            instance_key,
+            parent_key,
+            fingerprint,
+            str(manager.get_cache_version()),
+        )
+    )
+
+
+def get_value_key(value: Any) -> str | None:
+    """Get a part of a cache key for a context value.
+
+    Model instances are represented by their model and primary key, values
+    of `STABLE_REPR_TYPES` by `repr`, and tuples, lists, sets and dicts by
+    keys of their items.
+
+    Args:
+        value: The context value.
+
+    Returns:
+        str | None: The key of the value, or None if the value has no stable
+            representation (like a request, or any object with the default
+            `repr` containing its address) and can't be cached.
+    """
+    if hasattr(value, '_meta'):
+        if (pk := getattr(value, 'pk', None)) is None:
+            return None
+        return f'{value._meta.label_lower}:{pk!r}'  # noqa: SLF001
+    if isinstance(value, STABLE_REPR_TYPES):
+        return repr(value)
+    if isinstance(value, dict):
+        items, ordered = list(value.items()), False
+    elif isinstance(value, list | tuple):
+        items, ordered = value, True
+    elif isinstance(value, set | frozenset):
+        items, ordered = value, False
+    else:
+        return None
+
+    keys = [get_value_key(item) for item in items]
+    if None in keys:
+        return None
+    return '{}[{}]'.format(
+        type(value).__name__,
+        ','.join(keys if ordered else sorted(keys)),
+    )
+
+
+def get_context_fingerprint(context: dict) -> str | None:
+    """Get a fingerprint of a permission manager context.
+
+    Args:
+        context (dict): The context.
+
+    Returns:
+        str | None: The fingerprint, or None if a value of the context has
+            no stable representation, see `get_value_key`.
+    """
+    parts = []
+    for key, value in sorted(context.items()):
+        if (value_key := get_value_key(value)) is None:
+            return None
+        parts.append(f'{key}={value_key}')
+    return hashlib.md5(
+        '&'.join(parts).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+
+
+def get_list_permissions_cache_key(
+    *,
+    view: 'GenericViewSet',
+    manager: 'BasePermissionManager',
+    actions: Iterable[str],
+) -> str | None:
+    """Get a cache key for list permissions of a view.
+
+    The key depends on the view class, the manager class (views can return
+    different managers with `get_permission_manager`), the actions, the
+    user, the context fingerprint and the cache version of the manager.
+
+    Args:
+        view (GenericViewSet): The view.
+        manager (BasePermissionManager): The permission manager of the view.
+        actions (Iterable[str]): The list actions.
+
+    Returns:
+        str | None: The cache key, or None if the context of the manager
+            can't be fingerprinted and the result can't be cached.
+    """
+    user_key = get_object_key(manager.user)
+    if user_key in {None, '-'}:
+        user_key = 'anonymous'
+
+    if (fingerprint := get_context_fingerprint(manager.context)) is None:
+        return None
+
+    view_class = type(view)
+    manager_class = type(manager)
+    get_cache_version = getattr(manager, 'get_cache_version', None)
+    return ':'.join(
+        (
+            CACHE_KEY_PREFIX,
+            'list',
+            f'{view_class.__module__}.{view_class.__qualname__}',
+            f'{manager_class.__module__}.{manager_class.__qualname__}',
+            ','.join(actions),
+            user_key,
+            fingerprint,
+            str(get_cache_version() if get_cache_version else ''),
+        )
+    )
+
+
+def get_count_cache_key(queryset: 'QuerySet') -> str:
+    """Get a cache key for the number of objects of a queryset.
+
+    The key depends on the database and the SQL of the queryset, so
+    querysets filtered by permissions of different users get different keys.
+
+    Args:
+        queryset (QuerySet): The queryset.
+
+    Returns:
+        str: The cache key.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.md5(
+        repr((queryset.db, sql, params)).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f'{CACHE_KEY_PREFIX}:count:{digest}'
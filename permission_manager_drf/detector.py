@@ -0,0 +1,118 @@
+import logging
+import warnings
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from permission_manager_drf import instrumentation, settings
+from permission_manager_drf.exceptions import (
+    NPlusOneQueriesError,
+    NPlusOneQueriesWarning,
+)
+
+
+if TYPE_CHECKING:
+    from permission_manager import BasePermissionManager
+
+    from permission_manager_drf.instrumentation import PermissionEvent
+
+
+logger = logging.getLogger('permission_manager_drf')
+
+
+@dataclass(kw_only=True, frozen=True)
+class RepeatedQuery:
+    """Dataclass describing a query repeated by permission checks.
+
+    Attributes:
+        manager (type[BasePermissionManager]): The permission manager class.
+        action (str): The checked action.
+        sql (str): The SQL of the query with placeholders for parameters.
+        count (int): The number of checks executing the query.
+    """
+
+    manager: type['BasePermissionManager']
+    action: str
+    sql: str
+    count: int
+
+    def __str__(self) -> str:
+        """Get a message about the query.
+
+        Returns:
+            str: The message.
+        """
+        return (
+            f'N+1 queries in {self.manager.__qualname__} for '
+            f"'{self.action}' action, executed {self.count} times: "
+            f'{self.sql}'
+        )
+
+
+def find_repeated_queries(
+    events: Iterable['PermissionEvent'],
+) -> list[RepeatedQuery]:
+    """Find queries executed by more than one check of the same action.
+
+    Args:
+        events (Iterable[PermissionEvent]): The permission checks.
+
+    Returns:
+        list[RepeatedQuery]: The repeated queries.
+    """
+    counter = Counter(
+        (event.manager, event.action, sql)
+        for event in events
+        for sql in set(event.queries)
+    )
+    return [
+        RepeatedQuery(manager=manager, action=action, sql=sql, count=count)
+        for (manager, action, sql), count in counter.items()
+        if count > 1
+    ]
+
+
+def report(repeated: RepeatedQuery, mode: str) -> None:
+    """Report a repeated query.
+
+    Args:
+        repeated (RepeatedQuery): The repeated query.
+        mode (str): 'warn', 'log' or 'raise'.
+
+    Raises:
+        NPlusOneQueriesError: If the mode is 'raise'.
+    """
+    if mode == 'raise':
+        raise NPlusOneQueriesError(str(repeated))
+    if mode == 'log':
+        logger.warning(str(repeated))
+    else:
+        warnings.warn(str(repeated), NPlusOneQueriesWarning, stacklevel=2)
+
+
+@contextmanager
+def detect() -> Iterator[None]:
+    """Detect N+1 queries in permission checks inside the block.
+
+    The block should check permissions for all rows of a list, e.g. a
+    serialization pass. Does nothing if `PERMISSION_MANAGER_DRF_N_PLUS_ONE`
+    setting is None.
+
+    Yields:
+        None
+
+    Raises:
+        NPlusOneQueriesError: If there are repeated queries and the setting
+            is 'raise'.
+    """
+    if not (mode := settings.PERMISSION_MANAGER_DRF_N_PLUS_ONE):
+        yield
+        return
+
+    with instrumentation.trace() as events:
+        yield
+
+    for repeated in find_repeated_queries(events):
+        report(repeated, mode)
@@ -0,0 +1,19 @@
+from permission_manager.exceptions import PermissionManagerError
+
+
+class NPlusOneQueriesError(PermissionManagerError):
+    """Exception for N+1 queries.
+
+    This exception is raised when the same query is executed by a permission
+    check for each row of a list and `PERMISSION_MANAGER_DRF_N_PLUS_ONE`
+    setting is 'raise'.
+    """
+
+
+class NPlusOneQueriesWarning(UserWarning):
+    """Warning for N+1 queries.
+
+    This warning is issued when the same query is executed by a permission
+    check for each row of a list and `PERMISSION_MANAGER_DRF_N_PLUS_ONE`
+    setting is 'warn'.
+    """
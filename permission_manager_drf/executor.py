@@ -0,0 +1,136 @@
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any
+
+from django.core.signals import request_finished, setting_changed
+from django.db import connections
+from rest_framework.permissions import SAFE_METHODS
+
+from permission_manager_drf import settings
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+# Number of finished requests, worker threads check their connections when
+# it's changed since their previous task
+_generation = 0
+_worker = threading.local()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the thread pool for concurrent permission resolution.
+
+    The pool is created on first use, its size is defined by
+    `PERMISSION_MANAGER_DRF_EXECUTOR_MAX_WORKERS` setting.
+
+    Returns:
+        ThreadPoolExecutor: The thread pool.
+    """
+    global _executor  # noqa: PLW0603
+    if _executor is not None:
+        return _executor
+
+    max_workers = settings.PERMISSION_MANAGER_DRF_EXECUTOR_MAX_WORKERS
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix='permission_manager_drf',
+            )
+    return _executor
+
+
+def reset_executor(*, setting: str, **_kwargs) -> None:
+    """Shut down the thread pool when its size is changed.
+
+    A new pool is created on next use.
+
+    Args:
+        setting (str): The changed setting.
+    """
+    global _executor  # noqa: PLW0603
+    if setting != 'PERMISSION_MANAGER_DRF_EXECUTOR_MAX_WORKERS':
+        return
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+setting_changed.connect(
+    reset_executor,
+    dispatch_uid='permission_manager_drf.executor.reset_executor',
+)
+
+
+def count_finished_request(**_kwargs) -> None:
+    """Count a finished request, see `run_task`."""
+    global _generation  # noqa: PLW0603
+    _generation += 1
+
+
+request_finished.connect(
+    count_finished_request,
+    dispatch_uid='permission_manager_drf.executor.count_finished_request',
+)
+
+
+def run_task(fn: Callable[[], Any]) -> Any:
+    """Run a task in a worker thread.
+
+    Database connections of a worker are kept between tasks. After a
+    request is finished, they are closed before the next task if they are
+    unusable or obsolete (see `CONN_MAX_AGE` setting), as Django does for
+    connections of request threads.
+
+    Args:
+        fn (Callable[[], Any]): The task.
+
+    Returns:
+        Any: The result of the task.
+    """
+    if getattr(_worker, 'generation', None) != _generation:
+        _worker.generation = _generation
+        for connection in connections.all(initialized_only=True):
+            connection.close_if_unusable_or_obsolete()
+    return fn()
+
+
+def can_submit(request: Any) -> bool:
+    """Check if tasks of a request can run in worker threads.
+
+    Worker threads use their own database connections, so they don't see
+    changes of the request which aren't committed yet.
+
+    Args:
+        request: The request being made, or None.
+
+    Returns:
+        bool: False for unsafe methods or inside an atomic block (e.g. with
+            `ATOMIC_REQUESTS`), True otherwise.
+    """
+    if getattr(request, 'method', None) not in {None, *SAFE_METHODS}:
+        return False
+    return not any(
+        connection.in_atomic_block
+        for connection in connections.all(initialized_only=True)
+    )
+
+
+def submit(fn: Callable[[], Any]) -> Future:
+    """Submit a task to the thread pool.
+
+    The task runs in a copy of the current context, so context variables
+    (e.g. the metrics source) are available in the worker thread.
+
+    Args:
+        fn (Callable[[], Any]): The task.
+
+    Returns:
+        Future: The future of the task result.
+    """
+    return get_executor().submit(copy_context().run, run_task, fn)
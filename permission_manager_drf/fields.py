@@ -1,12 +1,31 @@
-from collections.abc import Iterable
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, NamedTuple
 
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import QuerySet
+from django.db.models.manager import BaseManager
 from permission_manager import BasePermissionManager
 from permission_manager.types import ResolveWithMessageResult
+from rest_framework.exceptions import ValidationError
 from rest_framework.fields import Field, SkipField
+from rest_framework.serializers import ListSerializer
 
-from permission_manager_drf.utils import get_permission_manager
+from permission_manager_drf import detector, instrumentation
+from permission_manager_drf.executor import can_submit, submit
+from permission_manager_drf.utils import (
+    aresolve,
+    get_batch_context,
+    get_child_permission_manager,
+    get_permission_manager,
+    get_permission_managers,
+)
+
+
+# Query parameter value selecting no actions and children
+NONE_SELECTION = 'none'
 
 
 @dataclass(kw_only=True)
@@ -25,6 +44,47 @@ class PermissionFieldChild:
     manager: type[BasePermissionManager]
     actions: Iterable[str]
 
+    def __post_init__(self) -> None:
+        """Validate the actions against the action table of the manager.
+
+        So invalid actions fail when the serializer is defined, not when it's
+        used.
+
+        Raises:
+            ValueError: If the manager doesn't have an action.
+        """
+        self.actions = tuple(self.actions)
+        if get_action_index := getattr(self.manager, 'get_action_index', None):
+            for action in self.actions:
+                get_action_index(action)
+
+
+@dataclass
+class PermissionBitmask:
+    """Dataclass describing bitmasks of a PermissionField in a response.
+
+    Attributes:
+        actions (tuple[str, ...]): The actions (and child actions as
+            'child_name.action') in order of bits.
+        messages (dict[str, dict[str, list[str]]]): The messages of denied
+            actions keyed by instance primary key and action.
+    """
+
+    actions: tuple[str, ...]
+    messages: dict[str, dict[str, list[str]]] = field(default_factory=dict)
+
+
+class PermissionSelection(NamedTuple):
+    """Actions and children of a PermissionField selected by a client.
+
+    Attributes:
+        actions (tuple[str, ...]): The actions.
+        children (tuple[PermissionFieldChild, ...]): The children.
+    """
+
+    actions: tuple[str, ...]
+    children: tuple[PermissionFieldChild, ...]
+
 
 class PermissionField(Field):
     """DRF field for representing permissions.
@@ -38,14 +98,23 @@ class PermissionField(Field):
             Defaults to None.
         with_messages (bool): Whether to include messages in the permission
             result. Defaults to True.
+        concurrent (bool): Whether to resolve actions and children
+            concurrently in a thread pool. Defaults to False.
+        query_param (str | None): The query parameter selecting actions and
+            children to resolve. Defaults to None (all of them).
+        bitmask (bool): Whether to represent permissions as an integer
+            bitmask. Defaults to False.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         actions: Iterable[str],
         children: Iterable[PermissionFieldChild] | None = None,
         with_messages: bool = True,
+        concurrent: bool = False,
+        query_param: str | None = None,
+        bitmask: bool = False,
         **kwargs,
     ) -> None:
         """Initialize the PermissionField.
@@ -56,11 +125,27 @@ class PermissionField(Field):
                 permissions. Defaults to None.
             with_messages (bool): Whether to include messages in the permission
                 result. Defaults to True.
+            concurrent (bool): Whether to resolve actions and children
+                concurrently in a thread pool, see
+                `PERMISSION_MANAGER_DRF_EXECUTOR_MAX_WORKERS` setting.
+                Defaults to False.
+            query_param (str | None): The query parameter with comma
+                separated actions and child names to resolve, or 'none'.
+                Defaults to None (all of them are always resolved).
+            bitmask (bool): Whether to represent permissions as an integer,
+                where each bit is an action (see `get_bitmask_actions`). The
+                actions and messages of denied actions are stored in
+                `request.permission_bitmasks` for the pagination mixin, so
+                the field can be serialized only in lists paginated by
+                `PermissionManagerPaginationMixin`. Defaults to False.
             **kwargs: Additional keyword arguments for the field.
         """
         self.actions = actions
         self.children = children or ()
         self.with_messages = with_messages
+        self.concurrent = concurrent
+        self.query_param = query_param
+        self.bitmask = bitmask
 
         kwargs['read_only'] = True
         kwargs['source'] = '*'
@@ -85,34 +170,474 @@ class PermissionField(Field):
     def to_representation(
         self,
         value: Any,
-    ) -> dict[str, bool] | dict[str, ResolveWithMessageResult]:
+    ) -> dict[str, bool] | dict[str, ResolveWithMessageResult] | int:
         """Convert the field value to a dictionary representation.
 
         This method resolves the permissions for the specified actions and
-        includes the results from any child permission fields.
+        includes the results from any child permission fields. If the field
+        is a part of a list serializer, the permissions of the whole list are
+        resolved in one pass on the first call.
+
+        Args:
+            value: The instance.
+
+        Returns:
+            dict | int: The dictionary representation of the permissions, or
+                the bitmask in bitmask mode.
+        """
+        if not any(self.get_selection()):
+            return self.format_permissions(value, {})
+
+        with instrumentation.source('field'):
+            if (batch := self.get_batch_results()) and id(value) in batch:
+                return self.format_permissions(value, batch[id(value)])
+
+            view = self.context['view']
+            manager = get_permission_manager(
+                view=view,
+                instance=value,
+                cache=True,
+            )
+            return self.format_permissions(
+                value,
+                self.resolve(view=view, manager=manager, value=value),
+            )
+
+    def format_permissions(
+        self,
+        value: Any,
+        permissions: dict,
+    ) -> dict[str, bool] | dict[str, ResolveWithMessageResult] | int:
+        """Format resolved permissions of the instance for the output.
+
+        Args:
+            value: The instance.
+            permissions (dict): The resolved permissions.
+
+        Returns:
+            dict | int: The permissions, or the bitmask in bitmask mode.
+        """
+        if not self.bitmask:
+            return permissions
+
+        info = self.get_bitmask_info()
+        bitmask = 0
+        messages = {}
+        for bit, name in enumerate(info.actions):
+            child_name, _, child_action = name.partition('.')
+            result = (
+                permissions[child_name][child_action]
+                if child_action
+                else permissions[name]
+            )
+            if isinstance(result, dict):
+                allow, result_messages = result['allow'], result['messages']
+            else:
+                allow, result_messages = result, None
+
+            if allow:
+                bitmask |= 1 << bit
+            elif result_messages:
+                messages[name] = result_messages
+
+        if messages:
+            info.messages[str(getattr(value, 'pk', None))] = messages
+        return bitmask
+
+    def get_bitmask_actions(self) -> tuple[str, ...]:
+        """Get actions in order of bits of the bitmask.
+
+        Returns:
+            tuple[str, ...]: The selected actions, then the actions of the
+                selected children as 'child_name.action'.
+        """
+        actions, children = self.get_selection()
+        return (
+            *actions,
+            *(
+                f'{child.name}.{action}'
+                for child in children
+                for action in child.actions
+            ),
+        )
+
+    def get_bitmask_info(self) -> PermissionBitmask:
+        """Get the bitmask description of the field in the current response.
+
+        It's stored in `request.permission_bitmasks` keyed by field name. The
+        storage is started by `PermissionManagerPaginationMixin` for a page,
+        which lists actions and messages of bitmasks in the response.
+
+        Returns:
+            PermissionBitmask: The bitmask description.
+
+        Raises:
+            ImproperlyConfigured: If the field isn't serialized in a page of
+                `PermissionManagerPaginationMixin`, since bare integers
+                can't be decoded without the actions.
+        """
+        try:
+            bitmasks = self.context['view'].request.permission_bitmasks
+        except AttributeError:
+            msg = (
+                f'PermissionField "{self.field_name}" with bitmask=True can '
+                'be used only in lists paginated by '
+                'PermissionManagerPaginationMixin.'
+            )
+            raise ImproperlyConfigured(msg) from None
+
+        if (info := bitmasks.get(self.field_name)) is None:
+            info = bitmasks[self.field_name] = PermissionBitmask(
+                actions=self.get_bitmask_actions()
+            )
+        return info
+
+    def resolve(
+        self,
+        *,
+        view: Any,
+        manager: BasePermissionManager,
+        value: Any,
+        children_context: dict | None = None,
+    ) -> dict[str, bool] | dict[str, ResolveWithMessageResult]:
+        """Resolve the permissions of the instance and its children.
 
         Args:
+            view: The view from the serializer context.
+            manager (BasePermissionManager): The permission manager of the
+                instance.
             value: The instance.
+            children_context (dict | None): Additional context for each child
+                manager, keyed by child name. Defaults to None.
 
         Returns:
             dict: The dictionary representation of the permissions.
         """
+        tasks = self.get_tasks(
+            view=view,
+            manager=manager,
+            value=value,
+            children_context=children_context,
+        )
+        return self.run_tasks([tasks])[0]
+
+    def get_tasks(
+        self,
+        *,
+        view: Any,
+        manager: BasePermissionManager,
+        value: Any,
+        children_context: dict | None = None,
+    ) -> list[tuple[str | None, Callable[[], dict]]]:
+        """Get independent tasks resolving the permissions of the instance.
+
+        In concurrent mode, each action is a separate task. Each child is
+        always a separate task.
+
+        Args:
+            view: The view from the serializer context.
+            manager (BasePermissionManager): The permission manager of the
+                instance.
+            value: The instance.
+            children_context (dict | None): Additional context for each child
+                manager, keyed by child name. Defaults to None.
+
+        Returns:
+            list[tuple[str | None, Callable[[], dict]]]: The tasks with child
+                names, or None for tasks of the actions.
+        """
+        children_context = children_context or {}
+        actions, children = self.get_selection()
+        action_groups = (
+            [(action,) for action in actions] if self.concurrent else [actions]
+        )
+        tasks = [
+            (
+                None,
+                partial(
+                    manager.resolve,
+                    actions=actions,
+                    with_messages=self.with_messages,
+                ),
+            )
+            for actions in action_groups
+            if actions
+        ]
+
+        for child in children:
+            child_manager = get_child_permission_manager(
+                view=view,
+                manager_class=child.manager,
+                parent=value,
+                parent_permission_manager=manager,
+                **children_context.get(child.name, {}),
+            )
+            tasks.append(
+                (
+                    child.name,
+                    partial(
+                        child_manager.resolve,
+                        actions=child.actions,
+                        with_messages=self.with_messages,
+                    ),
+                )
+            )
+
+        return tasks
+
+    def run_tasks(
+        self,
+        tasks_list: list[list[tuple[str | None, Callable[[], dict]]]],
+    ) -> list[dict]:
+        """Run tasks of instances and assemble their results.
+
+        In concurrent mode, all tasks are submitted to the thread pool at
+        once, unless the request is unsafe or runs in an atomic block (see
+        `can_submit`). The results are assembled in the same order as the
+        tasks.
+
+        Args:
+            tasks_list (list[list[tuple[str | None, Callable[[], dict]]]]):
+                The tasks of each instance.
+
+        Returns:
+            list[dict]: The permissions of each instance.
+        """
+        if self.concurrent and can_submit(
+            getattr(self.context.get('view'), 'request', None)
+        ):
+            results_list = [
+                [(name, submit(task)) for name, task in tasks]
+                for tasks in tasks_list
+            ]
+            results_list = [
+                [(name, future.result()) for name, future in results]
+                for results in results_list
+            ]
+        else:
+            results_list = [
+                [(name, task()) for name, task in tasks]
+                for tasks in tasks_list
+            ]
+
+        permissions_list = []
+        for results in results_list:
+            permissions = {}
+            for name, result in results:
+                if name is None:
+                    permissions.update(result)
+                else:
+                    permissions[name] = result
+            permissions_list.append(permissions)
+        return permissions_list
+
+    async def ato_representation(
+        self,
+        value: Any,
+    ) -> dict[str, bool] | dict[str, ResolveWithMessageResult] | int:
+        """Convert the field value to a dictionary representation in async.
+
+        It's used by async serializers (e.g. adrf). The actions and the
+        children are resolved concurrently.
+
+        Args:
+            value: The instance.
+
+        Returns:
+            dict | int: The dictionary representation of the permissions, or
+                the bitmask in bitmask mode.
+        """
+        if not any(self.get_selection()):
+            return self.format_permissions(value, {})
+
         view = self.context['view']
         manager = get_permission_manager(
             view=view,
             instance=value,
             cache=True,
         )
-        result = manager.resolve(
-            actions=self.actions, with_messages=self.with_messages
+        with instrumentation.source('field'):
+            return self.format_permissions(
+                value,
+                await self.aresolve(view=view, manager=manager, value=value),
+            )
+
+    async def aresolve(
+        self,
+        *,
+        view: Any,
+        manager: BasePermissionManager,
+        value: Any,
+    ) -> dict[str, bool] | dict[str, ResolveWithMessageResult]:
+        """Resolve the permissions of the instance and its children in async.
+
+        Args:
+            view: The view from the serializer context.
+            manager (BasePermissionManager): The permission manager of the
+                instance.
+            value: The instance.
+
+        Returns:
+            dict: The dictionary representation of the permissions.
+        """
+        actions, children = self.get_selection()
+        result, *children_results = await asyncio.gather(
+            aresolve(
+                manager,
+                actions=actions,
+                with_messages=self.with_messages,
+            ),
+            *(
+                aresolve(
+                    get_child_permission_manager(
+                        view=view,
+                        manager_class=child.manager,
+                        parent=value,
+                        parent_permission_manager=manager,
+                    ),
+                    actions=child.actions,
+                    with_messages=self.with_messages,
+                )
+                for child in children
+            ),
         )
 
-        for child in self.children:
-            result[child.name] = child.manager(
-                user=view.request.user,
-                parent=value,
-                parent_permission_manager=manager,
+        for child, child_result in zip(
+            children, children_results, strict=True
+        ):
+            result[child.name] = child_result
+        return result
+
+    def get_selection(self) -> PermissionSelection:
+        """Get actions and children to resolve.
+
+        If the field has `query_param`, they are selected by the client with
+        comma separated names in the query parameter, or 'none' for nothing.
+        All of them are selected without the parameter.
+
+        Returns:
+            PermissionSelection: The selected actions and children.
+
+        Raises:
+            ValidationError: If the parameter contains unknown names.
+        """
+        request = self.context.get('request')
+        if (
+            getattr(self, '_selection_request', None) is request
+            and (selection := getattr(self, '_selection', None)) is not None
+        ):
+            return selection
+
+        selection = PermissionSelection(
+            actions=tuple(self.actions),
+            children=tuple(self.children),
+        )
+        query_params = getattr(
+            request, 'query_params', getattr(request, 'GET', {})
+        )
+        if self.query_param and self.query_param in query_params:
+            value = query_params[self.query_param]
+            names = {
+                name.strip() for name in value.split(',') if name.strip()
+            } - {NONE_SELECTION}
+            allowed = {
+                *selection.actions,
+                *(child.name for child in selection.children),
+            }
+            if unknown := names - allowed:
+                msg = (
+                    f'Unknown permissions: {", ".join(sorted(unknown))}. '
+                    f'Allowed: {", ".join(sorted(allowed))}.'
+                )
+                raise ValidationError({self.query_param: [msg]})
+            selection = PermissionSelection(
+                actions=tuple(
+                    action for action in selection.actions if action in names
+                ),
+                children=tuple(
+                    child
+                    for child in selection.children
+                    if child.name in names
+                ),
+            )
+
+        self._selection_request = request
+        self._selection = selection
+        return selection
+
+    def get_batch_instances(self) -> Sequence[Any] | None:
+        """Get the instances of the list serializer the field belongs to.
+
+        Returns:
+            Sequence[Any] | None: The instances, or None if the field isn't a
+                part of a top-level list serializer.
+        """
+        list_serializer = getattr(self.parent, 'parent', None)
+        if not isinstance(list_serializer, ListSerializer):
+            return None
+
+        instances = list_serializer.instance
+        if instances is None or isinstance(instances, BaseManager):
+            return None
+        if isinstance(instances, QuerySet):
+            # Fill the result cache, the list serializer iterates over it
+            # and gets the same objects
+            len(instances)
+            return instances
+        return instances if isinstance(instances, Sequence) else None
+
+    def get_batch_results(self) -> dict[int, dict] | None:
+        """Resolve permissions for all instances of the list serializer.
+
+        The permission managers of the page are built at once, so they share
+        the view context and the batch context of their manager classes. The
+        results are computed once per list and keyed by instance id. Queries
+        repeated for the rows are reported, see
+        `PERMISSION_MANAGER_DRF_N_PLUS_ONE` setting.
+
+        Returns:
+            dict[int, dict] | None: The results keyed by instance id, or None
+                if the field isn't a part of a top-level list serializer.
+        """
+        instances = self.get_batch_instances()
+        if instances is None:
+            return None
+
+        if getattr(self, '_batch_instances', None) is not instances:
+            view = self.context['view']
+            managers = get_permission_managers(
+                view=view,
+                instances=instances,
                 cache=True,
-            ).resolve(actions=child.actions, with_messages=self.with_messages)
+            )
+            children_context = {
+                child.name: get_batch_context(
+                    child.manager,
+                    user=view.request.user,
+                    instances=instances,
+                )
+                for child in self.get_selection().children
+            }
+            with detector.detect():
+                permissions_list = self.run_tasks(
+                    [
+                        self.get_tasks(
+                            view=view,
+                            manager=manager,
+                            value=instance,
+                            children_context=children_context,
+                        )
+                        for instance, manager in zip(
+                            instances, managers, strict=True
+                        )
+                    ]
+                )
+            self._batch_results = {
+                id(instance): permissions
+                for instance, permissions in zip(
+                    instances, permissions_list, strict=True
+                )
+            }
+            self._batch_instances = instances
 
-        return result
+        return self._batch_results
@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING, ClassVar
+
+from rest_framework.filters import BaseFilterBackend
+
+from permission_manager_drf.utils import get_permission_manager
+
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from rest_framework.request import Request
+    from rest_framework.viewsets import GenericViewSet
+
+
+class ManagerFilterBackend(BaseFilterBackend):
+    """DRF filter backend for a permission manager.
+
+    This backend filters the queryset of a view using the queryset filter of
+    the permission manager, so the database returns only the rows the user
+    has permission for.
+
+    Attributes:
+        default_action (ClassVar[str]): The action to filter the queryset for
+            if the view doesn't define `permission_manager_filter_action`.
+    """
+
+    default_action: ClassVar[str] = 'view'
+
+    def get_action(self, view: 'GenericViewSet') -> str:
+        """Get the action to filter the queryset for.
+
+        Args:
+            view (GenericViewSet): The view being accessed.
+
+        Returns:
+            str: The `permission_manager_filter_action` attribute of the view,
+                or the default action.
+        """
+        return getattr(
+            view, 'permission_manager_filter_action', self.default_action
+        )
+
+    def filter_queryset(
+        self,
+        request: 'Request',
+        queryset: 'QuerySet',
+        view: 'GenericViewSet',
+    ) -> 'QuerySet':
+        """Filter the queryset using the permission manager.
+
+        Args:
+            request (Request): The request being made.
+            queryset (QuerySet): The queryset to filter.
+            view (GenericViewSet): The view being accessed.
+
+        Returns:
+            QuerySet: The filtered queryset. If the permission manager doesn't
+                support queryset filtering, the queryset is returned as is.
+        """
+        manager = get_permission_manager(view=view)
+        if filter_queryset := getattr(manager, 'filter_queryset', None):
+            return filter_queryset(queryset, self.get_action(view))
+        return queryset
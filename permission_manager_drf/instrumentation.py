@@ -0,0 +1,465 @@
+import inspect
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from django.core.signals import setting_changed
+from django.db import connections
+from django.dispatch import Signal
+from django.utils.module_loading import import_string
+
+from permission_manager_drf import settings
+
+
+if TYPE_CHECKING:
+    from permission_manager import BasePermissionManager
+
+
+# Sent for each permission check if `send_signal` sink is enabled
+permission_checked = Signal()
+
+# Where the current permission checks come from
+_source: ContextVar[str | None] = ContextVar(
+    'permission_manager_drf_source', default=None
+)
+
+# Lists collecting permission checks of active (nested) traces, see `trace`
+_trace: ContextVar[tuple[list['PermissionEvent'], ...]] = ContextVar(
+    'permission_manager_drf_trace', default=()
+)
+
+# The measurement of the innermost active permission check, see `measure`
+_measurement: ContextVar['Measurement | None'] = ContextVar(
+    'permission_manager_drf_measurement', default=None
+)
+
+_sinks: list[Callable[['PermissionEvent'], Any]] | None = None
+_sinks_lock = threading.Lock()
+
+
+@dataclass(kw_only=True, frozen=True)
+class PermissionEvent:
+    """Dataclass describing a permission check.
+
+    Attributes:
+        manager (type[BasePermissionManager]): The permission manager class.
+        action (str): The checked action.
+        instance (Any): The checked instance.
+        duration (float): The duration of the check in seconds.
+        self_duration (float): The duration of the check without nested
+            checks (e.g. of a parent manager the check delegates to), which
+            are recorded by themselves.
+        allowed (bool): Whether the permission is granted.
+        cached (bool): Whether the result was taken from a cache.
+        source (str | None): Where the check comes from: 'permission' for
+            `ManagerPermission`, 'field' for `PermissionField`,
+            'list_permissions' for `get_list_permissions`, or None.
+        queries (tuple[str, ...]): SQL of queries executed by the check
+            itself, without nested checks. Collected only while tracing.
+    """
+
+    manager: type['BasePermissionManager']
+    action: str
+    instance: Any
+    duration: float
+    self_duration: float
+    allowed: bool
+    cached: bool
+    source: str | None
+    queries: tuple[str, ...] = ()
+
+    @property
+    def instance_pk(self) -> Any:
+        """Get the primary key of the checked instance.
+
+        Returns:
+            Any: The primary key, or None.
+        """
+        return getattr(self.instance, 'pk', None)
+
+
+@dataclass
+class Measurement:
+    """Dataclass for the duration and queries of a permission check.
+
+    Attributes:
+        duration (float): The duration in seconds.
+        nested_duration (float): The duration of nested checks in seconds.
+        queries (list[str]): SQL of queries executed by the check itself.
+            Collected only while tracing.
+    """
+
+    duration: float = 0.0
+    nested_duration: float = 0.0
+    queries: list[str] = field(default_factory=list)
+
+    @property
+    def self_duration(self) -> float:
+        """Get the duration without nested checks.
+
+        Returns:
+            float: The duration in seconds.
+        """
+        # Nested checks in worker threads can overlap
+        return max(self.duration - self.nested_duration, 0.0)
+
+
+@dataclass
+class MetricsEntry:
+    """Dataclass for aggregated metrics of a manager action.
+
+    Attributes:
+        count (int): The number of checks.
+        allowed (int): The number of granted checks.
+        denied (int): The number of denied checks.
+        cache_hits (int): The number of checks with cached results.
+        total_duration (float): The total duration of checks in seconds.
+        max_duration (float): The maximum duration of a check in seconds.
+    """
+
+    count: int = 0
+    allowed: int = 0
+    denied: int = 0
+    cache_hits: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Get the ratio of checks with cached results.
+
+        Returns:
+            float: The ratio, or 0.0 if there were no checks.
+        """
+        return self.cache_hits / self.count if self.count else 0.0
+
+
+@dataclass
+class InMemoryMetricsSink:
+    """In-process metrics registry.
+
+    It aggregates permission checks by manager class, action and source.
+
+    Attributes:
+        entries (dict[tuple, MetricsEntry]): The metrics keyed by manager
+            class, action and source.
+    """
+
+    entries: dict[tuple, MetricsEntry] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __call__(self, event: PermissionEvent) -> None:
+        """Record a permission check.
+
+        Args:
+            event (PermissionEvent): The permission check.
+        """
+        key = (event.manager, event.action, event.source)
+        with self.lock:
+            entry = self.entries.setdefault(key, MetricsEntry())
+            entry.count += 1
+            entry.allowed += event.allowed
+            entry.denied += not event.allowed
+            entry.cache_hits += event.cached
+            entry.total_duration += event.duration
+            entry.max_duration = max(entry.max_duration, event.duration)
+
+    def get(
+        self,
+        manager: type['BasePermissionManager'],
+        action: str,
+    ) -> MetricsEntry:
+        """Get metrics of a manager action from all sources.
+
+        Args:
+            manager (type[BasePermissionManager]): The permission manager
+                class.
+            action (str): The action.
+
+        Returns:
+            MetricsEntry: The aggregated metrics.
+        """
+        result = MetricsEntry()
+        with self.lock:
+            for (
+                entry_manager,
+                entry_action,
+                _,
+            ), entry in self.entries.items():
+                if entry_manager is manager and entry_action == action:
+                    result.count += entry.count
+                    result.allowed += entry.allowed
+                    result.denied += entry.denied
+                    result.cache_hits += entry.cache_hits
+                    result.total_duration += entry.total_duration
+                    result.max_duration = max(
+                        result.max_duration, entry.max_duration
+                    )
+        return result
+
+    def clear(self) -> None:
+        """Remove all metrics."""
+        with self.lock:
+            self.entries.clear()
+
+
+def send_signal(event: PermissionEvent) -> None:
+    """Send the `permission_checked` signal for a permission check.
+
+    Args:
+        event (PermissionEvent): The permission check.
+    """
+    permission_checked.send(sender=event.manager, event=event)
+
+
+def get_sinks() -> list[Callable[[PermissionEvent], Any]]:
+    """Get metrics sinks.
+
+    Sinks from `PERMISSION_MANAGER_DRF_METRICS_SINKS` setting are imported
+    on first use.
+
+    Returns:
+        list[Callable[[PermissionEvent], Any]]: The sinks.
+    """
+    global _sinks  # noqa: PLW0603
+    if _sinks is None:
+        with _sinks_lock:
+            if _sinks is None:
+                _sinks = [
+                    import_string(sink) if isinstance(sink, str) else sink
+                    for sink in settings.PERMISSION_MANAGER_DRF_METRICS_SINKS
+                ]
+    return _sinks
+
+
+def reset_sinks(*, setting: str, **_kwargs) -> None:
+    """Forget sinks when `PERMISSION_MANAGER_DRF_METRICS_SINKS` is changed.
+
+    Sinks are imported again on next use, sinks added at runtime are
+    dropped.
+
+    Args:
+        setting (str): The changed setting.
+    """
+    global _sinks  # noqa: PLW0603
+    if setting == 'PERMISSION_MANAGER_DRF_METRICS_SINKS':
+        with _sinks_lock:
+            _sinks = None
+
+
+setting_changed.connect(
+    reset_sinks,
+    dispatch_uid='permission_manager_drf.instrumentation.reset_sinks',
+)
+
+
+def add_sink(sink: Callable[[PermissionEvent], Any]) -> None:
+    """Add a metrics sink.
+
+    Args:
+        sink (Callable[[PermissionEvent], Any]): A callable getting a
+            `PermissionEvent`.
+    """
+    get_sinks().append(sink)
+
+
+def remove_sink(sink: Callable[[PermissionEvent], Any]) -> None:
+    """Remove a metrics sink.
+
+    Args:
+        sink (Callable[[PermissionEvent], Any]): The sink.
+    """
+    get_sinks().remove(sink)
+
+
+def is_enabled() -> bool:
+    """Check if permission checks should be recorded.
+
+    Returns:
+        bool: True if there are any sinks or a trace is active.
+    """
+    return bool(_trace.get()) or bool(get_sinks())
+
+
+def record(
+    *,
+    manager: 'BasePermissionManager',
+    action: str,
+    result: Any,
+    cached: bool,
+    measurement: Measurement,
+) -> None:
+    """Record a permission check in all sinks and the active trace.
+
+    Args:
+        manager (BasePermissionManager): The permission manager.
+        action (str): The checked action.
+        result: The permission result.
+        cached (bool): Whether the result was taken from a cache.
+        measurement (Measurement): The measurement of the check, see
+            `measure`.
+    """
+    event = PermissionEvent(
+        manager=type(manager),
+        action=action,
+        instance=manager.instance,
+        duration=measurement.duration,
+        self_duration=measurement.self_duration,
+        allowed=bool(result),
+        cached=cached,
+        source=_source.get(),
+        queries=tuple(measurement.queries),
+    )
+    for events in _trace.get():
+        events.append(event)
+    for sink in get_sinks():
+        sink(event)
+
+
+def instrument(manager: 'BasePermissionManager') -> 'BasePermissionManager':
+    """Record permission checks of a manager if recording is enabled.
+
+    `DRFPermissionManager` records its checks itself, other managers (e.g.
+    a plain `PermissionManager`) get a recording `has_permission`, so
+    checks of all managers built by the package are recorded.
+
+    Args:
+        manager (BasePermissionManager): The permission manager.
+
+    Returns:
+        BasePermissionManager: The same permission manager.
+    """
+    if getattr(manager, 'records_checks', False) or not is_enabled():
+        return manager
+
+    has_permission = manager.has_permission
+
+    def is_cached(action: str) -> bool:
+        permission_fn = manager._get_action(action)  # noqa: SLF001
+        return manager.cache and permission_fn.__name__ in manager._cache  # noqa: SLF001
+
+    if inspect.iscoroutinefunction(has_permission):
+
+        async def recording_has_permission(action: str) -> Any:
+            cached = is_cached(action)
+            with measure() as measurement:
+                result = await has_permission(action)
+            record(
+                manager=manager,
+                action=action,
+                result=result,
+                cached=cached,
+                measurement=measurement,
+            )
+            return result
+
+    else:
+
+        def recording_has_permission(action: str) -> Any:
+            cached = is_cached(action)
+            with measure() as measurement:
+                result = has_permission(action)
+            record(
+                manager=manager,
+                action=action,
+                result=result,
+                cached=cached,
+                measurement=measurement,
+            )
+            return result
+
+    manager.has_permission = recording_has_permission
+    return manager
+
+
+@contextmanager
+def source(name: str) -> Iterator[None]:
+    """Mark permission checks inside the block as coming from a source.
+
+    Args:
+        name (str): The source name.
+
+    Yields:
+        None
+    """
+    token = _source.set(name)
+    try:
+        yield
+    finally:
+        _source.reset(token)
+
+
+@contextmanager
+def trace() -> Iterator[list[PermissionEvent]]:
+    """Collect permission checks inside the block.
+
+    Traces can be nested, outer traces get the checks too.
+
+    Yields:
+        list[PermissionEvent]: The list getting the permission checks.
+    """
+    events = []
+    token = _trace.set((*_trace.get(), events))
+    try:
+        yield events
+    finally:
+        _trace.reset(token)
+
+
+@contextmanager
+def measure() -> Iterator[Measurement]:
+    """Measure a permission check inside the block.
+
+    Checks can be nested, e.g. a child manager delegating to its parent.
+    The duration of a nested check is added to `nested_duration` of the
+    enclosing one, and queries are collected only by the innermost check,
+    so every query and every second is counted once.
+
+    Yields:
+        Measurement: The measurement, filled when the block exits.
+    """
+    parent = _measurement.get()
+    measurement = Measurement()
+    token = _measurement.set(measurement)
+    start = time.perf_counter()
+    try:
+        with capture_queries() as queries:
+            measurement.queries = queries
+            yield measurement
+    finally:
+        measurement.duration = time.perf_counter() - start
+        _measurement.reset(token)
+        if parent is not None:
+            parent.nested_duration += measurement.duration
+
+
+@contextmanager
+def capture_queries() -> Iterator[list[str]]:
+    """Collect SQL of queries executed inside the block while tracing.
+
+    Queries of permission checks measured inside the block are collected
+    by their measurements, see `measure`.
+
+    Yields:
+        list[str]: The list getting the SQL, stays empty without a trace.
+    """
+    queries = []
+    if not _trace.get():
+        yield queries
+        return
+
+    owner = _measurement.get()
+
+    def wrapper(execute, sql, params, many, context):  # noqa: ANN202
+        if _measurement.get() is owner:
+            queries.append(sql)
+        return execute(sql, params, many, context)
+
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(wrapper))
+        yield queries
@@ -1,6 +1,39 @@
-from permission_manager import PermissionManager
+import asyncio
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from contextlib import suppress
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from asgiref.sync import sync_to_async
+from permission_manager import AsyncPermissionManager, PermissionManager
 from permission_manager.decorators import alias
 from permission_manager.manager import BasePermissionMeta
+from permission_manager.utils import get_result_value
+
+from permission_manager_drf import instrumentation
+from permission_manager_drf.cache import (
+    MISSING,
+    get_result_cache,
+    get_result_cache_key,
+)
+from permission_manager_drf.versions import (
+    CacheDependency,
+    get_versions,
+    register_cache_dependencies,
+)
+
+
+if TYPE_CHECKING:
+    from django.db.models import Q, QuerySet
+    from permission_manager import BasePermissionManager, PermissionResult
+    from permission_manager.types import ResolveWithMessageResult
 
 
 class DRFAliasMeta(type):
@@ -23,10 +56,14 @@ class DRFAliasMeta(type):
     def decorate(cls) -> None:
         """Decorate permission methods with DRF action aliases.
 
-        This method adds aliases for 'retrieve' to `has_view_permission` and
-        for 'destroy' to `has_delete_permission`.
+        This method adds aliases for 'retrieve' to `has_view_permission`,
+        for 'partial_update' to `has_update_permission` and for 'destroy' to
+        `has_delete_permission`.
         """
         cls.has_view_permission = alias('retrieve')(cls.has_view_permission)
+        cls.has_update_permission = alias('partial_update')(
+            cls.has_update_permission
+        )
         cls.has_delete_permission = alias('destroy')(cls.has_delete_permission)
 
 
@@ -35,11 +72,336 @@ class DRFPermissionManagerMeta(BasePermissionMeta, DRFAliasMeta):
 
     This metaclass inherits functionality from both BasePermissionMeta and
     DRFAliasMeta to provide a comprehensive metaclass for DRF permission
-    management.
+    management. It also builds the action table and connects signal
+    receivers for cache dependencies.
+    """
+
+    def __new__(cls, *args, **kwargs) -> type:
+        """Create a new class and register its cache dependencies.
+
+        Returns:
+            type: The newly created class.
+        """
+        new_cls = super().__new__(cls, *args, **kwargs)
+        new_cls.build_action_table()
+        register_cache_dependencies(new_cls)
+        return new_cls
+
+    def build_action_table(cls) -> None:
+        """Build the frozen table of actions.
+
+        `_action_table` maps each action name and alias to an index of
+        `_action_slots` (permission methods) and `_action_names` (action
+        names), so an action is dispatched with a dict lookup and a tuple
+        index.
+        """
+        indexes = {}
+        table = {}
+        for index, (action_name, permission_fn) in enumerate(
+            cls._actions.items()
+        ):
+            indexes[permission_fn] = table[action_name] = index
+        for alias_name, permission_fn in cls._aliases.items():
+            table.setdefault(alias_name, indexes[permission_fn])
+
+        cls._action_table = MappingProxyType(table)
+        cls._action_slots = tuple(cls._actions.values())
+        cls._action_names = tuple(cls._actions)
+
+
+class DRFPermissionMixin:
+    """Mixin class with DRF functionality for permission managers.
+
+    Attributes:
+        cache_timeouts (ClassVar[dict[str, int]]): Timeouts in seconds for
+            caching permission results across requests, keyed by action
+            name. Results of actions that aren't listed aren't cached.
+        cache_dependencies (ClassVar[Iterable[CacheDependency]]): Models the
+            cached permission results depend on. Changes of their objects
+            make cached results stale.
+        select_related (ClassVar[Mapping[str, Iterable[str]] | Iterable[str]]):
+            Relations read by permission checks, keyed by action name (or
+            for all actions), to be joined with `select_related`.
+        prefetch_related (
+            ClassVar[Mapping[str, Iterable[str]] | Iterable[str]]
+        ): Relations read by permission checks, keyed by action name (or
+            for all actions), to be fetched with `prefetch_related`.
+        only (ClassVar[Mapping[str, Iterable[str]] | Iterable[str]]): Model
+            fields read by permission checks, keyed by action name (or for
+            all actions), to be loaded when the queryset is narrowed with
+            `only`.
+        records_checks (ClassVar[bool]): Whether `has_permission` records
+            checks itself, so `instrumentation.instrument` leaves the manager
+            as is.
     """
 
+    cache_timeouts: ClassVar[dict[str, int]] = {}
+    cache_dependencies: ClassVar[Iterable[CacheDependency]] = ()
+    select_related: ClassVar[Mapping[str, Iterable[str]] | Iterable[str]] = {}
+    prefetch_related: ClassVar[
+        Mapping[str, Iterable[str]] | Iterable[str]
+    ] = {}
+    only: ClassVar[Mapping[str, Iterable[str]] | Iterable[str]] = {}
+    records_checks: ClassVar[bool] = True
+
+    def get_result_cache_params(self, action: str) -> tuple[str, int] | None:
+        """Get the cache key and the timeout for a permission result.
+
+        Args:
+            action (str): The action name or alias.
+
+        Returns:
+            tuple[str, int] | None: The cache key and the timeout, or None if
+                the result of the action isn't cached.
+
+        Raises:
+            ValueError: If the action is not found in the permissions.
+        """
+        if not self.cache_timeouts:
+            return None
+
+        action_name = self.get_action_name(action)
+        if (timeout := self.cache_timeouts.get(action_name)) is None or not (
+            key := get_result_cache_key(manager=self, action=action_name)
+        ):
+            return None
+        return key, timeout
+
+    @classmethod
+    def get_action_index(cls, action: str) -> int:
+        """Get the index of an action or its alias in the action table.
+
+        Args:
+            action (str): The action name or alias.
+
+        Returns:
+            int: The index.
+
+        Raises:
+            ValueError: If the action is not found in the permissions.
+        """
+        try:
+            return cls._action_table[action]
+        except KeyError:
+            msg = f'"{cls.__name__}" doesn\'t have "{action}" action.'
+            raise ValueError(msg) from None
+
+    @classmethod
+    def get_action_name(cls, action: str) -> str:
+        """Get the action name for an action or its alias.
+
+        Args:
+            action (str): The action name or alias.
+
+        Returns:
+            str: The action name.
+
+        Raises:
+            ValueError: If the action is not found in the permissions.
+        """
+        return cls._action_names[cls.get_action_index(action)]
+
+    def _get_action(self, action: str) -> Callable:
+        return self._action_slots[self.get_action_index(action)]
+
+    @classmethod
+    def get_lookups(
+        cls,
+        lookups: Mapping[str, Iterable[str]] | Iterable[str],
+        actions: Iterable[str],
+    ) -> list[str]:
+        """Get related lookups needed by permission checks of actions.
+
+        Args:
+            lookups (Mapping[str, Iterable[str]] | Iterable[str]): The
+                lookups keyed by action name, or lookups for all actions.
+            actions (Iterable[str]): The actions (or their aliases). Unknown
+                actions are skipped.
+
+        Returns:
+            list[str]: The unique lookups.
+        """
+        if not isinstance(lookups, Mapping):
+            return list(dict.fromkeys(lookups))
+
+        action_names = set()
+        for action in actions:
+            with suppress(ValueError):
+                action_names.add(cls.get_action_name(action))
+
+        return list(
+            dict.fromkeys(
+                lookup
+                for action_name, action_lookups in lookups.items()
+                if action_name in action_names
+                for lookup in action_lookups
+            )
+        )
+
+    @classmethod
+    def get_select_related(cls, actions: Iterable[str]) -> list[str]:
+        """Get `select_related` lookups needed by checks of actions.
+
+        Args:
+            actions (Iterable[str]): The actions (or their aliases).
+
+        Returns:
+            list[str]: The lookups.
+        """
+        return cls.get_lookups(cls.select_related, actions)
+
+    @classmethod
+    def get_prefetch_related(cls, actions: Iterable[str]) -> list[str]:
+        """Get `prefetch_related` lookups needed by checks of actions.
+
+        Args:
+            actions (Iterable[str]): The actions (or their aliases).
+
+        Returns:
+            list[str]: The lookups.
+        """
+        return cls.get_lookups(cls.prefetch_related, actions)
+
+    @classmethod
+    def get_only(cls, actions: Iterable[str]) -> list[str]:
+        """Get model fields read by checks of actions.
+
+        Args:
+            actions (Iterable[str]): The actions (or their aliases).
+
+        Returns:
+            list[str]: The field names.
+        """
+        return cls.get_lookups(cls.only, actions)
+
+    def get_cache_version(self) -> str:
+        """Get the version of cached permission results.
+
+        Change the version to make cached results of the manager stale. If
+        the manager has `cache_dependencies`, the version combines versions
+        of the user, the instance and the parent.
+
+        Returns:
+            str: The version, or an empty string if the manager has no cache
+                dependencies.
+        """
+        if not self.cache_dependencies:
+            return ''
+        return get_versions(
+            user=self.user,
+            objects=(self.instance, self.context.get('parent')),
+        )
+
+    @classmethod
+    def get_batch_context(
+        cls,
+        *,
+        user: Any,  # noqa: ARG003
+        instances: Sequence[Any],  # noqa: ARG003
+        **context,  # noqa: ARG003
+    ) -> dict:
+        """Get a context shared by managers built for many instances.
+
+        It's called once per page when `PermissionField` is used in a list
+        serializer. Override it to fetch data needed by permission checks of
+        all instances at once (e.g. in one query), the result is merged into
+        the context of every manager of the page.
+
+        Args:
+            user (Any): The user for whom permissions are checked.
+            instances (Sequence[Any]): The instances of the page. For child
+                managers, these are the parent instances.
+            **context: The context of the managers.
+
+        Returns:
+            dict: An empty dict by default.
+        """
+        return {}
+
+    @classmethod
+    def get_child_cache_key(
+        cls,
+        *,
+        parent: Any,  # noqa: ARG003
+        parent_permission_manager: 'BasePermissionManager',  # noqa: ARG003
+    ) -> Hashable | None:
+        """Get a key of permission results of a child manager.
+
+        Child managers of `PermissionField` children with the same key are
+        shared within a request, so their results are computed once. Override
+        it if the results depend only on a part of the parent, e.g. return
+        a parent field or a permission result of the parent manager.
+
+        Args:
+            parent (Any): The parent instance.
+            parent_permission_manager (BasePermissionManager): The permission
+                manager of the parent instance.
+
+        Returns:
+            Hashable | None: The key, or None (by default) to build a manager
+                for each parent.
+        """
+        return None
+
+    @classmethod
+    def check_instances(
+        cls,
+        action: str,
+        managers: Sequence['BasePermissionManager'],
+    ) -> Iterator[tuple['BasePermissionManager', 'bool | PermissionResult']]:
+        """Check an action for many instances.
+
+        It's used by `ManagerPermission.check_objects`. By default each
+        manager checks its instance lazily, so the caller can stop at the
+        first denial. Override it to decide many instances at once (e.g. in
+        one query), the managers share the batch context, see
+        `get_batch_context`. Async managers can yield awaitable results or
+        override it with an async generator.
+
+        Args:
+            action (str): The action to check.
+            managers (Sequence[BasePermissionManager]): The permission
+                managers of the instances.
+
+        Yields:
+            tuple[BasePermissionManager, bool | PermissionResult]: The
+                managers with their permission results.
+        """
+        for manager in managers:
+            yield manager, manager.has_permission(action)
+
+    def get_queryset_filter(self, action: str) -> 'Q | None':
+        """Get a queryset filter for instances allowed for the action.
+
+        Override it to let the database return only the rows the user has
+        permission for, e.g. `Q(owner=self.user)` for the 'view' action.
+
+        Args:
+            action (str): The action to filter the queryset for.
+
+        Returns:
+            Q | None: The filter, or None (by default) if the queryset
+                shouldn't be filtered.
+        """
+        return None
+
+    def filter_queryset(self, queryset: 'QuerySet', action: str) -> 'QuerySet':
+        """Filter a queryset to instances allowed for the action.
+
+        Args:
+            queryset (QuerySet): The queryset to filter.
+            action (str): The action to filter the queryset for.
+
+        Returns:
+            QuerySet: The filtered queryset.
+        """
+        if (queryset_filter := self.get_queryset_filter(action)) is not None:
+            return queryset.filter(queryset_filter)
+        return queryset
+
 
 class DRFPermissionManager(
+    DRFPermissionMixin,
     PermissionManager,
     metaclass=DRFPermissionManagerMeta,
 ):
@@ -49,6 +411,69 @@ class DRFPermissionManager(
     method returns a boolean indicating whether the permission is granted.
     """
 
+    def has_permission(self, action: str) -> 'bool | PermissionResult':
+        """Check if the permission is granted for a specific action.
+
+        If the action has a timeout in `cache_timeouts`, the result is taken
+        from the result cache, see `PERMISSION_MANAGER_DRF_CACHE_ALIAS`
+        setting. The check is recorded in metrics sinks and the request
+        trace, if there are any.
+
+        Args:
+            action (str): The action to check permission for.
+
+        Returns:
+            bool | PermissionResult: The permission result.
+
+        Raises:
+            ValueError: If the action is not found in the permissions.
+        """
+        if not instrumentation.is_enabled():
+            return self.check_permission(action)[0]
+
+        with instrumentation.measure() as measurement:
+            result, cached = self.check_permission(action)
+        instrumentation.record(
+            manager=self,
+            action=action,
+            result=result,
+            cached=cached,
+            measurement=measurement,
+        )
+        return result
+
+    def check_permission(
+        self,
+        action: str,
+    ) -> tuple['bool | PermissionResult', bool]:
+        """Check the permission using the caches.
+
+        Args:
+            action (str): The action to check permission for.
+
+        Returns:
+            tuple[bool | PermissionResult, bool]: The permission result and
+                whether it was taken from a cache.
+
+        Raises:
+            ValueError: If the action is not found in the permissions.
+        """
+        permission_fn = self._get_action(action)
+        if self.cache and permission_fn.__name__ in self._cache:
+            return self._cache[permission_fn.__name__], True
+
+        if not (params := self.get_result_cache_params(action)):
+            return permission_fn(self), False
+
+        key, timeout = params
+        result_cache = get_result_cache()
+        if (result := result_cache.get(key, MISSING)) is not MISSING:
+            return result, True
+
+        result = permission_fn(self)
+        result_cache.set(key, result, timeout)
+        return result, False
+
     def has_create_permission(self) -> bool:
         """Check if create permission is granted.
 
@@ -88,3 +513,146 @@ class DRFPermissionManager(
             bool: False by default.
         """
         return False
+
+
+class AsyncDRFPermissionManager(
+    DRFPermissionMixin,
+    AsyncPermissionManager,
+    metaclass=DRFPermissionManagerMeta,
+):
+    """Base async DRF permission manager class.
+
+    This class defines the base async permissions for various DRF actions.
+    Independent actions are resolved concurrently.
+    """
+
+    async def has_permission(self, action: str) -> 'bool | PermissionResult':
+        """Check if the permission is granted for a specific action.
+
+        If the action has a timeout in `cache_timeouts`, the result is taken
+        from the result cache, see `PERMISSION_MANAGER_DRF_CACHE_ALIAS`
+        setting. The check is recorded in metrics sinks and the request
+        trace, if there are any.
+
+        Args:
+            action (str): The action to check permission for.
+
+        Returns:
+            bool | PermissionResult: The permission result.
+
+        Raises:
+            ValueError: If the action is not found in the permissions.
+        """
+        if not instrumentation.is_enabled():
+            return (await self.check_permission(action))[0]
+
+        with instrumentation.measure() as measurement:
+            result, cached = await self.check_permission(action)
+        instrumentation.record(
+            manager=self,
+            action=action,
+            result=result,
+            cached=cached,
+            measurement=measurement,
+        )
+        return result
+
+    async def check_permission(
+        self,
+        action: str,
+    ) -> tuple['bool | PermissionResult', bool]:
+        """Check the permission using the caches.
+
+        Args:
+            action (str): The action to check permission for.
+
+        Returns:
+            tuple[bool | PermissionResult, bool]: The permission result and
+                whether it was taken from a cache.
+
+        Raises:
+            ValueError: If the action is not found in the permissions.
+        """
+        permission_fn = self._get_action(action)
+        if self.cache and permission_fn.__name__ in self._cache:
+            return self._cache[permission_fn.__name__], True
+
+        if not self.cache_timeouts or not (
+            params := await sync_to_async(self.get_result_cache_params)(action)
+        ):
+            return await permission_fn(self), False
+
+        key, timeout = params
+        result_cache = get_result_cache()
+        if (result := await result_cache.aget(key, MISSING)) is not MISSING:
+            return result, True
+
+        result = await permission_fn(self)
+        await result_cache.aset(key, result, timeout)
+        return result, False
+
+    async def resolve(
+        self,
+        *,
+        actions: Iterable[str],
+        with_messages: bool = False,
+    ) -> dict[str, bool] | dict[str, 'ResolveWithMessageResult']:
+        """Resolve a list of actions concurrently.
+
+        Args:
+            actions (Iterable[str]): The list of actions to check.
+            with_messages (bool): Whether to include messages in the result.
+
+        Returns:
+            dict[str, bool] | dict[str, ResolveWithMessageResult]: A dictionary
+                with actions as keys and permission status as values, in the
+                same order as the actions.
+        """
+        actions = tuple(actions)
+        results = await asyncio.gather(
+            *(self.has_permission(action) for action in actions)
+        )
+        return {
+            action: get_result_value(value=result, with_messages=with_messages)
+            for action, result in zip(actions, results, strict=True)
+        }
+
+    async def has_create_permission(self) -> bool:
+        """Check if create permission is granted.
+
+        Returns:
+            bool: False by default.
+        """
+        return False
+
+    async def has_update_permission(self) -> bool:
+        """Check if update permission is granted.
+
+        Returns:
+            bool: False by default.
+        """
+        return False
+
+    async def has_view_permission(self) -> bool:
+        """Check if view permission is granted.
+
+        Returns:
+            bool: False by default.
+        """
+        return False
+
+    async def has_delete_permission(self) -> bool:
+        """Check if delete permission is granted.
+
+        Returns:
+            bool: False by default.
+        """
+        return False
+
+    async def has_list_permission(self) -> bool:
+        """Check if list permission is granted.
+
+        Returns:
+            bool: False by default.
+        """
+        return False
@@ -0,0 +1,64 @@
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+
+from permission_manager_drf import instrumentation
+
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest, HttpResponse
+
+    from permission_manager_drf.instrumentation import PermissionEvent
+
+
+def get_server_timing(events: Sequence['PermissionEvent']) -> str:
+    """Get a `Server-Timing` metric for permission checks.
+
+    Durations of nested checks aren't counted twice, since each check
+    contributes its `self_duration`.
+
+    Args:
+        events (Sequence[PermissionEvent]): The permission checks.
+
+    Returns:
+        str: The metric with the total duration in milliseconds.
+    """
+    duration = sum(event.self_duration for event in events) * 1000
+    cached = sum(event.cached for event in events)
+    queries = sum(len(event.queries) for event in events)
+    description = f'{len(events)} checks, {cached} cached, {queries} queries'
+    return f'permissions;dur={duration:.3f};desc="{description}"'
+
+
+class PermissionTimingMiddleware:
+    """Middleware tracing permission checks of a request.
+
+    The checks (with SQL of executed queries) are available in
+    `request.permission_trace`, e.g. for a debug panel, and their totals are
+    added to the `Server-Timing` response header.
+    """
+
+    def __init__(
+        self,
+        get_response: Callable[['HttpRequest'], 'HttpResponse'],
+    ) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: 'HttpRequest') -> 'HttpResponse':
+        """Process the request tracing permission checks.
+
+        Args:
+            request (HttpRequest): The request.
+
+        Returns:
+            HttpResponse: The response.
+        """
+        with instrumentation.trace() as events:
+            request.permission_trace = events
+            response = self.get_response(request)
+
+        if events:
+            timing = get_server_timing(events)
+            if existing := response.get('Server-Timing'):
+                timing = f'{existing}, {timing}'
+            response['Server-Timing'] = timing
+        return response
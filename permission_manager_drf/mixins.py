@@ -0,0 +1,189 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.constants import LOOKUP_SEP
+
+from permission_manager_drf.fields import PermissionField
+from permission_manager_drf.permissions import ManagerPermission
+from permission_manager_drf.utils import get_permission_manager_class
+
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+    from permission_manager import BasePermissionManager
+
+
+class PermissionManagerQuerysetMixin:
+    """Mixin to prepare the queryset of a view for permission checks.
+
+    Relations that permission managers declare in `select_related` and
+    `prefetch_related` attributes for the checked actions are added to the
+    queryset, so the checks don't query the database for each instance. The
+    actions are taken from the view action and `PermissionField` fields of
+    the serializer, once per view instance (i.e. per request), so
+    `get_object` doesn't collect them again.
+
+    Attributes:
+        permission_manager_only_fields (bool): Whether to load only fields
+            read by the serializer and permission managers (declared in
+            their `only` attribute) in the list action. Defaults to False.
+    """
+
+    permission_manager_only_fields: bool = False
+
+    def get_queryset(self) -> 'QuerySet':
+        """Get the queryset with relations needed by permission checks.
+
+        Returns:
+            QuerySet: The queryset.
+        """
+        queryset = super().get_queryset()
+        try:
+            actions = self._permission_manager_actions
+        except AttributeError:
+            actions = self._permission_manager_actions = (
+                self.get_permission_actions()
+            )
+        select_related = get_manager_lookups(actions, 'get_select_related')
+        prefetch_related = get_manager_lookups(actions, 'get_prefetch_related')
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        if (
+            self.permission_manager_only_fields
+            and getattr(self, 'action', None) == 'list'
+            and (
+                only := self.get_only_fields(
+                    model=queryset.model,
+                    lookups=(
+                        *get_manager_lookups(actions, 'get_only'),
+                        *select_related,
+                        *prefetch_related,
+                    ),
+                )
+            )
+        ):
+            queryset = queryset.only(*only)
+        return queryset
+
+    def get_only_fields(
+        self,
+        *,
+        model: type['Model'],
+        lookups: Iterable[str],
+    ) -> list[str] | None:
+        """Get model fields read by the serializer and permission checks.
+
+        Args:
+            model (type[Model]): The model of the queryset.
+            lookups (Iterable[str]): Fields and relations read by permission
+                checks.
+
+        Returns:
+            list[str] | None: The field names, or None if the serializer
+                reads attributes which aren't model fields, so all fields
+                should be loaded.
+        """
+        opts = model._meta  # noqa: SLF001
+        concrete = {}
+        for field in opts.concrete_fields:
+            concrete[field.name] = concrete[field.attname] = field.name
+        relations = {field.name for field in opts.get_fields()}
+
+        names = [lookup.split(LOOKUP_SEP, 1)[0] for lookup in lookups]
+        for field in self.get_serializer().fields.values():
+            if field.write_only or isinstance(field, PermissionField):
+                continue
+            if field.source == '*':
+                return None
+            names.append(field.source_attrs[0])
+
+        fields = []
+        for name in names:
+            if name in concrete:
+                fields.append(concrete[name])
+            elif name not in relations:
+                return None
+        return list(dict.fromkeys(fields))
+
+    def get_permission_action(self, view_action: str) -> str:
+        """Get the permission manager action a view action is checked with.
+
+        Aliases are taken from the first `ManagerPermission` subclass in
+        `permission_classes` of the view.
+
+        Args:
+            view_action (str): The view action.
+
+        Returns:
+            str: The permission manager action.
+        """
+        for permission_class in getattr(self, 'permission_classes', ()):
+            if isinstance(permission_class, type) and issubclass(
+                permission_class, ManagerPermission
+            ):
+                return permission_class.action_aliases.get(
+                    view_action, view_action
+                )
+        return view_action
+
+    def get_permission_actions(
+        self,
+    ) -> dict[type['BasePermissionManager'], list[str]]:
+        """Get actions checked for instances of the queryset.
+
+        The view action and actions of `PermissionField` fields are checked
+        by the permission manager of the view. Managers of the children
+        aren't included, since their lookups are relative to the child
+        model, not to the instances of the queryset.
+
+        Returns:
+            dict[type[BasePermissionManager], list[str]]: The actions keyed by
+                permission manager class.
+        """
+        actions = defaultdict(list)
+        with suppress(ImproperlyConfigured):
+            manager_class = get_permission_manager_class(self)
+            if view_action := getattr(self, 'action', None):
+                actions[manager_class].append(
+                    self.get_permission_action(view_action)
+                )
+
+            serializer_class = self.get_serializer_class()
+            for field in getattr(
+                serializer_class, '_declared_fields', {}
+            ).values():
+                if isinstance(field, PermissionField):
+                    actions[manager_class].extend(field.actions)
+        return actions
+
+
+def get_manager_lookups(
+    actions: dict[type['BasePermissionManager'], list[str]],
+    method_name: str,
+) -> list[str]:
+    """Get unique lookups declared by permission managers for actions.
+
+    Args:
+        actions (dict[type[BasePermissionManager], list[str]]): The actions
+            keyed by permission manager class.
+        method_name (str): The name of the manager method getting lookups,
+            managers without it are skipped.
+
+    Returns:
+        list[str]: The lookups.
+    """
+    return list(
+        dict.fromkeys(
+            lookup
+            for manager_class, manager_actions in actions.items()
+            if (method := getattr(manager_class, method_name, None))
+            for lookup in method(manager_actions)
+        )
+    )
@@ -1,20 +1,191 @@
+import json
+import math
+import operator
+from functools import cached_property, partial, reduce
+from typing import TYPE_CHECKING, Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.paginator import EmptyPage, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    CursorPagination,
+    LimitOffsetPagination,
+    PageNumberPagination,
+)
+
+from permission_manager_drf.cache import (
+    MISSING,
+    get_count_cache_key,
+    get_result_cache,
+)
 from permission_manager_drf.utils import (
     get_list_permissions,
 )
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.core.paginator import Page
+
+
+# Count modes of `PermissionManagerPaginationMixin`
+COUNT_EXACT = 'exact'
+COUNT_NONE = 'none'
+COUNT_ESTIMATED = 'estimated'
+COUNT_CACHED = 'cached'
+COUNT_MODES = (COUNT_EXACT, COUNT_NONE, COUNT_ESTIMATED, COUNT_CACHED)
+
+
+class CountPaginator(Paginator):
+    """Django paginator counting objects with a function.
+
+    Attributes:
+        get_count (Callable[[Any], int]): The function getting the number of
+            objects of the object list.
+    """
+
+    def __init__(
+        self,
+        *args,
+        get_count: 'Callable[[Any], int]',
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.get_count = get_count
+
+    @cached_property
+    def count(self) -> int:
+        """Get the number of objects.
+
+        Returns:
+            int: The number of objects.
+        """
+        return self.get_count(self.object_list)
+
+
+class CountlessPaginator(Paginator):
+    """Django paginator which doesn't count objects.
+
+    A page is fetched with one extra object to know if there is a next page.
+    `count` is None, `num_pages` is the number of pages known after fetching
+    a page (up to the next one).
+    """
+
+    count = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Unknown before fetching a page, so the last page is invalid
+        self.num_pages = 0
+
+    def page(self, number: Any) -> 'Page':
+        """Get a page by its number.
+
+        Args:
+            number: The page number.
+
+        Returns:
+            Page: The page.
+
+        Raises:
+            EmptyPage: If the page has no objects and isn't the first one.
+        """
+        # Any page can exist before it's fetched
+        self.num_pages = math.inf
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        objects = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not objects and number > 1:
+            msg = 'That page contains no results'
+            raise EmptyPage(msg)
+
+        self.num_pages = number + (len(objects) > self.per_page)
+        return self._get_page(objects[: self.per_page], number, self)
+
+
+def get_estimated_count(queryset: QuerySet, threshold: int) -> int:
+    """Get the number of objects estimated by the database planner.
+
+    Args:
+        queryset (QuerySet): The queryset.
+        threshold (int): Estimates below it are replaced by the exact count.
+
+    Returns:
+        int: The estimated number of objects, or the exact one if the
+            database isn't PostgreSQL or the estimate is below the threshold.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    estimate = plan[0]['Plan']['Plan Rows']
+    if estimate < threshold:
+        return queryset.count()
+    return estimate
+
+
+def get_cached_count(queryset: QuerySet, timeout: int | None) -> int:
+    """Get the number of objects from the result cache.
+
+    Args:
+        queryset (QuerySet): The queryset.
+        timeout (int | None): The cache timeout in seconds.
+
+    Returns:
+        int: The number of objects.
+    """
+    result_cache = get_result_cache()
+    key = get_count_cache_key(queryset)
+    if (count := result_cache.get(key, MISSING)) is MISSING:
+        count = queryset.count()
+        result_cache.set(key, count, timeout)
+    return count
+
+
 class PermissionManagerPaginationMixin:
     """Mixin to add permission manager resolved permissions to pagination.
 
     This mixin integrates permission manager into the paginated response of a
     DRF pagination class.
+
+    Attributes:
+        bitmask_actions_header (str): The response header listing actions of
+            `PermissionField` bitmasks as 'field=action,...' separated by
+            '; '. Messages of denied actions are added to the response data
+            as 'permission_messages' keyed by field and instance primary key.
+        count_mode (str): How page number and limit/offset paginations count
+            objects: 'exact' runs `COUNT(*)`, 'none' skips the count (it's
+            null in the response) and fetches one extra object to know if
+            there is a next page, 'estimated' takes the planner estimate on
+            PostgreSQL, 'cached' caches the exact count in the result cache.
+            Defaults to 'exact'.
+        count_estimate_threshold (int): Planner estimates below it are
+            replaced by the exact count. Defaults to 1000.
+        count_cache_timeout (int | None): The timeout in seconds for cached
+            counts. Defaults to 60.
     """
 
+    bitmask_actions_header = 'X-Permission-Actions'
+    count_mode = COUNT_EXACT
+    count_estimate_threshold = 1000
+    count_cache_timeout = 60
+
     def paginate_queryset(self, queryset, request, view=None):
         """Paginate the queryset.
 
         This method overrides the default `paginate_queryset` to store the
-        view for later use.
+        view for later use and to count objects according to `count_mode`.
 
         Args:
             queryset: The queryset to paginate.
@@ -23,9 +194,107 @@ class PermissionManagerPaginationMixin:
 
         Returns:
             The paginated queryset.
+
+        Raises:
+            ImproperlyConfigured: If `count_mode` is unknown.
         """
+        if self.count_mode not in COUNT_MODES:
+            msg = (
+                f'Unknown count mode "{self.count_mode}", use one of: '
+                f'{", ".join(COUNT_MODES)}.'
+            )
+            raise ImproperlyConfigured(msg)
+
         self.view = view
-        return super().paginate_queryset(queryset, request, view)
+        if self.count_mode != COUNT_EXACT and isinstance(
+            self, PageNumberPagination
+        ):
+            self.django_paginator_class = self.get_django_paginator_class()
+        elif self.count_mode == COUNT_NONE and isinstance(
+            self, LimitOffsetPagination
+        ):
+            return self.start_bitmasks(
+                request,
+                self.paginate_queryset_without_count(queryset, request),
+            )
+        return self.start_bitmasks(
+            request, super().paginate_queryset(queryset, request, view)
+        )
+
+    def start_bitmasks(self, request, page):
+        """Start collecting `PermissionField` bitmasks of a page.
+
+        Bitmask fields are allowed only in paginated lists, because the
+        paginated response lists their actions and messages.
+
+        Args:
+            request: The request object.
+            page: The paginated queryset, or None if it isn't paginated.
+
+        Returns:
+            The page.
+        """
+        if page is not None:
+            request.permission_bitmasks = {}
+        return page
+
+    def paginate_queryset_without_count(self, queryset, request):
+        """Paginate the queryset of a limit/offset pagination without a count.
+
+        One extra object is fetched to know if there is a next page, `count`
+        is set to the number of objects up to it.
+
+        Args:
+            queryset: The queryset to paginate.
+            request: The request object.
+
+        Returns:
+            The paginated queryset.
+        """
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.count = self.offset + len(results)
+        if self.count > self.limit and self.template is not None:
+            self.display_page_controls = True
+        return results[: self.limit]
+
+    def get_django_paginator_class(self) -> 'Callable[..., Paginator]':
+        """Get the Django paginator class of a page number pagination.
+
+        Returns:
+            Callable[..., Paginator]: The paginator class.
+        """
+        if self.count_mode == COUNT_NONE:
+            return CountlessPaginator
+        return partial(CountPaginator, get_count=self.get_count)
+
+    def get_count(self, queryset) -> int:
+        """Get the number of objects according to `count_mode`.
+
+        Estimated and cached counts are used only for querysets.
+
+        Args:
+            queryset: The queryset or a list of objects.
+
+        Returns:
+            int: The number of objects.
+        """
+        if isinstance(queryset, QuerySet):
+            if self.count_mode == COUNT_ESTIMATED:
+                return get_estimated_count(
+                    queryset, self.count_estimate_threshold
+                )
+            if self.count_mode == COUNT_CACHED:
+                return get_cached_count(queryset, self.count_cache_timeout)
+        try:
+            return queryset.count()
+        except (AttributeError, TypeError):
+            return len(queryset)
 
     def get_paginated_response(self, data):
         """Get the paginated response.
@@ -41,7 +310,180 @@ class PermissionManagerPaginationMixin:
         """
         result = super().get_paginated_response(data)
 
+        if self.count_mode == COUNT_NONE and 'count' in result.data:
+            result.data['count'] = None
+
         if permissions := get_list_permissions(self.view):
             result.data['permissions'] = permissions
 
+        if bitmasks := getattr(self.view.request, 'permission_bitmasks', None):
+            result[self.bitmask_actions_header] = '; '.join(
+                f'{name}={",".join(info.actions)}'
+                for name, info in bitmasks.items()
+            )
+            if messages := {
+                name: info.messages
+                for name, info in bitmasks.items()
+                if info.messages
+            }:
+                result.data['permission_messages'] = messages
+
         return result
+
+
+def get_keyset_filter(
+    ordering: tuple[str, ...],
+    position: list,
+    *,
+    reverse: bool = False,
+) -> Q:
+    """Get a filter for objects following a position in an ordering.
+
+    Args:
+        ordering (tuple[str, ...]): The ordering fields, '-' marks the
+            descending order.
+        position (list): Values of the ordering fields at the position.
+        reverse (bool): Whether to get objects preceding the position.
+
+    Returns:
+        Q: The filter, `(a > x) OR (a = x AND b > y) OR ...` for the
+            ordering `('a', 'b', ...)`.
+
+    Raises:
+        ValueError: If the position doesn't match the ordering.
+    """
+    conditions = []
+    equal = {}
+    for order, value in zip(ordering, position, strict=True):
+        name = order.lstrip('-')
+        lookup = 'lt' if order.startswith('-') != reverse else 'gt'
+        conditions.append(Q(**equal, **{f'{name}__{lookup}': value}))
+        equal[name] = value
+    return reduce(operator.or_, conditions)
+
+
+class PermissionManagerCursorPagination(
+    PermissionManagerPaginationMixin,
+    CursorPagination,
+):
+    """Keyset pagination with permission manager resolved permissions.
+
+    Unlike `CursorPagination`, which filters by the first ordering field and
+    skips duplicates with an offset, the cursor holds values of all ordering
+    fields and pages are filtered by all of them. The ordering is made
+    unique with the primary key, so a deep page costs as much as the first
+    one (given an index on the ordering). Ordering fields shouldn't be
+    nullable.
+
+    Attributes:
+        ordering (str | tuple[str, ...] | None): The ordering, None for
+            `Meta.ordering` of the model. Defaults to None.
+    """
+
+    ordering = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate the queryset.
+
+        Args:
+            queryset: The queryset to paginate.
+            request: The request object.
+            view: The view object (optional).
+
+        Returns:
+            The paginated queryset.
+        """
+        self.view = view
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = bool(self.cursor and self.cursor.reverse)
+        position = self.cursor.position if self.cursor else None
+
+        if reverse:
+            queryset = queryset.order_by(
+                *(
+                    order[1:] if order.startswith('-') else f'-{order}'
+                    for order in self.ordering
+                )
+            )
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if position is not None:
+            try:
+                queryset = queryset.filter(
+                    get_keyset_filter(
+                        self.ordering, json.loads(position), reverse=reverse
+                    )
+                )
+            except (TypeError, ValueError) as e:
+                raise NotFound(self.invalid_cursor_message) from e
+
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        following_position = (
+            self._get_position_from_instance(results[-1], self.ordering)
+            if len(results) > self.page_size
+            else None
+        )
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = following_position is not None
+            self.next_position = position
+            self.previous_position = following_position
+        else:
+            self.has_next = following_position is not None
+            self.has_previous = position is not None
+            self.next_position = following_position
+            self.previous_position = position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.start_bitmasks(request, self.page)
+
+    def get_ordering(self, request, queryset, view) -> tuple[str, ...]:
+        """Get the unique ordering.
+
+        Args:
+            request: The request object.
+            queryset: The queryset to paginate.
+            view: The view object.
+
+        Returns:
+            tuple[str, ...]: The ordering ending with the primary key.
+
+        Raises:
+            ImproperlyConfigured: If the ordering contains expressions.
+        """
+        if self.ordering is None:
+            self.ordering = tuple(queryset.model._meta.ordering)  # noqa: SLF001
+        if not all(isinstance(order, str) for order in self.ordering):
+            msg = 'Keyset pagination supports only field names in ordering.'
+            raise ImproperlyConfigured(msg)
+
+        ordering = super().get_ordering(request, queryset, view)
+        pk = queryset.model._meta.pk  # noqa: SLF001
+        if not {order.lstrip('-') for order in ordering} & {
+            'pk',
+            pk.name,
+            pk.attname,
+        }:
+            descending = bool(ordering) and ordering[-1].startswith('-')
+            ordering = (*ordering, '-pk' if descending else 'pk')
+        return ordering
+
+    def _get_position_from_instance(self, instance, ordering) -> str:
+        names = [order.lstrip('-') for order in ordering]
+        if isinstance(instance, dict):
+            values = [instance[name] for name in names]
+        else:
+            values = [getattr(instance, name) for name in names]
+        return json.dumps(values, cls=DjangoJSONEncoder)
@@ -1,16 +1,121 @@
-from typing import TYPE_CHECKING, ClassVar
+import inspect
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
+from weakref import WeakKeyDictionary
 
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from django.core.exceptions import ImproperlyConfigured
 from rest_framework.permissions import BasePermission
 
-from permission_manager_drf.utils import get_permission_manager
+from permission_manager_drf import instrumentation
+from permission_manager_drf.utils import (
+    ahas_permission,
+    get_permission_manager,
+    get_permission_managers,
+)
 
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine
+
     from django.db.models import Model
+    from permission_manager import BasePermissionManager, PermissionResult
     from rest_framework.request import Request
     from rest_framework.viewsets import GenericViewSet
 
 
+def get_sync_result(result: Any) -> 'bool | PermissionResult':
+    """Get a permission result of a check in a sync view.
+
+    Async permission managers return coroutines, which are always truthy, so
+    they must not be used as results.
+
+    Args:
+        result: The result of `has_permission` of a permission manager.
+
+    Returns:
+        bool | PermissionResult: The permission result.
+
+    Raises:
+        ImproperlyConfigured: If the result is awaitable.
+    """
+    if inspect.isawaitable(result):
+        if inspect.iscoroutine(result):
+            result.close()
+        msg = (
+            'Async permission managers can be used only with '
+            'AsyncManagerPermission in async views.'
+        )
+        raise ImproperlyConfigured(msg)
+    return result
+
+
+async def aiter_results(
+    results: Any,
+) -> 'AsyncIterator[tuple[BasePermissionManager, Any]]':
+    """Iterate over permission results of async permission managers.
+
+    Args:
+        results: An iterable or an async iterable of managers with their
+            results, which can be awaitable.
+
+    Yields:
+        tuple[BasePermissionManager, Any]: The managers with their results.
+    """
+    if hasattr(results, '__aiter__'):
+        async for manager, result in results:
+            yield manager, result
+        return
+
+    for manager, result in results:
+        yield (
+            manager,
+            (await result if inspect.isawaitable(result) else result),
+        )
+
+
+class ActionInfo(NamedTuple):
+    """Precomputed information about a view action.
+
+    Attributes:
+        permission_action (str): The permission manager action the view
+            action is checked with.
+        detail (bool): Whether the action is a detail action.
+    """
+
+    permission_action: str
+    detail: bool
+
+
+class DeniedObject(NamedTuple):
+    """An object denied by a bulk permission check.
+
+    Attributes:
+        obj (Model): The object.
+        messages (list[str] | None): The messages of the permission result.
+    """
+
+    obj: 'Model'
+    messages: list[str] | None
+
+    @classmethod
+    def from_result(
+        cls,
+        obj: 'Model',
+        result: 'bool | PermissionResult',
+    ) -> 'DeniedObject':
+        """Build a denied object from a permission result.
+
+        Args:
+            obj (Model): The object.
+            result (bool | PermissionResult): The permission result.
+
+        Returns:
+            DeniedObject: The denied object.
+        """
+        return cls(obj=obj, messages=getattr(result, 'message', None) or None)
+
+
 class ManagerPermission(BasePermission):
     """DRF Permission class for a permission manager.
 
@@ -20,9 +125,42 @@ class ManagerPermission(BasePermission):
     Attributes:
         default_detail_actions (ClassVar[tuple]): Default actions considered
             as detail actions.
+        default_actions (ClassVar[tuple]): Default viewset actions.
+        action_aliases (ClassVar[dict[str, str]]): View actions that are
+            checked as other permission manager actions.
+        stop_on_first_denial (ClassVar[bool]): Whether `check_objects` stops
+            at the first denied object. Defaults to False.
     """
 
-    default_detail_actions: ClassVar[tuple] = ('retrieve', 'destroy', 'update')
+    default_detail_actions: ClassVar[tuple] = (
+        'retrieve',
+        'destroy',
+        'update',
+        'partial_update',
+    )
+    default_actions: ClassVar[tuple] = (
+        'list',
+        'create',
+        'retrieve',
+        'update',
+        'partial_update',
+        'destroy',
+    )
+    action_aliases: ClassVar[dict[str, str]] = {
+        # Resolve partial_update action like update action
+        'partial_update': 'update',
+    }
+    stop_on_first_denial: ClassVar[bool] = False
+    _action_maps: ClassVar[WeakKeyDictionary] = WeakKeyDictionary()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Give each subclass its own action maps.
+
+        Subclasses can override detail actions and aliases, so they can't
+        share action maps with the parent class.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._action_maps = WeakKeyDictionary()
 
     def is_detail(self, view: 'GenericViewSet', action_name: str) -> bool:
         """Check if the action is a detail action.
@@ -40,31 +178,209 @@ class ManagerPermission(BasePermission):
         action = getattr(view, action_name, None)
         return getattr(action, 'detail', False)
 
-    def _has_perm(self, view: 'GenericViewSet', obj: 'Model' = None) -> bool:
-        """Check if the permission is granted for the action.
+    def build_action_info(
+        self,
+        view: 'GenericViewSet',
+        action_name: str,
+    ) -> ActionInfo:
+        """Build the information about a view action.
+
+        Whether the action is a detail one depends on the view action, the
+        aliases change only the permission manager action it's checked with.
+
+        Args:
+            view (GenericViewSet): The view being accessed.
+            action_name (str): The name of the action.
+
+        Returns:
+            ActionInfo: The information about the action.
+        """
+        permission_action = self.action_aliases.get(action_name, action_name)
+        return ActionInfo(
+            permission_action=permission_action,
+            detail=self.is_detail(view=view, action_name=action_name),
+        )
+
+    def get_action_map(self, view: 'GenericViewSet') -> dict[str, ActionInfo]:
+        """Get the map of view actions to their information.
+
+        The map is built once per view class from the default actions and
+        extra actions of the view.
+
+        Args:
+            view (GenericViewSet): The view being accessed.
+
+        Returns:
+            dict[str, ActionInfo]: The information keyed by action name.
+        """
+        view_class = type(view)
+        if (action_map := self._action_maps.get(view_class)) is None:
+            extra_actions = getattr(view_class, 'get_extra_actions', list)()
+            action_map = self._action_maps[view_class] = {
+                action_name: self.build_action_info(
+                    view=view, action_name=action_name
+                )
+                for action_name in (
+                    *self.default_actions,
+                    *(action.__name__ for action in extra_actions),
+                )
+            }
+        return action_map
+
+    def get_action_info(
+        self,
+        view: 'GenericViewSet',
+        action_name: str,
+    ) -> ActionInfo:
+        """Get the information about a view action.
+
+        Args:
+            view (GenericViewSet): The view being accessed.
+            action_name (str): The name of the action.
+
+        Returns:
+            ActionInfo: The information about the action.
+        """
+        action_map = self.get_action_map(view)
+        if (action_info := action_map.get(action_name)) is None:
+            # Actions which aren't known in advance, e.g. extra method
+            # mappings of actions
+            action_info = action_map[action_name] = self.build_action_info(
+                view=view, action_name=action_name
+            )
+        return action_info
+
+    def get_permission_check(
+        self,
+        view: 'GenericViewSet',
+        obj: 'Model' = None,
+    ) -> tuple['BasePermissionManager', str] | None:
+        """Get the permission manager and the action to check.
 
         Args:
             view (GenericViewSet): The view being accessed.
             obj (Model, optional): The object being accessed.
 
         Returns:
-            bool: True if the permission is granted, False otherwise.
+            tuple[BasePermissionManager, str] | None: The permission manager
+                and the action, or None if there is nothing to check.
         """
         action_name = view.action
 
         # Let DRF decide what to do if view hasn't action
         if not action_name:
-            return True
+            return None
 
-        # Resolve partial_update action like update action
-        if action_name == 'partial_update':
-            action_name = 'update'
+        action_info = self.get_action_info(view=view, action_name=action_name)
+        if not obj and action_info.detail:
+            return None
+
+        manager = get_permission_manager(view=view, instance=obj, cache=True)
+        return manager, action_info.permission_action
+
+    def get_bulk_permission_check(
+        self,
+        view: 'GenericViewSet',
+        objs: Iterable['Model'],
+        action: str | None = None,
+    ) -> tuple[list['BasePermissionManager'], str] | None:
+        """Get the permission managers of objects and the action to check.
+
+        Args:
+            view (GenericViewSet): The view being accessed.
+            objs (Iterable[Model]): The objects being accessed.
+            action (str | None): The permission manager action. Defaults to
+                None (the action of the view).
+
+        Returns:
+            tuple[list[BasePermissionManager], str] | None: The permission
+                managers and the action, or None if there is nothing to
+                check.
+        """
+        if action is None:
+            if not view.action:
+                return None
+            action = self.get_action_info(
+                view=view, action_name=view.action
+            ).permission_action
+
+        if not (objs := list(objs)):
+            return None
+
+        managers = get_permission_managers(
+            view=view, instances=objs, cache=True
+        )
+        return managers, action
+
+    def get_instance_results(
+        self,
+        managers: list['BasePermissionManager'],
+        action: str,
+    ) -> Iterable[tuple['BasePermissionManager', Any]]:
+        """Get permission results of managers for an action.
+
+        Args:
+            managers (list[BasePermissionManager]): The permission managers.
+            action (str): The action to check.
 
-        if not obj and self.is_detail(view=view, action_name=action_name):
+        Returns:
+            Iterable[tuple[BasePermissionManager, Any]]: The managers with
+                their results from `check_instances` method of the manager
+                class, or from checks of each manager if it isn't defined.
+        """
+        manager_class = type(managers[0])
+        if check_instances := getattr(manager_class, 'check_instances', None):
+            return check_instances(action, managers)
+        return (
+            (manager, manager.has_permission(action)) for manager in managers
+        )
+
+    def get_denied_objects(
+        self,
+        managers: list['BasePermissionManager'],
+        action: str,
+        *,
+        stop_on_first_denial: bool,
+    ) -> list[DeniedObject]:
+        """Check an action with permission managers of objects.
+
+        Args:
+            managers (list[BasePermissionManager]): The permission managers.
+            action (str): The action to check.
+            stop_on_first_denial (bool): Whether to stop at the first denied
+                object.
+
+        Returns:
+            list[DeniedObject]: The denied objects.
+        """
+        denied = []
+        with instrumentation.source('permission'):
+            for manager, result in self.get_instance_results(managers, action):
+                if get_sync_result(result):
+                    continue
+                denied.append(
+                    DeniedObject.from_result(manager.instance, result)
+                )
+                if stop_on_first_denial:
+                    break
+        return denied
+
+    def _has_perm(self, view: 'GenericViewSet', obj: 'Model' = None) -> bool:
+        """Check if the permission is granted for the action.
+
+        Args:
+            view (GenericViewSet): The view being accessed.
+            obj (Model, optional): The object being accessed.
+
+        Returns:
+            bool: True if the permission is granted, False otherwise.
+        """
+        if not (check := self.get_permission_check(view=view, obj=obj)):
             return True
 
-        manager = get_permission_manager(view=view, instance=obj)
-        return manager.has_permission(action_name)
+        manager, action = check
+        with instrumentation.source('permission'):
+            return get_sync_result(manager.has_permission(action))
 
     def has_permission(
         self,
@@ -99,3 +415,221 @@ class ManagerPermission(BasePermission):
             bool: True if the request has permission, False otherwise.
         """
         return self._has_perm(view=view, obj=obj)
+
+    def check_objects(
+        self,
+        request: 'Request',
+        view: 'GenericViewSet',
+        objs: Iterable['Model'],
+        *,
+        action: str | None = None,
+        stop_on_first_denial: bool | None = None,
+    ) -> list[DeniedObject]:
+        """Check the permission to access many objects at once.
+
+        It's meant for bulk endpoints. The managers are built at once with
+        the shared batch context and checked by `check_instances` method of
+        the manager class, which can decide all instances at once.
+
+        Args:
+            request (Request): The request being made.
+            view (GenericViewSet): The view being accessed.
+            objs (Iterable[Model]): The objects being accessed.
+            action (str | None): The permission manager action to check, e.g.
+                'publish' in a 'bulk_publish' view action. Defaults to None
+                (the action of the view).
+            stop_on_first_denial (bool | None): Whether to stop at the first
+                denied object. Defaults to None (`stop_on_first_denial`
+                attribute).
+
+        Returns:
+            list[DeniedObject]: The denied objects in the order of the
+                objects, an empty list if all of them are allowed.
+        """
+        if not (check := self.get_bulk_permission_check(view, objs, action)):
+            return []
+
+        if stop_on_first_denial is None:
+            stop_on_first_denial = self.stop_on_first_denial
+        return self.get_denied_objects(
+            *check, stop_on_first_denial=stop_on_first_denial
+        )
+
+
+class AsyncManagerPermission(ManagerPermission):
+    """Async DRF Permission class for a permission manager.
+
+    This class is used in async views (e.g. adrf). It works with both async
+    and sync permission managers, sync ones are called in a thread. Sync
+    views don't await permission checks (and a coroutine is always truthy),
+    so they are refused.
+    """
+
+    def check_async_view(self, view: 'GenericViewSet') -> None:
+        """Check that the view awaits permission checks.
+
+        Args:
+            view (GenericViewSet): The view being accessed.
+
+        Raises:
+            ImproperlyConfigured: If the view isn't async.
+        """
+        if not getattr(view, 'view_is_async', False):
+            msg = (
+                f'AsyncManagerPermission can be used only in async views, '
+                f'use ManagerPermission in {type(view).__name__}.'
+            )
+            raise ImproperlyConfigured(msg)
+
+    async def _has_perm(
+        self,
+        view: 'GenericViewSet',
+        obj: 'Model' = None,
+    ) -> bool:
+        """Check if the permission is granted for the action.
+
+        Args:
+            view (GenericViewSet): The view being accessed.
+            obj (Model, optional): The object being accessed.
+
+        Returns:
+            bool: True if the permission is granted, False otherwise.
+        """
+        if not (check := self.get_permission_check(view=view, obj=obj)):
+            return True
+
+        manager, action = check
+        with instrumentation.source('permission'):
+            return bool(await ahas_permission(manager, action))
+
+    @markcoroutinefunction
+    def has_permission(
+        self,
+        request: 'Request',
+        view: 'GenericViewSet',
+    ) -> 'Coroutine[Any, Any, bool]':
+        """Check if the request has permission to access the view.
+
+        The view is checked before the coroutine is created, so sync views
+        fail instead of getting a truthy coroutine.
+
+        Args:
+            request (Request): The request being made.
+            view (GenericViewSet): The view being accessed.
+
+        Returns:
+            Coroutine[Any, Any, bool]: The coroutine returning True if the
+                request has permission, False otherwise.
+        """
+        self.check_async_view(view)
+        return self._has_perm(view=view)
+
+    @markcoroutinefunction
+    def has_object_permission(
+        self,
+        request: 'Request',
+        view: 'GenericViewSet',
+        obj: 'Model',
+    ) -> 'Coroutine[Any, Any, bool]':
+        """Check if the request has permission to access the object.
+
+        Args:
+            request (Request): The request being made.
+            view (GenericViewSet): The view being accessed.
+            obj (Model): The object being accessed.
+
+        Returns:
+            Coroutine[Any, Any, bool]: The coroutine returning True if the
+                request has permission, False otherwise.
+        """
+        self.check_async_view(view)
+        return self._has_perm(view=view, obj=obj)
+
+    @markcoroutinefunction
+    def check_objects(
+        self,
+        request: 'Request',
+        view: 'GenericViewSet',
+        objs: Iterable['Model'],
+        *,
+        action: str | None = None,
+        stop_on_first_denial: bool | None = None,
+    ) -> 'Coroutine[Any, Any, list[DeniedObject]]':
+        """Check the permission to access many objects at once.
+
+        Async permission managers are checked by `check_instances` method of
+        the manager class, which can be an async generator or yield
+        awaitable results. Sync ones are checked in a thread.
+
+        Args:
+            request (Request): The request being made.
+            view (GenericViewSet): The view being accessed.
+            objs (Iterable[Model]): The objects being accessed.
+            action (str | None): The permission manager action to check.
+                Defaults to None (the action of the view).
+            stop_on_first_denial (bool | None): Whether to stop at the first
+                denied object. Defaults to None (`stop_on_first_denial`
+                attribute).
+
+        Returns:
+            Coroutine[Any, Any, list[DeniedObject]]: The coroutine returning
+                the denied objects.
+        """
+        self.check_async_view(view)
+        if stop_on_first_denial is None:
+            stop_on_first_denial = self.stop_on_first_denial
+        return self._check_objects(
+            view=view,
+            objs=objs,
+            action=action,
+            stop_on_first_denial=stop_on_first_denial,
+        )
+
+    async def _check_objects(
+        self,
+        *,
+        view: 'GenericViewSet',
+        objs: Iterable['Model'],
+        action: str | None,
+        stop_on_first_denial: bool,
+    ) -> list[DeniedObject]:
+        """Check the permission to access many objects at once.
+
+        Args:
+            view (GenericViewSet): The view being accessed.
+            objs (Iterable[Model]): The objects being accessed.
+            action (str | None): The permission manager action to check, None
+                for the action of the view.
+            stop_on_first_denial (bool): Whether to stop at the first denied
+                object.
+
+        Returns:
+            list[DeniedObject]: The denied objects in the order of the
+                objects, an empty list if all of them are allowed.
+        """
+        # Batch contexts of managers may query the database
+        check = await sync_to_async(self.get_bulk_permission_check)(
+            view, objs, action
+        )
+        if not check:
+            return []
+
+        managers, action = check
+        if not inspect.iscoroutinefunction(managers[0].has_permission):
+            return await sync_to_async(self.get_denied_objects)(
+                managers, action, stop_on_first_denial=stop_on_first_denial
+            )
+
+        denied = []
+        with instrumentation.source('permission'):
+            async for manager, result in aiter_results(
+                self.get_instance_results(managers, action)
+            ):
+                if result:
+                    continue
+                denied.append(
+                    DeniedObject.from_result(manager.instance, result)
+                )
+                if stop_on_first_denial:
+                    break
+        return denied
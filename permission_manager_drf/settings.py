@@ -1,15 +1,77 @@
+from typing import Any
+
 from django.conf import settings
+from django.core.signals import setting_changed
 from django.utils.module_loading import import_string
 
 
-# Path to the function for getting a permission manager class for a model
-PERMISSION_MANAGER_DRF_FOR_MODEL_GETTER = getattr(
-    settings,
-    'PERMISSION_MANAGER_DRF_FOR_MODEL_GETTER',
-    'permission_manager_drf.utils.get_permission_manager_class_for_model',
-)
+DEFAULTS = {
+    # Path to the function for getting a permission manager class for a model
+    'PERMISSION_MANAGER_DRF_FOR_MODEL_GETTER': (
+        'permission_manager_drf.utils.get_permission_manager_class_for_model'
+    ),
+    # Alias of the cache (from CACHES setting) for permission results
+    'PERMISSION_MANAGER_DRF_CACHE_ALIAS': 'default',
+    # Maximum number of threads for concurrent permission resolution
+    'PERMISSION_MANAGER_DRF_EXECUTOR_MAX_WORKERS': 4,
+    # Metrics sinks (callables or paths to them) getting each permission
+    # check
+    'PERMISSION_MANAGER_DRF_METRICS_SINKS': (),
+    # Timeout in seconds for caching list permissions of views, None to
+    # resolve them for each page
+    'PERMISSION_MANAGER_DRF_LIST_CACHE_TIMEOUT': None,
+    # What to do with N+1 queries in permission checks: 'warn', 'log',
+    # 'raise' or None to skip the detection
+    'PERMISSION_MANAGER_DRF_N_PLUS_ONE': None,
+}
+
+# Settings resolved on first use
+_values: dict[str, Any] = {}
+
+
+def __getattr__(name: str) -> Any:
+    """Get a setting, resolving it on first use.
+
+    `permission_manager_getter` is the function imported from
+    `PERMISSION_MANAGER_DRF_FOR_MODEL_GETTER` setting.
+
+    Args:
+        name (str): The setting name.
+
+    Returns:
+        Any: The value from Django settings, or the default one.
+
+    Raises:
+        AttributeError: If the setting is unknown.
+    """
+    if name in _values:
+        return _values[name]
+
+    if name == 'permission_manager_getter':
+        value = import_string(
+            __getattr__('PERMISSION_MANAGER_DRF_FOR_MODEL_GETTER')
+        )
+    elif name in DEFAULTS:
+        value = getattr(settings, name, DEFAULTS[name])
+    else:
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+
+    _values[name] = value
+    return value
+
+
+def reload_settings(*, setting: str, **_kwargs) -> None:
+    """Forget resolved settings when one of them is changed.
+
+    Args:
+        setting (str): The changed setting.
+    """
+    if setting in DEFAULTS:
+        _values.clear()
+
 
-# Import the permission manager getter function dynamically
-permission_manager_getter = import_string(
-    PERMISSION_MANAGER_DRF_FOR_MODEL_GETTER,
+setting_changed.connect(
+    reload_settings,
+    dispatch_uid='permission_manager_drf.settings.reload_settings',
 )
@@ -0,0 +1,86 @@
+import json
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+from permission_manager_drf.utils import clear_manager_registry
+
+
+def iter_chunks(objects: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split objects into chunks.
+
+    Querysets are iterated without filling their result cache.
+
+    Args:
+        objects (Iterable[Any]): The objects.
+        size (int): The maximum size of a chunk.
+
+    Yields:
+        list[Any]: The chunks.
+    """
+    if isinstance(objects, QuerySet):
+        iterator = objects.iterator(chunk_size=size)
+    else:
+        iterator = iter(objects)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class PermissionManagerStreamingMixin:
+    """Mixin to stream the list of a view as a JSON array.
+
+    The queryset is serialized in chunks, so `PermissionField` fields
+    resolve permissions for a chunk at once, and permission managers of a
+    chunk are dropped before the next one. Memory usage doesn't depend on
+    the number of objects. The list isn't paginated, so `PermissionField`
+    bitmasks can't be used in it.
+
+    Attributes:
+        permission_manager_stream_chunk_size (int): The number of objects
+            serialized at once. Defaults to 500.
+    """
+
+    permission_manager_stream_chunk_size: int = 500
+
+    def list(self, request, *args, **kwargs) -> StreamingHttpResponse:
+        """Stream the list of objects.
+
+        Args:
+            request: The request object.
+            *args: Positional arguments of the view.
+            **kwargs: Keyword arguments of the view.
+
+        Returns:
+            StreamingHttpResponse: The response with the JSON array.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(
+            self.stream_json(queryset),
+            content_type='application/json',
+        )
+
+    def stream_json(self, objects: Iterable[Any]) -> Iterator[bytes]:
+        """Serialize objects into a JSON array chunk by chunk.
+
+        Args:
+            objects (Iterable[Any]): The objects.
+
+        Yields:
+            bytes: Parts of the JSON array.
+        """
+        yield b'['
+        separator = b''
+        for chunk in iter_chunks(
+            objects, self.permission_manager_stream_chunk_size
+        ):
+            data = self.get_serializer(chunk, many=True).data
+            content = json.dumps(data, cls=JSONEncoder, ensure_ascii=False)
+            yield separator + content[1:-1].encode()
+            separator = b','
+
+            clear_manager_registry(self.request)
+        yield b']'
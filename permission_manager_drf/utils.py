@@ -1,16 +1,248 @@
+import inspect
 from contextlib import suppress
-from typing import TYPE_CHECKING
+from operator import attrgetter, methodcaller
+from typing import TYPE_CHECKING, Any, NamedTuple
+from weakref import WeakKeyDictionary
 
+from asgiref.sync import sync_to_async
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from rest_framework.permissions import SAFE_METHODS
+
+from permission_manager_drf import instrumentation, settings
+from permission_manager_drf.cache import (
+    MISSING,
+    get_list_permissions_cache_key,
+    get_result_cache,
+)
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
     from django.db.models import Model
-    from permission_manager import BasePermissionManager
+    from permission_manager import BasePermissionManager, PermissionResult
     from permission_manager.types import ResolveWithMessageResult
+    from rest_framework.request import Request
     from rest_framework.viewsets import GenericViewSet
 
 
+# Permission manager classes keyed by model
+_model_manager_classes: dict[type, Any] = {}
+
+# View attributes choosing the permission manager and its context
+VIEW_DISPATCH_ATTRS = frozenset(
+    (
+        'get_permission_manager',
+        'permission_manager',
+        'queryset',
+        'model',
+        'get_permission_manager_context',
+    )
+)
+
+# Permission manager class and context getters, keyed by view class
+_view_dispatch: 'WeakKeyDictionary[type, ViewDispatch]' = WeakKeyDictionary()
+
+
+class ViewDispatch(NamedTuple):
+    """Precomputed way to get a permission manager for a view class.
+
+    Attributes:
+        get_manager_class (Callable): A function that gets a view and returns
+            its permission manager class or None.
+        get_context (Callable): A function that gets a view and returns an
+            additional permission manager context.
+    """
+
+    get_manager_class: 'Callable[[Any], type[BasePermissionManager] | None]'
+    get_context: 'Callable[[Any], dict]'
+
+
+def _get_manager_class_from_attributes(
+    view: 'GenericViewSet',
+) -> type['BasePermissionManager'] | None:
+    if view_manager_class := getattr(view, 'get_permission_manager', None):
+        return view_manager_class()
+    if view_manager_class := getattr(view, 'permission_manager', None):
+        return view_manager_class
+    if (queryset := getattr(view, 'queryset', None)) is not None:
+        return get_model_permission_manager_class(queryset.model)
+    if model := getattr(view, 'model', None):
+        return get_model_permission_manager_class(model)
+    return None
+
+
+def _get_context_from_view(view: 'GenericViewSet') -> dict:
+    try:
+        return view.get_permission_manager_context()
+    except AttributeError:
+        return {}
+
+
+def _get_empty_context(_view: 'GenericViewSet') -> dict:
+    return {}
+
+
+# Looks up the permission manager and the context on the view instance
+INSTANCE_VIEW_DISPATCH = ViewDispatch(
+    get_manager_class=_get_manager_class_from_attributes,
+    get_context=_get_context_from_view,
+)
+
+
+def get_view_dispatch(view: 'GenericViewSet') -> ViewDispatch:
+    """Get the precomputed way to get a permission manager for a view.
+
+    The lookup order is the same as in `get_permission_manager_class`, but it
+    is resolved once per view class, so only views with the
+    `get_permission_manager` method call back on each request. Views which
+    define any of `VIEW_DISPATCH_ATTRS` on the instance (e.g. with
+    `as_view(permission_manager=...)`) are resolved against the instance.
+
+    Args:
+        view: The DRF view (or view class).
+
+    Returns:
+        ViewDispatch: The permission manager class and context getters.
+    """
+    if isinstance(view, type):
+        view_class = view
+    else:
+        view_class = type(view)
+        if not VIEW_DISPATCH_ATTRS.isdisjoint(getattr(view, '__dict__', ())):
+            return INSTANCE_VIEW_DISPATCH
+    if (dispatch := _view_dispatch.get(view_class)) is not None:
+        return dispatch
+
+    if getattr(view_class, 'get_permission_manager', None):
+        get_manager_class = methodcaller('get_permission_manager')
+    elif getattr(view_class, 'permission_manager', None):
+        get_manager_class = attrgetter('permission_manager')
+    elif getattr(view_class, 'queryset', None) is not None:
+
+        def get_manager_class(view: 'GenericViewSet') -> Any:
+            return get_model_permission_manager_class(view.queryset.model)
+
+    elif getattr(view_class, 'model', None):
+
+        def get_manager_class(view: 'GenericViewSet') -> Any:
+            return get_model_permission_manager_class(view.model)
+
+    else:
+        # Attributes can be set on the view instance
+        get_manager_class = _get_manager_class_from_attributes
+
+    dispatch = _view_dispatch[view_class] = ViewDispatch(
+        get_manager_class=get_manager_class,
+        get_context=(
+            _get_context_from_view
+            if hasattr(view_class, 'get_permission_manager_context')
+            else _get_empty_context
+        ),
+    )
+    return dispatch
+
+
+def get_permission_manager_class(
+    view: 'GenericViewSet',
+) -> type['BasePermissionManager']:
+    """Get a permission manager class from a view.
+
+    Args:
+        view: The DRF view from which to get the permission manager class.
+
+    Returns:
+        type[BasePermissionManager]: The permission manager class.
+
+    Raises:
+        ImproperlyConfigured: If the view does not have a way to determine
+            the permission manager.
+    """
+    if not (manager_class := get_view_dispatch(view).get_manager_class(view)):
+        msg = (
+            "You must define the 'get_permission_manager' method, "
+            "or the 'permission_manager' attribute, or the 'model' "
+            'attribute in the view.'
+        )
+        raise ImproperlyConfigured(msg)
+    return manager_class
+
+
+def get_permission_manager_context(view: 'GenericViewSet') -> dict:
+    """Get an additional permission manager context from a view.
+
+    Args:
+        view: The DRF view from which to get the context.
+
+    Returns:
+        dict: The result of `get_permission_manager_context` method of the
+            view, or an empty dict if the view doesn't define it.
+    """
+    return get_view_dispatch(view).get_context(view)
+
+
+def get_manager_registry(request: 'Request') -> dict | None:
+    """Get the request-scoped registry of caching permission managers.
+
+    The registry lets the permission class, the serializer fields and the
+    paginator share one manager (and its result cache) per instance. It's
+    available only for safe methods, because unsafe ones change instances
+    between the permission check and the serialization.
+
+    Args:
+        request (Request): The request being made.
+
+    Returns:
+        dict | None: The registry, or None if it isn't available for the
+            request.
+    """
+    if getattr(request, 'method', None) not in SAFE_METHODS:
+        return None
+
+    try:
+        return request.permission_manager_registry
+    except AttributeError:
+        request.permission_manager_registry = {}
+        return request.permission_manager_registry
+
+
+def clear_manager_registry(request: 'Request') -> None:
+    """Clear the request-scoped registry of caching permission managers.
+
+    Args:
+        request (Request): The request being made.
+    """
+    if (registry := get_manager_registry(request)) is not None:
+        registry.clear()
+
+
+def get_registered_manager(
+    request: 'Request',
+    key: tuple,
+    factory: 'Callable[[], BasePermissionManager]',
+) -> 'BasePermissionManager':
+    """Get a permission manager from the request registry or create it.
+
+    Args:
+        request (Request): The request being made.
+        key (tuple): The registry key. It contains the manager class and ids
+            of objects the manager is built for, the registry keeps the
+            objects alive, so the ids can't be reused during the request.
+        factory (Callable[[], BasePermissionManager]): A function creating
+            the manager if it isn't registered yet.
+
+    Returns:
+        BasePermissionManager: The permission manager.
+    """
+    if (registry := get_manager_registry(request)) is None:
+        return factory()
+
+    if (manager := registry.get(key)) is None:
+        manager = registry[key] = factory()
+    return manager
+
+
 def get_permission_manager(
     *,
     view: 'GenericViewSet',
@@ -19,6 +251,9 @@ def get_permission_manager(
 ) -> 'BasePermissionManager':
     """Get a permission manager instance from a view.
 
+    Caching managers are shared within a request, see
+    `get_manager_registry`.
+
     Args:
         view: The DRF view from which to get the permission manager.
         instance: The model instance (optional).
@@ -31,37 +266,166 @@ def get_permission_manager(
         ImproperlyConfigured: If the view does not have a way to determine
             the permission manager.
     """
-    manager_class = None
-    if view_manager_class := getattr(view, 'get_permission_manager', None):
-        manager_class = view_manager_class()
-    elif view_manager_class := getattr(view, 'permission_manager', None):
-        manager_class = view_manager_class
-    elif (queryset := getattr(view, 'queryset', None)) is not None:
-        manager_class = get_permission_manager_class_for_model(queryset.model)
-    elif model := getattr(view, 'model', None):
-        manager_class = get_permission_manager_class_for_model(model)
-
-    if not manager_class:
-        msg = (
-            "You must define the 'get_permission_manager' method, "
-            "or the 'permission_manager' attribute, or the 'model' "
-            'attribute in the view.'
+    manager_class = get_permission_manager_class(view)
+
+    def factory() -> 'BasePermissionManager':
+        return instrumentation.instrument(
+            manager_class(
+                user=view.request.user,
+                instance=instance,
+                cache=cache,
+                **get_permission_manager_context(view),
+            )
         )
-        raise ImproperlyConfigured(msg)
 
-    try:
-        context = view.get_permission_manager_context()
-    except AttributeError:
-        context = {}
+    if not cache:
+        return factory()
+    return get_registered_manager(
+        view.request,
+        key=(manager_class, id(instance), None),
+        factory=factory,
+    )
 
-    return manager_class(
-        user=view.request.user,
-        instance=instance,
-        cache=cache,
-        **context,
+
+def get_child_permission_manager(
+    *,
+    view: 'GenericViewSet',
+    manager_class: type['BasePermissionManager'],
+    parent: 'Model',
+    parent_permission_manager: 'BasePermissionManager',
+    **context,
+) -> 'BasePermissionManager':
+    """Get a caching child permission manager for a parent instance.
+
+    If the child manager class declares a key with `get_child_cache_key`,
+    managers are shared by parents with the same key within the request, so
+    each distinct child decision is computed once.
+
+    Args:
+        view: The DRF view.
+        manager_class (type[BasePermissionManager]): The child permission
+            manager class.
+        parent (Model): The parent instance.
+        parent_permission_manager (BasePermissionManager): The permission
+            manager of the parent instance.
+        **context: Additional context for the child manager.
+
+    Returns:
+        BasePermissionManager: An instance of the child permission manager.
+    """
+    key = (manager_class, id(None), id(parent))
+    if (
+        get_child_cache_key := getattr(
+            manager_class, 'get_child_cache_key', None
+        )
+    ) and (
+        child_key := get_child_cache_key(
+            parent=parent,
+            parent_permission_manager=parent_permission_manager,
+        )
+    ) is not None:
+        key = (manager_class, 'child', child_key)
+
+    return get_registered_manager(
+        view.request,
+        key=key,
+        factory=lambda: instrumentation.instrument(
+            manager_class(
+                user=view.request.user,
+                parent=parent,
+                parent_permission_manager=parent_permission_manager,
+                cache=True,
+                **context,
+            )
+        ),
     )
 
 
+def get_batch_context(
+    manager_class: type['BasePermissionManager'],
+    *,
+    user: Any,
+    instances: 'Sequence[Any]',
+    **context,
+) -> dict:
+    """Get a context shared by permission managers of many instances.
+
+    Args:
+        manager_class: The permission manager class.
+        user: The user for whom permissions are checked.
+        instances: The instances the managers are built for.
+        **context: The context of the managers.
+
+    Returns:
+        dict: The result of `get_batch_context` method of the manager class,
+            or an empty dict if the manager class doesn't define it.
+    """
+    if batch_context_getter := getattr(
+        manager_class, 'get_batch_context', None
+    ):
+        return batch_context_getter(user=user, instances=instances, **context)
+    return {}
+
+
+def get_permission_managers(
+    *,
+    view: 'GenericViewSet',
+    instances: 'Sequence[Model]',
+    cache: bool = False,
+) -> list['BasePermissionManager']:
+    """Get permission manager instances for many instances at once.
+
+    The permission manager class and the view context are resolved only once,
+    and the batch context of the manager class is shared by all managers.
+
+    Args:
+        view: The DRF view from which to get the permission managers.
+        instances: The model instances.
+        cache (bool): Whether to enable caching in the permission managers.
+
+    Returns:
+        list[BasePermissionManager]: Permission managers in the same order
+            as the instances.
+
+    Raises:
+        ImproperlyConfigured: If the view does not have a way to determine
+            the permission manager.
+    """
+    manager_class = get_permission_manager_class(view)
+    user = view.request.user
+    context = get_permission_manager_context(view)
+    context = {
+        **context,
+        **get_batch_context(
+            manager_class,
+            user=user,
+            instances=instances,
+            **context,
+        ),
+    }
+
+    def get_manager(instance: 'Model') -> 'BasePermissionManager':
+        def factory() -> 'BasePermissionManager':
+            return instrumentation.instrument(
+                manager_class(
+                    user=user,
+                    instance=instance,
+                    cache=cache,
+                    **context,
+                )
+            )
+
+        if not cache:
+            return factory()
+        return get_registered_manager(
+            view.request,
+            key=(manager_class, id(instance), None),
+            factory=factory,
+        )
+
+    return [get_manager(instance) for instance in instances]
+
+
 def get_permission_manager_class_for_model(
     model: 'Model',
 ) -> type['BasePermissionManager']:
@@ -77,6 +441,57 @@ def get_permission_manager_class_for_model(
     return model.permission_manager
 
 
+def get_model_permission_manager_class(
+    model: type['Model'],
+) -> type['BasePermissionManager'] | None:
+    """Get a permission manager class for a model with the configured getter.
+
+    The getter is defined by `PERMISSION_MANAGER_DRF_FOR_MODEL_GETTER`
+    setting. Results are memoized per model, call
+    `clear_model_permission_manager_classes` after changing the permission
+    manager of a model at runtime.
+
+    Args:
+        model (type[Model]): The model.
+
+    Returns:
+        type[BasePermissionManager] | None: The permission manager class.
+    """
+    try:
+        return _model_manager_classes[model]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable model-like objects aren't memoized
+        return settings.permission_manager_getter(model)
+
+    manager_class = _model_manager_classes[model] = (
+        settings.permission_manager_getter(model)
+    )
+    return manager_class
+
+
+def clear_model_permission_manager_classes() -> None:
+    """Forget memoized permission manager classes of models."""
+    _model_manager_classes.clear()
+
+
+def reload_model_getter(*, setting: str, **_kwargs) -> None:
+    """Forget memoized classes when the model getter setting is changed.
+
+    Args:
+        setting (str): The changed setting.
+    """
+    if setting == 'PERMISSION_MANAGER_DRF_FOR_MODEL_GETTER':
+        clear_model_permission_manager_classes()
+
+
+setting_changed.connect(
+    reload_model_getter,
+    dispatch_uid='permission_manager_drf.utils.reload_model_getter',
+)
+
+
 def get_list_permissions(
     view: 'GenericViewSet',
 ) -> list['ResolveWithMessageResult'] | None:
@@ -84,7 +499,9 @@ def get_list_permissions(
 
     This function retrieves the permission manager for the given view and
     resolves the permissions for the specified actions, including messages
-    if applicable.
+    if applicable. The results are cached for
+    `permission_manager_list_cache_timeout` seconds of the view, see
+    `PERMISSION_MANAGER_DRF_LIST_CACHE_TIMEOUT` setting.
 
     Args:
         view (GenericViewSet): The view for which to get the list permissions.
@@ -94,9 +511,82 @@ def get_list_permissions(
             with messages, or None if there was an error in getting the
             permission manager or resolving the permissions.
     """
-    with suppress(ImproperlyConfigured, AttributeError, TypeError):
+    with (
+        suppress(ImproperlyConfigured, AttributeError, TypeError),
+        instrumentation.source('list_permissions'),
+    ):
         manager = get_permission_manager(view=view, cache=True)
         actions = getattr(view, 'permission_manager_list_actions', None)
 
-        if manager and actions:
+        if not manager or not actions:
+            return None
+
+        timeout = getattr(
+            view,
+            'permission_manager_list_cache_timeout',
+            settings.PERMISSION_MANAGER_DRF_LIST_CACHE_TIMEOUT,
+        )
+        if not timeout:
             return manager.resolve(actions=actions, with_messages=True)
+
+        key = get_list_permissions_cache_key(
+            view=view,
+            manager=manager,
+            actions=actions,
+        )
+        if key is None:
+            return manager.resolve(actions=actions, with_messages=True)
+
+        result_cache = get_result_cache()
+        if (permissions := result_cache.get(key, MISSING)) is MISSING:
+            permissions = manager.resolve(actions=actions, with_messages=True)
+            result_cache.set(key, permissions, timeout)
+        return permissions
+
+
+async def ahas_permission(
+    manager: 'BasePermissionManager',
+    action: str,
+) -> 'bool | PermissionResult':
+    """Check a permission with a sync or async permission manager.
+
+    Sync permission managers are called in a thread, so they can use the ORM.
+
+    Args:
+        manager (BasePermissionManager): The permission manager.
+        action (str): The action to check permission for.
+
+    Returns:
+        bool | PermissionResult: The permission result.
+    """
+    if inspect.iscoroutinefunction(manager.has_permission):
+        return await manager.has_permission(action)
+    return await sync_to_async(manager.has_permission)(action)
+
+
+async def aresolve(
+    manager: 'BasePermissionManager',
+    *,
+    actions: 'Iterable[str]',
+    with_messages: bool = False,
+) -> dict[str, bool] | dict[str, 'ResolveWithMessageResult']:
+    """Resolve actions with a sync or async permission manager.
+
+    Sync permission managers are called in a thread, so they can use the ORM.
+
+    Args:
+        manager (BasePermissionManager): The permission manager.
+        actions (Iterable[str]): The list of actions to check.
+        with_messages (bool): Whether to include messages in the result.
+
+    Returns:
+        dict[str, bool] | dict[str, ResolveWithMessageResult]: The resolved
+            permissions.
+    """
+    if inspect.iscoroutinefunction(manager.resolve):
+        return await manager.resolve(
+            actions=actions, with_messages=with_messages
+        )
+    return await sync_to_async(manager.resolve)(
+        actions=actions, with_messages=with_messages
+    )
@@ -0,0 +1,371 @@
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+from django.db.models import Manager
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from permission_manager_drf.cache import CACHE_KEY_PREFIX, get_result_cache
+
+
+if TYPE_CHECKING:
+    from django.db.models import Model, QuerySet
+    from permission_manager import BasePermissionManager
+
+
+# Instance attribute with version keys of through objects about to be
+# removed by a many-to-many change, keyed by the dependency
+REMOVED_KEYS_ATTR = '_permission_manager_drf_removed_keys'
+
+
+@dataclass(kw_only=True, frozen=True)
+class CacheDependency:
+    """Dataclass for defining 'cache_dependencies' of a permission manager.
+
+    When an object of the model is saved or deleted (or its many-to-many
+    relation is changed), versions of related instances and users are bumped,
+    so all cached permission results for them become stale at once.
+
+    Attributes:
+        model (type[Model] | str): The model (or 'app_label.ModelName') the
+            permission results depend on. For many-to-many relations use the
+            through model, `add`, `remove` and `clear` are handled as saves
+            and deletes of its objects.
+        fields (Iterable[str] | None): The fields the permission results
+            depend on. Saves with `update_fields` that don't contain any of
+            them are ignored. Defaults to None (all fields).
+        instance (str | None): The path (separated by '__') from a changed
+            object to the instances checked by the manager. An empty string
+            means the changed object itself, None means no instances.
+            Defaults to ''.
+        user (str | None): The path (separated by '__') from a changed object
+            to the users whose permission results depend on it. An empty
+            string means the changed object itself, None means no users.
+            Defaults to None.
+    """
+
+    model: 'type[Model] | str'
+    fields: Iterable[str] | None = None
+    instance: str | None = ''
+    user: str | None = None
+
+
+def get_object_version_key(obj: 'Model') -> str:
+    """Get a cache key of an object version.
+
+    Args:
+        obj (Model): The object.
+
+    Returns:
+        str: The cache key.
+    """
+    label = obj._meta.label_lower  # noqa: SLF001
+    return f'{CACHE_KEY_PREFIX}:version:{label}:{obj.pk}'
+
+
+def get_user_version_key(user: Any) -> str:
+    """Get a cache key of a user version.
+
+    Args:
+        user: The user.
+
+    Returns:
+        str: The cache key.
+    """
+    return f'{CACHE_KEY_PREFIX}:version:user:{user.pk}'
+
+
+def get_version_keys(
+    *,
+    user: Any,
+    objects: Iterable[Any],
+) -> list[str]:
+    """Get cache keys of versions of a user and objects.
+
+    Args:
+        user: The user.
+        objects (Iterable[Any]): The objects. Objects without a primary key
+            are skipped.
+
+    Returns:
+        list[str]: The cache keys.
+    """
+    keys = [
+        get_object_version_key(obj)
+        for obj in objects
+        if getattr(obj, 'pk', None) is not None and hasattr(obj, '_meta')
+    ]
+    if getattr(user, 'pk', None) is not None:
+        keys.append(get_user_version_key(user))
+    return keys
+
+
+def get_versions(*, user: Any, objects: Iterable[Any]) -> str:
+    """Get the combined version of a user and objects.
+
+    Missing versions are initialized with the current time, so evicted
+    versions never match versions of cached results.
+
+    Args:
+        user: The user.
+        objects (Iterable[Any]): The objects.
+
+    Returns:
+        str: The combined version.
+    """
+    keys = get_version_keys(user=user, objects=objects)
+    version_cache = get_result_cache()
+    versions = version_cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            version_cache.add(key, time.time_ns(), None)
+            versions[key] = version_cache.get(key)
+
+    return '.'.join(str(versions[key]) for key in keys)
+
+
+def bump_versions(keys: Iterable[str]) -> None:
+    """Bump versions, making all cached results for them stale.
+
+    Args:
+        keys (Iterable[str]): Cache keys of the versions.
+    """
+    version_cache = get_result_cache()
+    for key in keys:
+        try:
+            version_cache.incr(key)
+        except ValueError:  # noqa: PERF203
+            version_cache.add(key, time.time_ns(), None)
+
+
+def bump_versions_on_commit(keys: Iterable[str], using: str | None) -> None:
+    """Bump versions now and once the current transaction is committed.
+
+    Until the commit, concurrent requests read the old rows and may cache
+    results under the bumped versions, so they are bumped again on commit.
+
+    Args:
+        keys (Iterable[str]): Cache keys of the versions.
+        using (str | None): The database alias of the transaction.
+    """
+    keys = list(keys)
+    bump_versions(keys)
+    if keys and transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(partial(bump_versions, keys), using=using)
+
+
+def resolve_path(obj: Any, path: str) -> Iterator[Any]:
+    """Get objects by a path from an object.
+
+    Args:
+        obj: The object.
+        path (str): The path separated by '__'. Related managers are
+            expanded to all their objects.
+
+    Yields:
+        Any: The objects.
+    """
+    if obj is None:
+        return
+    if not path:
+        yield obj
+        return
+
+    attr, _, rest = path.partition('__')
+    value = getattr(obj, attr, None)
+    if isinstance(value, Manager):
+        for related in value.all():
+            yield from resolve_path(related, rest)
+    else:
+        yield from resolve_path(value, rest)
+
+
+def get_dependency_version_keys(
+    dependency: CacheDependency,
+    obj: Any,
+) -> list[str]:
+    """Get cache keys of versions of instances and users related to an object.
+
+    Args:
+        dependency (CacheDependency): The dependency.
+        obj: The changed object.
+
+    Returns:
+        list[str]: The cache keys.
+    """
+    keys = []
+    if dependency.instance is not None:
+        keys.extend(
+            get_object_version_key(instance)
+            for instance in resolve_path(obj, dependency.instance)
+        )
+    if dependency.user is not None:
+        keys.extend(
+            get_user_version_key(user)
+            for user in resolve_path(obj, dependency.user)
+        )
+    return keys
+
+
+def bump_dependency_versions(
+    dependency: CacheDependency,
+    obj: Any,
+    using: str | None = None,
+) -> None:
+    """Bump versions of instances and users related to a changed object.
+
+    Versions are bumped again once the transaction is committed, see
+    `bump_versions_on_commit`.
+
+    Args:
+        dependency (CacheDependency): The dependency.
+        obj: The changed object.
+        using (str | None): The database alias of the change.
+    """
+    bump_versions_on_commit(
+        get_dependency_version_keys(dependency, obj), using
+    )
+
+
+def get_through_objects(
+    *,
+    through: type['Model'],
+    instance: 'Model',
+    reverse: bool,
+    model: type['Model'],
+    pk_set: set | None,
+) -> 'QuerySet':
+    """Get objects of a through model changed by a many-to-many change.
+
+    Args:
+        through (type[Model]): The through model.
+        instance (Model): The instance whose relation is changed.
+        reverse (bool): Whether the relation is changed from the reverse
+            side.
+        model (type[Model]): The model of added or removed objects.
+        pk_set (set | None): Primary keys of added or removed objects, None
+            for all objects of the relation.
+
+    Returns:
+        QuerySet: The through objects.
+    """
+    owner = model if reverse else type(instance)
+    field = next(
+        field
+        for field in owner._meta.many_to_many  # noqa: SLF001
+        if field.remote_field.through is through
+    )
+    instance_name = field.m2m_field_name()
+    related_name = field.m2m_reverse_field_name()
+    if reverse:
+        instance_name, related_name = related_name, instance_name
+
+    queryset = through._default_manager.filter(  # noqa: SLF001
+        **{instance_name: instance.pk}
+    )
+    if pk_set is not None:
+        queryset = queryset.filter(**{f'{related_name}__in': pk_set})
+    return queryset
+
+
+def connect_dependency(dependency: CacheDependency) -> None:
+    """Connect signal receivers bumping versions for a dependency.
+
+    Args:
+        dependency (CacheDependency): The dependency.
+    """
+    fields = set(dependency.fields or ())
+    dispatch_uid = f'{CACHE_KEY_PREFIX}:{id(dependency)}'
+
+    def on_save(
+        *,
+        instance: 'Model',
+        using: str,
+        update_fields: Iterable[str] | None = None,
+        **_kwargs,
+    ) -> None:
+        if (
+            fields
+            and update_fields is not None
+            and not fields & set(update_fields)
+        ):
+            return
+        bump_dependency_versions(dependency, instance, using)
+
+    def on_delete(
+        *,
+        instance: 'Model',
+        using: str,
+        **_kwargs,
+    ) -> None:
+        bump_dependency_versions(dependency, instance, using)
+
+    def on_m2m_change(  # noqa: PLR0913
+        *,
+        sender: type['Model'],
+        instance: 'Model',
+        action: str,
+        reverse: bool,
+        model: type['Model'],
+        pk_set: set | None,
+        using: str,
+        **_kwargs,
+    ) -> None:
+        # Keys of through objects about to be removed are kept on the
+        # instance and bumped again once the objects are removed
+        removed_keys = instance.__dict__.setdefault(REMOVED_KEYS_ATTR, {})
+        if action in {'post_remove', 'post_clear'}:
+            bump_versions_on_commit(
+                removed_keys.pop(dispatch_uid, ()),
+                using,
+            )
+            return
+        if action not in {'post_add', 'pre_remove', 'pre_clear'}:
+            return
+
+        # Paths start from through objects, as for their saves and deletes
+        keys = [
+            key
+            for obj in get_through_objects(
+                through=sender,
+                instance=instance,
+                reverse=reverse,
+                model=model,
+                pk_set=pk_set,
+            )
+            for key in get_dependency_version_keys(dependency, obj)
+        ]
+        bump_versions_on_commit(keys, using)
+        if action != 'post_add':
+            removed_keys[dispatch_uid] = keys
+
+    for signal, receiver in (
+        (post_save, on_save),
+        (post_delete, on_delete),
+        (m2m_changed, on_m2m_change),
+    ):
+        signal.connect(
+            receiver,
+            sender=dependency.model,
+            weak=False,
+            dispatch_uid=dispatch_uid,
+        )
+
+
+def register_cache_dependencies(
+    manager_class: type['BasePermissionManager'],
+) -> None:
+    """Connect signal receivers for cache dependencies of a manager class.
+
+    Inherited dependencies are connected only once.
+
+    Args:
+        manager_class (type[BasePermissionManager]): The permission manager
+            class.
+    """
+    for dependency in getattr(manager_class, 'cache_dependencies', ()):
+        connect_dependency(dependency)
@@ -1,5 +1,5 @@
 from django.db import models
-from django.db.models import TextChoices
+from django.db.models import Q, TextChoices
 from permission_manager import PermissionResult
 
 from permission_manager_drf.managers import DRFPermissionManager
@@ -43,6 +43,11 @@ class TestModelPermissionManager(DRFPermissionManager):
     def has_list_permission(self) -> bool:
         return True
 
+    def get_queryset_filter(self, action: str) -> Q | None:
+        if action == 'view' and not self.user.is_staff:
+            return Q(status=TestModelStatus.PUBLISHED)
+        return None
+
     def has_custom_non_detail_permission(self) -> bool:
         return PermissionResult(
             message='Only staff can do it',
@@ -94,3 +99,17 @@ class TestChildModel(models.Model):
 
     def __str__(self) -> str:
         return self.title
+
+
+class TestTagModel(models.Model):
+    __test__ = False
+
+    title = models.CharField(max_length=100)
+    test_models = models.ManyToManyField(TestModel, related_name='tags')
+
+    class Meta:
+        verbose_name = 'Test tag model'
+        ordering = ['pk']
+
+    def __str__(self) -> str:
+        return self.title
@@ -1,7 +1,30 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import (
+    CursorPagination,
+    LimitOffsetPagination,
+    PageNumberPagination,
+)
 
-from permission_manager_drf.pagination import PermissionManagerPaginationMixin
+from permission_manager_drf.pagination import (
+    PermissionManagerCursorPagination,
+    PermissionManagerPaginationMixin,
+)
 
 
 class TestPagination(PermissionManagerPaginationMixin, PageNumberPagination):
     page_size = 10
+
+
+class TestLimitOffsetPagination(
+    PermissionManagerPaginationMixin,
+    LimitOffsetPagination,
+):
+    default_limit = 10
+
+
+class TestCursorPagination(PermissionManagerPaginationMixin, CursorPagination):
+    page_size = 10
+    ordering = 'pk'
+
+
+class TestKeysetPagination(PermissionManagerCursorPagination):
+    page_size = 2
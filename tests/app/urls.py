@@ -1,10 +1,29 @@
 from rest_framework.routers import SimpleRouter
 
-from tests.app.views import TestModelViewSet
+from tests.app.views import (
+    TestFilteredModelViewSet,
+    TestModelViewSet,
+    TestQuerysetModelViewSet,
+    TestStreamingModelViewSet,
+)
 
 
 router = SimpleRouter()
 router.register('model', TestModelViewSet)
-
+router.register(
+    'filtered_model',
+    TestFilteredModelViewSet,
+    basename='filtered_model',
+)
+router.register(
+    'queryset_model',
+    TestQuerysetModelViewSet,
+    basename='queryset_model',
+)
+router.register(
+    'streaming_model',
+    TestStreamingModelViewSet,
+    basename='streaming_model',
+)
 
 urlpatterns = router.urls
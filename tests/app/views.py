@@ -5,7 +5,13 @@ from rest_framework.response import Response
 from rest_framework.serializers import ModelSerializer
 from rest_framework.viewsets import ModelViewSet
 
-from permission_manager_drf import ManagerPermission, PermissionField
+from permission_manager_drf import (
+    ManagerFilterBackend,
+    ManagerPermission,
+    PermissionField,
+    PermissionManagerQuerysetMixin,
+    PermissionManagerStreamingMixin,
+)
 from permission_manager_drf.fields import PermissionFieldChild
 from tests.app.models import (
     TestChildModelPermissionManager,
@@ -60,3 +66,25 @@ class TestModelViewSet(ModelViewSet):
         self.action = None
         self.get_object()
         return Response(status=status.HTTP_200_OK)
+
+
+class TestFilteredModelViewSet(TestModelViewSet):
+    __test__ = False
+
+    filter_backends = [ManagerFilterBackend]
+
+
+class TestQuerysetModelViewSet(
+    PermissionManagerQuerysetMixin,
+    TestModelViewSet,
+):
+    __test__ = False
+
+
+class TestStreamingModelViewSet(
+    PermissionManagerStreamingMixin,
+    TestModelViewSet,
+):
+    __test__ = False
+
+    permission_manager_stream_chunk_size = 2
@@ -48,6 +48,16 @@ def pytest_configure() -> None:
     django.setup()
 
 
+@pytest.fixture(autouse=True)
+def clear_model_permission_manager_classes():
+    from permission_manager_drf.utils import (  # noqa: PLC0415
+        clear_model_permission_manager_classes,
+    )
+
+    # Tests change permission managers of models
+    clear_model_permission_manager_classes()
+
+
 @pytest.fixture
 def admin_client(client):
     from django.contrib.auth.models import User  # noqa: PLC0415
@@ -0,0 +1,251 @@
+import asyncio
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import ClassVar
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from permission_manager import PermissionResult
+from rest_framework import serializers
+
+from permission_manager_drf import (
+    AsyncDRFPermissionManager,
+    AsyncManagerPermission,
+    ManagerPermission,
+    PermissionField,
+    PermissionFieldChild,
+)
+from tests.app.models import TestModel, TestModelPermissionManager
+from tests.app.views import TestModelViewSet
+
+
+class AsyncTestModelPermissionManager(AsyncDRFPermissionManager):
+    async def has_update_permission(self) -> bool:
+        await asyncio.sleep(0)
+        return self.user.is_staff
+
+    async def has_view_permission(self) -> bool:
+        return True
+
+    async def has_publish_permission(self) -> bool:
+        return PermissionResult(
+            message='Only staff can do it',
+            value=self.user.is_staff,
+        )
+
+
+class AsyncTestChildModelPermissionManager(AsyncDRFPermissionManager):
+    async def has_create_permission(self) -> bool:
+        return PermissionResult(
+            message='Parent is not editable',
+            value=await self.parent_permission_manager.has_permission(
+                'update'
+            ),
+        )
+
+
+def get_view(manager_class, action=None, *, is_staff=False):
+    return SimpleNamespace(
+        action=action,
+        request=SimpleNamespace(user=SimpleNamespace(is_staff=is_staff)),
+        permission_manager=manager_class,
+        view_is_async=True,
+    )
+
+
+@pytest.mark.parametrize('action', ['create', 'delete', 'destroy', 'list'])
+def test_async_drf_permission_manager(action):
+    manager = AsyncDRFPermissionManager()
+
+    assert asyncio.run(manager.has_permission(action)) is False
+
+
+def test_async_resolve():
+    manager = AsyncTestModelPermissionManager(
+        user=SimpleNamespace(is_staff=False)
+    )
+
+    assert asyncio.run(
+        manager.resolve(
+            actions=['publish', 'retrieve', 'update'], with_messages=True
+        )
+    ) == {
+        'publish': {'allow': False, 'messages': ['Only staff can do it']},
+        'retrieve': {'allow': True, 'messages': None},
+        'update': {'allow': False, 'messages': None},
+    }
+
+
+@pytest.mark.parametrize(
+    'manager_class',
+    [AsyncTestModelPermissionManager, TestModelPermissionManager],
+)
+@pytest.mark.parametrize(
+    ('action', 'is_staff', 'expected'),
+    [
+        ('update', True, True),
+        ('partial_update', False, False),
+        (None, False, True),
+    ],
+)
+def test_async_manager_permission(manager_class, action, is_staff, expected):
+    view = get_view(manager_class, action, is_staff=is_staff)
+    instance = TestModel(title='Test')
+
+    assert (
+        asyncio.run(
+            AsyncManagerPermission().has_object_permission(
+                request=view.request, view=view, obj=instance
+            )
+        )
+        is expected
+    )
+
+
+def test_async_manager_permission_detail_without_object():
+    view = get_view(AsyncTestModelPermissionManager, 'update')
+
+    assert asyncio.run(
+        AsyncManagerPermission().has_permission(
+            request=view.request, view=view
+        )
+    )
+
+
+def test_async_permission_field():
+    class TestSerializer(serializers.Serializer):
+        permissions = PermissionField(
+            actions=['update', 'publish'],
+            children=[
+                PermissionFieldChild(
+                    name='child_model',
+                    manager=AsyncTestChildModelPermissionManager,
+                    actions=['create'],
+                )
+            ],
+        )
+
+    view = get_view(AsyncTestModelPermissionManager)
+    field = TestSerializer(
+        context={'view': view, 'request': view.request}
+    ).fields['permissions']
+
+    assert asyncio.run(field.ato_representation(TestModel(title='Test'))) == {
+        'update': {'allow': False, 'messages': None},
+        'publish': {'allow': False, 'messages': ['Only staff can do it']},
+        'child_model': {
+            'create': {'allow': False, 'messages': ['Parent is not editable']},
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    'manager_class',
+    [AsyncTestModelPermissionManager, TestModelPermissionManager],
+)
+@pytest.mark.parametrize(
+    ('stop_on_first_denial', 'expected'), [(False, [1, 2]), (True, [1])]
+)
+def test_async_check_objects(manager_class, stop_on_first_denial, expected):
+    objs = [TestModel(pk=pk, title=f'Test {pk}') for pk in (1, 2)]
+
+    denied = asyncio.run(
+        AsyncManagerPermission().check_objects(
+            None,
+            get_view(manager_class, 'update'),
+            objs,
+            stop_on_first_denial=stop_on_first_denial,
+        )
+    )
+
+    assert [item.obj.pk for item in denied] == expected
+
+
+@pytest.mark.parametrize(
+    ('method', 'action', 'args'),
+    [
+        ('has_permission', 'create', ()),
+        ('has_object_permission', 'update', (TestModel(title='Test'),)),
+    ],
+)
+def test_sync_permission_with_async_manager(method, action, args):
+    view = get_view(AsyncTestModelPermissionManager, action)
+
+    with pytest.raises(ImproperlyConfigured, match='AsyncManagerPermission'):
+        getattr(ManagerPermission(), method)(view.request, view, *args)
+
+
+def test_sync_check_objects_with_async_manager():
+    view = get_view(AsyncTestModelPermissionManager, 'update')
+
+    with pytest.raises(ImproperlyConfigured, match='AsyncManagerPermission'):
+        ManagerPermission().check_objects(
+            view.request, view, [TestModel(title='Test')]
+        )
+
+
+@pytest.mark.parametrize(
+    ('method', 'args'),
+    [
+        ('has_permission', ()),
+        ('has_object_permission', (TestModel(title='Test'),)),
+        ('check_objects', ([TestModel(title='Test')],)),
+    ],
+)
+def test_async_permission_in_sync_view(method, args):
+    view = get_view(AsyncTestModelPermissionManager, 'update')
+    view.view_is_async = False
+
+    with pytest.raises(ImproperlyConfigured, match='async views'):
+        getattr(AsyncManagerPermission(), method)(view.request, view, *args)
+
+
+def test_async_permission_is_coroutine_function():
+    permission = AsyncManagerPermission()
+
+    assert all(
+        asyncio.iscoroutinefunction(getattr(permission, method))
+        for method in ('has_permission', 'has_object_permission')
+    )
+
+
+@pytest.mark.django_db
+def test_async_permission_in_drf_view(admin_client, monkeypatch):
+    monkeypatch.setattr(
+        TestModelViewSet, 'permission_classes', [AsyncManagerPermission]
+    )
+
+    with pytest.raises(ImproperlyConfigured, match='async views'):
+        admin_client.get(path='/model/')
+
+
+class BulkAsyncPermissionManager(AsyncTestModelPermissionManager):
+    calls: ClassVar[list] = []
+
+    @classmethod
+    async def check_instances(cls, action, managers) -> AsyncIterator:
+        cls.calls.append((action, len(managers)))
+        for manager in managers:
+            yield manager, await manager.has_permission(action)
+
+
+@pytest.mark.parametrize(
+    'manager_class',
+    [AsyncTestModelPermissionManager, BulkAsyncPermissionManager],
+)
+def test_async_check_objects_action(manager_class):
+    BulkAsyncPermissionManager.calls.clear()
+    objs = [TestModel(pk=pk, title=f'Test {pk}') for pk in (1, 2)]
+
+    denied = asyncio.run(
+        AsyncManagerPermission().check_objects(
+            None,
+            get_view(manager_class, 'bulk_update'),
+            objs,
+            action='update',
+        )
+    )
+
+    assert [item.obj.pk for item in denied] == [1, 2]
+    if manager_class is BulkAsyncPermissionManager:
+        assert BulkAsyncPermissionManager.calls == [('update', 2)]
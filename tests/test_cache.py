@@ -0,0 +1,277 @@
+from collections import Counter
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from permission_manager_drf.cache import (
+    get_context_fingerprint,
+    get_result_cache_key,
+)
+from permission_manager_drf.utils import get_list_permissions
+from tests.app.models import (
+    TestModel,
+    TestModelPermissionManager,
+    TestModelStatus,
+    TestTagModel,
+)
+from tests.app.views import TestModelViewSet
+
+
+calls = Counter()
+
+
+class CachedTestModelPermissionManager(TestModelPermissionManager):
+    cache_timeouts = {'view': 60}
+
+    def has_view_permission(self) -> bool:
+        calls['view'] += 1
+        return super().has_view_permission()
+
+    def has_update_permission(self) -> bool:
+        calls['update'] += 1
+        return super().has_update_permission()
+
+    def has_create_permission(self) -> bool:
+        calls['create'] += 1
+        return super().has_create_permission()
+
+
+class ContextTestModelViewSet(TestModelViewSet):
+    permission_manager_list_actions = ('create',)
+    permission_manager_list_cache_timeout = 60
+    permission_manager_context: dict = {}
+
+    def get_permission_manager_context(self) -> dict:
+        return self.permission_manager_context
+
+
+class StaffTestModelPermissionManager(CachedTestModelPermissionManager):
+    def has_create_permission(self) -> bool:
+        return not super().has_create_permission()
+
+
+class DynamicManagerViewSet(ContextTestModelViewSet):
+    permission_manager_class = CachedTestModelPermissionManager
+
+    def get_permission_manager(self) -> type:
+        return self.permission_manager_class
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    calls.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('action', ['view', 'retrieve'])
+def test_result_cache(action):
+    user = User.objects.create_user(username='user')
+    instance = TestModel.objects.create(title='Test')
+
+    for _ in range(2):
+        manager = CachedTestModelPermissionManager(
+            user=user, instance=instance
+        )
+        assert manager.has_permission(action) is False
+
+    assert calls['view'] == 1
+
+
+@pytest.mark.django_db
+def test_result_cache_key_depends_on_user():
+    instance = TestModel.objects.create(title='Test')
+
+    for username in ('user', 'another'):
+        user = User.objects.create_user(username=username)
+        CachedTestModelPermissionManager(
+            user=user, instance=instance
+        ).has_permission('view')
+
+    assert calls['view'] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_result_cache_without_timeout():
+    user = User.objects.create_user(username='user')
+    instance = TestModel.objects.create(title='Test')
+
+    for _ in range(2):
+        CachedTestModelPermissionManager(
+            user=user, instance=instance
+        ).has_permission('update')
+
+    assert calls['update'] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_result_cache_unsaved_instance():
+    user = User.objects.create_user(username='user')
+    manager = CachedTestModelPermissionManager(
+        user=user, instance=TestModel(title='Test')
+    )
+
+    for _ in range(2):
+        manager.has_permission('view')
+
+    assert calls['view'] == 2  # noqa: PLR2004
+    assert get_result_cache_key(manager=manager, action='view') is None
+
+
+@pytest.mark.django_db
+def test_result_cache_key_depends_on_model():
+    user = User.objects.create_user(username='user')
+    instance = TestModel.objects.create(title='Test')
+    tag = TestTagModel.objects.create(title='Test')
+    assert instance.pk == tag.pk
+
+    instance_key, tag_key = (
+        get_result_cache_key(
+            manager=CachedTestModelPermissionManager(user=user, instance=obj),
+            action='view',
+        )
+        for obj in (instance, tag)
+    )
+
+    assert instance_key != tag_key
+    assert f':app.testmodel:{instance.pk}:' in instance_key
+    assert f':app.testtagmodel:{tag.pk}:' in tag_key
+
+
+@pytest.mark.django_db
+def test_result_cache_key_depends_on_context():
+    user = User.objects.create_user(username='user')
+    instance = TestModel.objects.create(title='Test')
+
+    for status in (TestModelStatus.DRAFT, TestModelStatus.PUBLISHED) * 2:
+        CachedTestModelPermissionManager(
+            user=user, instance=instance, status=status
+        ).has_permission('view')
+
+    assert calls['view'] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_result_cache_unstable_context():
+    user = User.objects.create_user(username='user')
+    instance = TestModel.objects.create(title='Test')
+    view = object()
+
+    for _ in range(2):
+        manager = CachedTestModelPermissionManager(
+            user=user, instance=instance, view=view
+        )
+        manager.has_permission('view')
+
+    assert calls['view'] == 2  # noqa: PLR2004
+    assert get_result_cache_key(manager=manager, action='view') is None
+
+
+@pytest.mark.django_db
+def test_result_cache_child_manager():
+    user = User.objects.create_user(username='user')
+    parent = TestModel.objects.create(title='Test')
+    parent_manager = CachedTestModelPermissionManager(
+        user=user, instance=parent
+    )
+    manager = CachedTestModelPermissionManager(
+        user=user, parent=parent, parent_permission_manager=parent_manager
+    )
+
+    assert get_result_cache_key(manager=manager, action='view') is not None
+
+
+@pytest.mark.django_db
+def test_context_fingerprint():
+    instance = TestModel.objects.create(title='Test')
+    context = {
+        'instance': instance,
+        'status': TestModelStatus.DRAFT,
+        'options': {'limit': Decimal('1.5'), 'day': date(2024, 1, 1)},
+        'statuses': {TestModelStatus.DRAFT, TestModelStatus.PUBLISHED},
+        'ids': [1, 2],
+    }
+    same_context = {
+        'ids': [1, 2],
+        'statuses': {TestModelStatus.PUBLISHED, TestModelStatus.DRAFT},
+        'options': {'day': date(2024, 1, 1), 'limit': Decimal('1.5')},
+        'status': TestModelStatus.DRAFT,
+        'instance': TestModel.objects.get(pk=instance.pk),
+    }
+
+    assert get_context_fingerprint(context) is not None
+    assert get_context_fingerprint(context) == get_context_fingerprint(
+        same_context
+    )
+    assert get_context_fingerprint(context) != get_context_fingerprint(
+        {**context, 'ids': [2, 1]}
+    )
+
+
+@pytest.mark.parametrize(
+    'context',
+    [
+        {'view': object()},
+        {'views': [object()]},
+        {'options': {'view': object()}},
+        {'instance': TestModel(title='Test')},
+    ],
+)
+def test_context_fingerprint_unstable(context):
+    assert get_context_fingerprint(context) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('get_context', 'expected_calls'),
+    [
+        (lambda _view: {'status': TestModelStatus.DRAFT}, 1),
+        (lambda view: {'view': view, 'request': view.request}, 2),
+    ],
+)
+def test_list_permissions_cache_context(
+    monkeypatch, get_context, expected_calls
+):
+    monkeypatch.setattr(
+        TestModel, 'permission_manager', CachedTestModelPermissionManager
+    )
+    user = User.objects.create_user(username='user', is_staff=True)
+    results = []
+    for _ in range(2):
+        request = Request(APIRequestFactory().get('/model/'))
+        request.user = user
+        view = ContextTestModelViewSet(
+            request=request, action='list', format_kwarg=None
+        )
+        view.permission_manager_context = get_context(view)
+        results.append(get_list_permissions(view))
+
+    assert results[0] == results[1]
+    assert calls['create'] == expected_calls
+
+
+@pytest.mark.django_db
+def test_list_permissions_cache_manager_class():
+    user = User.objects.create_user(username='user', is_staff=True)
+    results = []
+    for manager_class in (
+        CachedTestModelPermissionManager,
+        StaffTestModelPermissionManager,
+    ):
+        request = Request(APIRequestFactory().get('/model/'))
+        request.user = user
+        view = DynamicManagerViewSet(
+            request=request, action='list', format_kwarg=None
+        )
+        view.permission_manager_class = manager_class
+        results.append(get_list_permissions(view)['create']['allow'])
+
+    assert results == [True, False]
+    assert calls['create'] == 2  # noqa: PLR2004
@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.auth.models import User
+from rest_framework import serializers
+
+from permission_manager_drf import PermissionField
+from permission_manager_drf.exceptions import (
+    NPlusOneQueriesError,
+    NPlusOneQueriesWarning,
+)
+from tests.app.models import TestModel, TestModelPermissionManager
+
+
+class QueryingPermissionManager(TestModelPermissionManager):
+    def has_update_permission(self) -> bool:
+        return TestModel.objects.filter(
+            pk=self.instance.pk, title='Editable'
+        ).exists()
+
+
+class PermissionsSerializer(serializers.Serializer):
+    permissions = PermissionField(actions=('update', 'publish'))
+
+
+def serialize(instances):
+    view = SimpleNamespace(
+        request=SimpleNamespace(
+            user=User.objects.create_user(username='user', is_staff=True)
+        ),
+        permission_manager=QueryingPermissionManager,
+    )
+    return PermissionsSerializer(
+        instances, many=True, context={'view': view, 'request': None}
+    ).data
+
+
+@pytest.fixture
+def set_mode(settings):
+    def set_mode(mode: str | None) -> None:
+        settings.PERMISSION_MANAGER_DRF_N_PLUS_ONE = mode
+
+    return set_mode
+
+
+@pytest.mark.django_db
+def test_raise(set_mode):
+    set_mode('raise')
+    instances = [TestModel.objects.create(title=str(i)) for i in range(3)]
+
+    with pytest.raises(NPlusOneQueriesError) as exc_info:
+        serialize(instances)
+
+    message = str(exc_info.value)
+    assert 'QueryingPermissionManager' in message
+    assert "'update' action, executed 3 times" in message
+
+
+@pytest.mark.django_db
+def test_warn(set_mode):
+    set_mode('warn')
+    instances = [TestModel.objects.create(title=str(i)) for i in range(3)]
+
+    with pytest.warns(NPlusOneQueriesWarning, match='N\\+1 queries'):
+        data = serialize(instances)
+
+    assert len(data) == len(instances)
+
+
+@pytest.mark.django_db
+def test_log(set_mode, caplog):
+    set_mode('log')
+    instances = [TestModel.objects.create(title=str(i)) for i in range(3)]
+
+    serialize(instances)
+
+    [record] = caplog.records
+    assert record.name == 'permission_manager_drf'
+    assert 'executed 3 times' in record.getMessage()
+
+
+@pytest.mark.django_db
+def test_single_row(set_mode):
+    set_mode('raise')
+    data = serialize([TestModel.objects.create(title='Editable')])
+
+    assert data[0]['permissions']['update'] == {
+        'allow': True,
+        'messages': None,
+    }
+
+
+@pytest.mark.django_db
+def test_disabled(set_mode):
+    set_mode(None)
+    instances = [TestModel.objects.create(title=str(i)) for i in range(3)]
+
+    assert len(serialize(instances)) == len(instances)
@@ -0,0 +1,69 @@
+import pytest
+from rest_framework import status
+
+from permission_manager_drf.filters import ManagerFilterBackend
+from tests.app.models import TestModel, TestModelStatus
+from tests.app.views import TestFilteredModelViewSet
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('client_name', 'expected_titles'),
+    [
+        ('admin_client', ['Draft', 'Published']),
+        ('user_client', ['Published']),
+    ],
+)
+def test_filter_backend_list(request, client_name, expected_titles):
+    TestModel.objects.create(title='Draft', status=TestModelStatus.DRAFT)
+    TestModel.objects.create(
+        title='Published', status=TestModelStatus.PUBLISHED
+    )
+
+    client = request.getfixturevalue(client_name)
+    response = client.get(path='/filtered_model/')
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert data['count'] == len(expected_titles)
+    assert [row['title'] for row in data['results']] == expected_titles
+
+
+@pytest.mark.django_db
+def test_filter_backend_detail_not_found(user_client):
+    instance = TestModel.objects.create(title='Draft')
+
+    response = user_client.get(path=f'/filtered_model/{instance.pk}/')
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_filter_backend_custom_action(user_client, mocker):
+    TestModel.objects.create(title='Draft', status=TestModelStatus.DRAFT)
+    mocker.patch.object(
+        TestFilteredModelViewSet,
+        attribute='permission_manager_filter_action',
+        new='update',
+        create=True,
+    )
+
+    response = user_client.get(path='/filtered_model/')
+
+    assert response.json()['count'] == 1
+
+
+def test_filter_backend_without_filter_queryset(mocker):
+    manager = object()
+    mocker.patch(
+        'permission_manager_drf.filters.get_permission_manager',
+        return_value=manager,
+    )
+    queryset = mocker.sentinel.queryset
+
+    assert (
+        ManagerFilterBackend().filter_queryset(
+            request=None, queryset=queryset, view=None
+        )
+        is queryset
+    )
@@ -0,0 +1,204 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.auth.models import User
+from permission_manager import AsyncPermissionManager, PermissionManager
+from rest_framework import status
+
+from permission_manager_drf import (
+    DRFPermissionManager,
+    ManagerPermission,
+    instrumentation,
+)
+from permission_manager_drf.instrumentation import (
+    InMemoryMetricsSink,
+    permission_checked,
+)
+from permission_manager_drf.middleware import get_server_timing
+from tests.app.models import TestModel, TestModelPermissionManager
+from tests.app.views import TestModelViewSet
+
+
+class PlainPermissionManager(PermissionManager):
+    def has_list_permission(self) -> bool:
+        return True
+
+
+class AsyncPlainPermissionManager(AsyncPermissionManager):
+    async def has_list_permission(self) -> bool:
+        return True
+
+
+class QueryingParentPermissionManager(TestModelPermissionManager):
+    def has_update_permission(self) -> bool:
+        return User.objects.filter(pk=self.user.pk, is_staff=True).exists()
+
+
+class DelegatingChildPermissionManager(DRFPermissionManager):
+    def has_create_permission(self) -> bool:
+        return self.parent_permission_manager.has_permission('update')
+
+
+@pytest.fixture
+def sink():
+    sink = InMemoryMetricsSink()
+    instrumentation.add_sink(sink)
+    yield sink
+    instrumentation.remove_sink(sink)
+
+
+def test_disabled_without_sinks():
+    assert instrumentation.is_enabled() is False
+
+
+@pytest.mark.django_db
+def test_sink(sink):
+    user = User.objects.create_user(username='user')
+    instance = TestModel.objects.create(title='Test')
+    manager = TestModelPermissionManager(
+        user=user,
+        instance=instance,
+        cache=True,
+    )
+
+    for _ in range(2):
+        manager.has_permission('update')
+
+    entry = sink.get(TestModelPermissionManager, 'update')
+    assert entry.count == 2  # noqa: PLR2004
+    assert entry.allowed == 0
+    assert entry.denied == 2  # noqa: PLR2004
+    assert entry.cache_hits == 1
+    assert entry.cache_hit_ratio == 0.5  # noqa: PLR2004
+    assert entry.max_duration <= entry.total_duration
+
+
+@pytest.mark.django_db
+def test_sources(sink, admin_client):
+    instance = TestModel.objects.create(title='Test')
+
+    response = admin_client.get(f'/model/{instance.pk}/')
+    assert response.status_code == status.HTTP_200_OK
+
+    sources = {
+        source
+        for manager, action, source in sink.entries
+        if manager is TestModelPermissionManager and action == 'retrieve'
+    }
+    assert sources == {'permission'}
+    assert (TestModelPermissionManager, 'update', 'field') in sink.entries
+
+
+@pytest.mark.django_db
+def test_list_permissions_source(sink, admin_client, monkeypatch):
+    monkeypatch.setattr(
+        TestModelViewSet,
+        'permission_manager_list_actions',
+        ['create'],
+        raising=False,
+    )
+
+    response = admin_client.get('/model/')
+    assert response.status_code == status.HTTP_200_OK
+    assert (
+        TestModelPermissionManager,
+        'create',
+        'list_permissions',
+    ) in sink.entries
+
+
+@pytest.mark.django_db
+def test_send_signal():
+    user = User.objects.create_user(username='user')
+    instance = TestModel.objects.create(title='Test')
+    events = []
+
+    def receiver(*, event, **_kwargs) -> None:
+        events.append(event)
+
+    instrumentation.add_sink(instrumentation.send_signal)
+    permission_checked.connect(receiver)
+    try:
+        TestModelPermissionManager(
+            user=user, instance=instance
+        ).has_permission('view')
+    finally:
+        permission_checked.disconnect(receiver)
+        instrumentation.remove_sink(instrumentation.send_signal)
+
+    [event] = events
+    assert event.manager is TestModelPermissionManager
+    assert event.action == 'view'
+    assert event.instance == instance
+    assert event.allowed is False
+    assert event.cached is False
+    assert event.source is None
+
+
+def test_plain_manager():
+    view = SimpleNamespace(
+        action='list',
+        request=SimpleNamespace(user=None, method='GET'),
+        permission_manager=PlainPermissionManager,
+    )
+
+    with instrumentation.trace() as events:
+        for _ in range(2):
+            assert ManagerPermission().has_permission(view.request, view)
+
+    assert [
+        (event.manager, event.action, event.source, event.allowed)
+        for event in events
+    ] == [(PlainPermissionManager, 'list', 'permission', True)] * 2
+
+
+def test_plain_async_manager():
+    with instrumentation.trace() as events:
+        manager = instrumentation.instrument(
+            AsyncPlainPermissionManager(cache=True)
+        )
+        for _ in range(2):
+            assert asyncio.run(manager.has_permission('list')) is True
+
+    assert [(event.action, event.cached) for event in events] == [
+        ('list', False),
+        ('list', True),
+    ]
+
+
+def test_instrument_without_recording():
+    manager = PlainPermissionManager()
+
+    assert instrumentation.instrument(manager) is manager
+    assert 'has_permission' not in vars(manager)
+
+
+@pytest.mark.django_db
+def test_nested_checks():
+    user = User.objects.create_user(username='user')
+    instance = TestModel.objects.create(title='Test')
+    parent_manager = QueryingParentPermissionManager(
+        user=user, instance=instance
+    )
+    manager = DelegatingChildPermissionManager(
+        user=user,
+        parent=instance,
+        parent_permission_manager=parent_manager,
+    )
+
+    with instrumentation.trace() as events:
+        manager.has_permission('create')
+
+    parent_event, event = events
+    assert (parent_event.action, event.action) == ('update', 'create')
+    assert len(parent_event.queries) == 1
+    assert event.queries == ()
+    assert event.self_duration == pytest.approx(
+        event.duration - parent_event.duration
+    )
+    assert parent_event.self_duration == parent_event.duration
+    timing = get_server_timing(events)
+    duration = float(timing.split(';')[1].removeprefix('dur='))
+    assert duration == pytest.approx(event.duration * 1000, abs=1e-3)
+    assert '2 checks, 0 cached, 1 queries' in timing
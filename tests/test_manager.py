@@ -1,6 +1,6 @@
 import pytest
 
-from permission_manager_drf import DRFPermissionManager
+from permission_manager_drf import DRFPermissionManager, PermissionFieldChild
 
 
 @pytest.mark.parametrize(
@@ -10,3 +10,52 @@ def test_drf_permission_manager(action):
     manager = DRFPermissionManager()
 
     assert manager.has_permission(action) is False
+
+
+@pytest.mark.parametrize(
+    ('action', 'expected'),
+    [
+        ('view', 'view'),
+        ('retrieve', 'view'),
+        ('update', 'update'),
+        ('partial_update', 'update'),
+        ('destroy', 'delete'),
+    ],
+)
+def test_action_table(action, expected):
+    index = DRFPermissionManager.get_action_index(action)
+
+    assert DRFPermissionManager.get_action_name(action) == expected
+    assert DRFPermissionManager._action_names[index] == expected  # noqa: SLF001
+    assert DRFPermissionManager._action_table[action] == index  # noqa: SLF001
+
+
+def test_action_table_is_frozen():
+    with pytest.raises(TypeError):
+        DRFPermissionManager._action_table['unknown'] = 0  # noqa: SLF001
+
+
+def test_action_table_of_subclass():
+    class ExamplePermissionManager(DRFPermissionManager):
+        def has_publish_permission(self) -> bool:
+            return True
+
+    manager = ExamplePermissionManager()
+
+    assert manager.has_permission('publish') is True
+    assert manager.has_permission('partial_update') is False
+    assert 'publish' not in DRFPermissionManager._action_table  # noqa: SLF001
+
+
+def test_unknown_action():
+    with pytest.raises(ValueError, match='doesn\'t have "unknown" action'):
+        DRFPermissionManager().has_permission('unknown')
+
+
+def test_child_unknown_action():
+    with pytest.raises(ValueError, match='doesn\'t have "unknown" action'):
+        PermissionFieldChild(
+            name='child',
+            manager=DRFPermissionManager,
+            actions=['create', 'unknown'],
+        )
@@ -0,0 +1,77 @@
+import pytest
+from django.contrib.auth.models import User
+from django.test import override_settings
+from rest_framework import status
+
+from permission_manager_drf import instrumentation
+from tests.app.models import TestModel, TestModelPermissionManager
+
+
+MIDDLEWARE = (
+    'permission_manager_drf.middleware.PermissionTimingMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+)
+
+
+class QueryingPermissionManager(TestModelPermissionManager):
+    def has_view_permission(self) -> bool:
+        return User.objects.filter(pk=self.user.pk, is_staff=True).exists()
+
+
+@pytest.mark.django_db
+@override_settings(MIDDLEWARE=MIDDLEWARE)
+def test_server_timing(admin_client):
+    instance = TestModel.objects.create(title='Test')
+
+    response = admin_client.get(f'/model/{instance.pk}/')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['Server-Timing'].startswith('permissions;dur=')
+    assert 'checks, 0 cached, 0 queries' in response['Server-Timing']
+
+    events = response.wsgi_request.permission_trace
+    assert events[0].action == 'retrieve'
+    assert events[0].instance_pk == instance.pk
+    assert {event.source for event in events} == {'permission', 'field'}
+
+
+@pytest.mark.django_db
+@override_settings(MIDDLEWARE=MIDDLEWARE)
+def test_server_timing_without_checks(client):
+    response = client.get('/model/')
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert 'Server-Timing' not in response
+    assert response.wsgi_request.permission_trace == []
+
+
+@pytest.mark.django_db
+def test_trace_queries():
+    user = User.objects.create_user(username='user')
+    instance = TestModel.objects.create(title='Test')
+    manager = QueryingPermissionManager(user=user, instance=instance)
+
+    with instrumentation.trace() as events:
+        manager.has_permission('view')
+
+    [event] = events
+    assert event.allowed is False
+    assert len(event.queries) == 1
+    assert 'auth_user' in event.queries[0]
+
+
+@pytest.mark.django_db
+def test_queries_without_trace(django_assert_num_queries):
+    user = User.objects.create_user(username='user')
+    instance = TestModel.objects.create(title='Test')
+
+    with (
+        django_assert_num_queries(1),
+        instrumentation.capture_queries() as queries,
+    ):
+        QueryingPermissionManager(user=user, instance=instance).has_permission(
+            'view'
+        )
+
+    assert queries == []
@@ -0,0 +1,219 @@
+from typing import ClassVar
+
+import pytest
+from rest_framework import serializers
+from rest_framework.permissions import IsAuthenticated
+
+from permission_manager_drf import ManagerPermission, PermissionField
+from tests.app.models import (
+    TestChildModelPermissionManager,
+    TestModel,
+    TestModelPermissionManager,
+)
+from tests.app.views import TestQuerysetModelViewSet
+
+
+class RelatedPermissionManager(TestModelPermissionManager):
+    prefetch_related = {
+        'view': ['testchildmodel_set'],
+        'update': ['testchildmodel_set', 'update_lookup'],
+        'delete': ['delete_lookup'],
+    }
+
+
+class ChildrenPermissionManager(TestModelPermissionManager):
+    prefetch_related = {'update': ['testchildmodel_set']}
+
+    def has_update_permission(self) -> bool:
+        return not self.instance.testchildmodel_set.all()
+
+
+@pytest.fixture(autouse=True)
+def permission_manager(monkeypatch):
+    monkeypatch.setattr(
+        TestModel, 'permission_manager', RelatedPermissionManager
+    )
+
+
+@pytest.mark.parametrize(
+    ('action', 'expected'),
+    [
+        ('view', ['testchildmodel_set']),
+        ('retrieve', ['testchildmodel_set']),
+        ('destroy', ['delete_lookup']),
+        ('list', []),
+        ('unknown', []),
+    ],
+)
+def test_get_prefetch_related(action, expected):
+    assert RelatedPermissionManager.get_prefetch_related([action]) == expected
+
+
+def test_get_lookups_for_all_actions():
+    assert TestModelPermissionManager.get_lookups(
+        ['first', 'second', 'first'], ['unknown']
+    ) == ['first', 'second']
+
+
+@pytest.mark.parametrize(
+    ('action', 'expected'),
+    [
+        ('list', ('testchildmodel_set', 'update_lookup')),
+        ('destroy', ('testchildmodel_set', 'update_lookup', 'delete_lookup')),
+    ],
+)
+def test_queryset(action, expected):
+    view = TestQuerysetModelViewSet(action=action, format_kwarg=None)
+
+    queryset = view.get_queryset()
+
+    assert queryset._prefetch_related_lookups == expected  # noqa: SLF001
+    assert queryset.query.select_related is False
+
+
+def test_queryset_children(monkeypatch):
+    monkeypatch.setattr(
+        TestChildModelPermissionManager,
+        'select_related',
+        {'create': ['child_lookup']},
+    )
+    view = TestQuerysetModelViewSet(action='list', format_kwarg=None)
+
+    queryset = view.get_queryset()
+
+    # Lookups of child managers are relative to the child model
+    assert queryset.query.select_related is False
+
+
+class PublishAliasPermission(ManagerPermission):
+    action_aliases: ClassVar[dict[str, str]] = {'retrieve': 'publish'}
+
+
+class AliasQuerysetModelViewSet(TestQuerysetModelViewSet):
+    permission_classes: ClassVar[list] = [
+        IsAuthenticated & PublishAliasPermission,
+        PublishAliasPermission,
+    ]
+
+
+def test_queryset_permission_class_aliases(monkeypatch):
+    monkeypatch.setattr(
+        RelatedPermissionManager, 'prefetch_related', {'publish': ['lookup']}
+    )
+    view = AliasQuerysetModelViewSet(action='retrieve', format_kwarg=None)
+
+    queryset = view.get_queryset()
+
+    assert queryset._prefetch_related_lookups == ('lookup',)  # noqa: SLF001
+
+
+def test_queryset_actions_once(mocker):
+    view = TestQuerysetModelViewSet(action='retrieve', format_kwarg=None)
+    get_permission_actions = mocker.spy(view, 'get_permission_actions')
+
+    view.get_queryset()
+    view.get_queryset()
+
+    get_permission_actions.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_list_queries(admin_client, django_assert_num_queries, monkeypatch):
+    monkeypatch.setattr(
+        TestModel, 'permission_manager', ChildrenPermissionManager
+    )
+    for i in range(3):
+        TestModel.objects.create(title=str(i))
+
+    # Session, user, count, page and the prefetch
+    with django_assert_num_queries(5):
+        response = admin_client.get('/queryset_model/')
+
+    assert len(response.json()['results']) == 3  # noqa: PLR2004
+
+
+class TitleSerializer(serializers.ModelSerializer):
+    permissions = PermissionField(actions=('update', 'publish'))
+
+    class Meta:
+        model = TestModel
+        fields = ('id', 'title', 'permissions')
+
+
+class MethodSerializer(TitleSerializer):
+    method = serializers.SerializerMethodField()
+
+    class Meta(TitleSerializer.Meta):
+        fields = (*TitleSerializer.Meta.fields, 'method')
+
+    def get_method(self, instance: TestModel) -> str:
+        return instance.status
+
+
+class OnlyPermissionManager(TestModelPermissionManager):
+    only = {'publish': ('status',)}
+
+
+class OnlyFieldsViewSet(TestQuerysetModelViewSet):
+    permission_manager_only_fields = True
+    serializer_class = TitleSerializer
+
+
+@pytest.mark.parametrize(
+    ('action', 'manager', 'serializer_class', 'expected'),
+    [
+        ('list', TestModelPermissionManager, TitleSerializer, {'id', 'title'}),
+        (
+            'list',
+            OnlyPermissionManager,
+            TitleSerializer,
+            {'id', 'title', 'status'},
+        ),
+        ('list', TestModelPermissionManager, MethodSerializer, set()),
+        ('retrieve', TestModelPermissionManager, TitleSerializer, set()),
+    ],
+)
+def test_only_fields(
+    monkeypatch,
+    action,
+    manager,
+    serializer_class,
+    expected,
+):
+    monkeypatch.setattr(TestModel, 'permission_manager', manager)
+    view = OnlyFieldsViewSet(
+        action=action,
+        format_kwarg=None,
+        request=None,
+        serializer_class=serializer_class,
+    )
+
+    queryset = view.get_queryset()
+
+    assert queryset.query.deferred_loading == (
+        frozenset(expected),
+        not expected,
+    )
+
+
+@pytest.mark.django_db
+def test_only_fields_list(
+    admin_client, django_assert_num_queries, monkeypatch
+):
+    monkeypatch.setattr(TestModel, 'permission_manager', OnlyPermissionManager)
+    monkeypatch.setattr(
+        TestQuerysetModelViewSet, 'permission_manager_only_fields', True
+    )
+    monkeypatch.setattr(
+        TestQuerysetModelViewSet, 'serializer_class', TitleSerializer
+    )
+    TestModel.objects.create(title='Test')
+
+    # Session, user, count and page
+    with django_assert_num_queries(4):
+        response = admin_client.get('/queryset_model/')
+
+    assert response.json()['results'][0]['permissions']['publish'] == {
+        'allow': True,
+        'messages': None,
+    }
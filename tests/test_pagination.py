@@ -1,10 +1,30 @@
+import base64
+from collections import Counter
 from unittest.mock import PropertyMock
+from urllib.parse import urlencode
 
 import pytest
-from rest_framework import status
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers, status
 
-from tests.app.models import TestModel
-from tests.app.views import TestModelViewSet
+from permission_manager_drf import PermissionField, PermissionFieldChild
+from tests.app.models import (
+    TestChildModelPermissionManager,
+    TestModel,
+    TestModelPermissionManager,
+    TestModelStatus,
+)
+from tests.app.pagination import (
+    TestCursorPagination,
+    TestKeysetPagination,
+    TestLimitOffsetPagination,
+    TestPagination,
+)
+from tests.app.views import TestFilteredModelViewSet, TestModelViewSet
 
 
 @pytest.mark.django_db
@@ -82,3 +102,414 @@ def test_pagination_without_permission_manager(user_client, mocker):
 
     assert response.status_code == status.HTTP_200_OK
     assert 'permissions' not in data
+
+
+class BitmaskSerializer(serializers.ModelSerializer):
+    permissions = PermissionField(
+        actions=('update', 'publish'),
+        children=[
+            PermissionFieldChild(
+                name='child_model',
+                manager=TestChildModelPermissionManager,
+                actions=['create'],
+            )
+        ],
+        bitmask=True,
+    )
+
+    class Meta:
+        model = TestModel
+        fields = ('id', 'permissions')
+
+
+@pytest.mark.django_db
+def test_bitmask(admin_client, monkeypatch):
+    monkeypatch.setattr(
+        TestModelViewSet, 'serializer_class', BitmaskSerializer
+    )
+    TestModel.objects.create(title='Draft')
+    published = TestModel.objects.create(
+        title='Published', status=TestModelStatus.PUBLISHED
+    )
+
+    response = admin_client.get(path='/model/')
+    data = response.json()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response['X-Permission-Actions'] == (
+        'permissions=update,publish,child_model.create'
+    )
+    assert [row['permissions'] for row in data['results']] == [0b111, 0b101]
+    assert data['permission_messages'] == {
+        'permissions': {str(published.pk): {'publish': ['Already published']}}
+    }
+
+
+@pytest.mark.django_db
+def test_bitmask_denied(user_client, monkeypatch):
+    monkeypatch.setattr(
+        TestModelViewSet, 'serializer_class', BitmaskSerializer
+    )
+    instance = TestModel.objects.create(
+        title='Published', status=TestModelStatus.PUBLISHED
+    )
+
+    response = user_client.get(path='/model/')
+    data = response.json()
+
+    assert [row['permissions'] for row in data['results']] == [0]
+    assert data['permission_messages'] == {
+        'permissions': {
+            str(instance.pk): {
+                'child_model.create': ['Parent is not editable']
+            }
+        }
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('pagination_class', 'count_mode'),
+    [
+        (TestLimitOffsetPagination, 'none'),
+        (TestCursorPagination, 'exact'),
+        (TestKeysetPagination, 'exact'),
+    ],
+)
+def test_bitmask_paginators(
+    admin_client, monkeypatch, pagination_class, count_mode
+):
+    monkeypatch.setattr(
+        TestModelViewSet, 'serializer_class', BitmaskSerializer
+    )
+    monkeypatch.setattr(TestModelViewSet, 'pagination_class', pagination_class)
+    monkeypatch.setattr(pagination_class, 'count_mode', count_mode)
+    TestModel.objects.create(title='Draft')
+
+    response = admin_client.get(path='/model/')
+
+    assert response['X-Permission-Actions'] == (
+        'permissions=update,publish,child_model.create'
+    )
+    assert [row['permissions'] for row in response.json()['results']] == [
+        0b111
+    ]
+
+
+def get_content(client, path):
+    response = client.get(path=path)
+    if response.streaming:
+        return b''.join(response.streaming_content)
+    return response.content
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('path', 'pagination_class'),
+    [
+        ('/model/{pk}/', TestPagination),
+        ('/model/', None),
+        ('/streaming_model/', TestPagination),
+    ],
+)
+def test_bitmask_not_paginated(
+    admin_client, monkeypatch, path, pagination_class
+):
+    monkeypatch.setattr(
+        TestModelViewSet, 'serializer_class', BitmaskSerializer
+    )
+    monkeypatch.setattr(TestModelViewSet, 'pagination_class', pagination_class)
+    instance = TestModel.objects.create(title='Draft')
+
+    with pytest.raises(ImproperlyConfigured, match='bitmask=True'):
+        get_content(admin_client, path.format(pk=instance.pk))
+
+
+@pytest.mark.django_db
+def test_without_bitmask(admin_client):
+    TestModel.objects.create(title='Draft')
+
+    response = admin_client.get(path='/model/')
+
+    assert 'X-Permission-Actions' not in response
+    assert 'permission_messages' not in response.json()
+
+
+list_calls = Counter()
+
+
+class CountingPermissionManager(TestModelPermissionManager):
+    def has_create_permission(self) -> bool:
+        list_calls['create'] += 1
+        return super().has_create_permission()
+
+
+@pytest.fixture
+def list_actions(monkeypatch):
+    monkeypatch.setattr(
+        TestModelViewSet,
+        'permission_manager_list_actions',
+        ('create',),
+        raising=False,
+    )
+    monkeypatch.setattr(
+        TestModel, 'permission_manager', CountingPermissionManager
+    )
+    list_calls.clear()
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('list_actions')
+@pytest.mark.parametrize(
+    'pagination_class',
+    [TestPagination, TestLimitOffsetPagination, TestCursorPagination],
+)
+def test_list_permissions_paginators(
+    admin_client, monkeypatch, pagination_class
+):
+    monkeypatch.setattr(TestModelViewSet, 'pagination_class', pagination_class)
+    TestModel.objects.create(title='Test')
+
+    data = admin_client.get(path='/model/').json()
+
+    assert len(data['results']) == 1
+    assert data['permissions'] == {'create': {'allow': True, 'messages': None}}
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('list_actions')
+@pytest.mark.parametrize(('timeout', 'expected_calls'), [(None, 2), (60, 1)])
+def test_list_permissions_cache(
+    admin_client, settings, timeout, expected_calls
+):
+    settings.PERMISSION_MANAGER_DRF_LIST_CACHE_TIMEOUT = timeout
+
+    responses = [
+        admin_client.get(path='/model/', data={'page': 1}) for _ in range(2)
+    ]
+
+    assert [response.json()['permissions'] for response in responses] == [
+        {'create': {'allow': True, 'messages': None}}
+    ] * 2
+    assert list_calls['create'] == expected_calls
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('list_actions')
+def test_list_permissions_cache_by_user(client, monkeypatch):
+    monkeypatch.setattr(
+        TestModelViewSet,
+        'permission_manager_list_cache_timeout',
+        60,
+        raising=False,
+    )
+    results = []
+    for is_staff in (True, False):
+        user = User.objects.create_user(
+            username=f'user-{is_staff}', is_staff=is_staff
+        )
+        client.force_login(user)
+        results.append(
+            client.get(path='/model/').json()['permissions']['create']
+        )
+
+    assert [result['allow'] for result in results] == [True, False]
+    assert list_calls['create'] == 2  # noqa: PLR2004
+
+
+@pytest.fixture
+def count_mode(monkeypatch, request):
+    pagination_class, mode = request.param
+    monkeypatch.setattr(pagination_class, 'count_mode', mode)
+    monkeypatch.setattr(pagination_class, 'page_size', 2, raising=False)
+    monkeypatch.setattr(pagination_class, 'default_limit', 2, raising=False)
+    monkeypatch.setattr(TestModelViewSet, 'pagination_class', pagination_class)
+    TestModel.objects.bulk_create(
+        TestModel(title=f'Test {i}') for i in range(3)
+    )
+    cache.clear()
+    yield mode
+    cache.clear()
+
+
+def get_count_queries(client, path, data=None):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(path=path, data=data)
+    assert response.status_code == status.HTTP_200_OK
+    count_queries = [
+        query['sql'] for query in context if 'COUNT(' in query['sql']
+    ]
+    return response.json(), count_queries
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('count_mode', 'expected_count'),
+    [
+        ((pagination_class, mode), None if mode == 'none' else 3)
+        for pagination_class in (TestPagination, TestLimitOffsetPagination)
+        for mode in ('exact', 'none', 'estimated', 'cached')
+    ],
+    indirect=['count_mode'],
+)
+def test_count_modes(admin_client, count_mode, expected_count):
+    first, count_queries = get_count_queries(admin_client, '/model/')
+    assert first['count'] == expected_count
+    assert len(first['results']) == 2  # noqa: PLR2004
+    assert first['next'] is not None
+    assert bool(count_queries) is (count_mode != 'none')
+
+    last = admin_client.get(path=first['next']).json()
+    assert last['count'] == expected_count
+    assert len(last['results']) == 1
+    assert last['next'] is None
+    assert last['previous'] is not None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'count_mode',
+    [
+        (TestPagination, 'cached'),
+        (TestLimitOffsetPagination, 'cached'),
+    ],
+    indirect=True,
+)
+@pytest.mark.usefixtures('count_mode')
+def test_cached_count(admin_client):
+    get_count_queries(admin_client, '/model/')
+    TestModel.objects.create(title='New')
+
+    data, count_queries = get_count_queries(admin_client, '/model/')
+
+    assert data['count'] == 3  # noqa: PLR2004
+    assert count_queries == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('count_mode', 'page'),
+    [((TestPagination, 'none'), page) for page in (3, 'last')],
+    indirect=['count_mode'],
+)
+@pytest.mark.usefixtures('count_mode')
+def test_countless_invalid_page(admin_client, page):
+    response = admin_client.get(path='/model/', data={'page': page})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_unknown_count_mode(admin_client, monkeypatch):
+    monkeypatch.setattr(TestPagination, 'count_mode', 'unknown')
+
+    with pytest.raises(ImproperlyConfigured, match='Unknown count mode'):
+        admin_client.get(path='/model/')
+
+
+def get_keyset_pages(client, path, *, link='next', data=None):
+    pages = []
+    while path:
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(path=path, data=data)
+        assert response.status_code == status.HTTP_200_OK
+        assert not any('OFFSET' in query['sql'] for query in context)
+        data = None
+        pages.append(response.json())
+        path = pages[-1][link]
+    return pages
+
+
+@pytest.fixture
+def keyset_pagination(monkeypatch):
+    monkeypatch.setattr(
+        TestModelViewSet, 'pagination_class', TestKeysetPagination
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('keyset_pagination')
+@pytest.mark.parametrize(
+    ('ordering', 'expected_ordering'),
+    [
+        (None, ('pk',)),
+        ('-title', ('-title', '-pk')),
+        (('title', '-id'), ('title', '-id')),
+    ],
+)
+def test_keyset_pagination(
+    admin_client, monkeypatch, ordering, expected_ordering
+):
+    monkeypatch.setattr(TestKeysetPagination, 'ordering', ordering)
+    TestModel.objects.bulk_create(
+        TestModel(title=title) for title in ('b', 'a', 'b', 'c', 'b')
+    )
+    expected = list(
+        TestModel.objects.order_by(*expected_ordering).values_list(
+            'pk', flat=True
+        )
+    )
+
+    pages = get_keyset_pages(admin_client, '/model/')
+
+    assert [len(page['results']) for page in pages] == [2, 2, 1]
+    assert [
+        result['id'] for page in pages for result in page['results']
+    ] == expected
+    assert pages[0]['previous'] is None
+
+    previous_pages = get_keyset_pages(
+        admin_client, pages[-1]['previous'], link='previous'
+    )
+    assert [
+        result['id']
+        for page in reversed(previous_pages)
+        for result in page['results']
+    ] == expected[:4]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('keyset_pagination')
+def test_keyset_pagination_filtered(user_client, monkeypatch):
+    monkeypatch.setattr(
+        TestFilteredModelViewSet, 'pagination_class', TestKeysetPagination
+    )
+    monkeypatch.setattr(
+        TestModelViewSet,
+        'permission_manager_list_actions',
+        ('create',),
+        raising=False,
+    )
+    TestModel.objects.bulk_create(
+        TestModel(title=str(i), status=status_)
+        for i, status_ in enumerate(
+            [TestModelStatus.PUBLISHED, TestModelStatus.DRAFT] * 3
+        )
+    )
+
+    pages = get_keyset_pages(user_client, '/filtered_model/')
+
+    assert [
+        result['id'] for page in pages for result in page['results']
+    ] == list(
+        TestModel.objects.filter(status=TestModelStatus.PUBLISHED).values_list(
+            'pk', flat=True
+        )
+    )
+    assert all('permissions' in page for page in pages)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('keyset_pagination')
+@pytest.mark.parametrize('position', ['[', '1', '[1, 2]', '[null]'])
+def test_keyset_pagination_invalid_cursor(admin_client, position):
+    cursor = base64.b64encode(
+        urlencode({'p': position}).encode('ascii')
+    ).decode('ascii')
+
+    response = admin_client.get(path='/model/', data={'cursor': cursor})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,8 +1,24 @@
+from collections import Counter
+from types import SimpleNamespace
+
 import pytest
+from django.core.signals import request_finished
+from django.db import connection, connections, transaction
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
 
-from permission_manager_drf import PermissionField
-from tests.app.models import TestModel, TestModelStatus
+import permission_manager_drf.fields
+from permission_manager_drf import PermissionField, PermissionFieldChild
+from permission_manager_drf.executor import can_submit, submit
+from tests.app.models import (
+    TestChildModel,
+    TestChildModelPermissionManager,
+    TestModel,
+    TestModelPermissionManager,
+    TestModelStatus,
+)
 
 
 @pytest.mark.django_db
@@ -69,3 +85,296 @@ def test_permission_field_without_view_request_negative():
 
     data = TestSerializer(instance=instance).data
     assert data == {'id': instance.pk}
+
+
+@pytest.mark.django_db
+def test_permission_field_list_by_admin(admin_client):
+    TestModel.objects.create(title='Draft', status=TestModelStatus.DRAFT)
+    TestModel.objects.create(
+        title='Published', status=TestModelStatus.PUBLISHED
+    )
+
+    response = admin_client.get(path='/model/')
+
+    assert [
+        row['permissions']['publish'] for row in response.json()['results']
+    ] == [
+        {'allow': True, 'messages': None},
+        {'allow': False, 'messages': ['Already published']},
+    ]
+
+
+@pytest.mark.django_db
+def test_permission_field_list_batch_context(admin_client, mocker):
+    instances = [TestModel.objects.create(title=str(i)) for i in range(3)]
+    manager_batch_context = mocker.spy(
+        TestModelPermissionManager, 'get_batch_context'
+    )
+    child_batch_context = mocker.spy(
+        TestChildModelPermissionManager, 'get_batch_context'
+    )
+
+    response = admin_client.get(path='/model/')
+
+    assert len(response.json()['results']) == len(instances)
+    manager_batch_context.assert_called_once()
+    assert list(manager_batch_context.call_args.kwargs['instances']) == (
+        instances
+    )
+    child_batch_context.assert_called_once()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize('many', [False, True])
+def test_permission_field_concurrent(many, mocker):
+    class TestSerializer(serializers.Serializer):
+        permissions = PermissionField(
+            actions=('update', 'publish'),
+            children=[
+                PermissionFieldChild(
+                    name='child_model',
+                    manager=TestChildModelPermissionManager,
+                    actions=['create'],
+                )
+            ],
+            concurrent=True,
+        )
+
+    instances = [
+        TestModel.objects.create(title='Draft'),
+        TestModel.objects.create(
+            title='Published', status=TestModelStatus.PUBLISHED
+        ),
+    ]
+    submit = mocker.spy(permission_manager_drf.fields, 'submit')
+    view = SimpleNamespace(
+        request=SimpleNamespace(user=SimpleNamespace(is_staff=True)),
+        permission_manager=TestModelPermissionManager,
+    )
+
+    if many:
+        data = TestSerializer(
+            instances, many=True, context={'view': view, 'request': None}
+        ).data
+    else:
+        data = [
+            TestSerializer(
+                instance, context={'view': view, 'request': None}
+            ).data
+            for instance in instances
+        ]
+
+    assert [list(row['permissions']) for row in data] == [
+        ['update', 'publish', 'child_model'],
+    ] * 2
+    assert [row['permissions']['publish']['allow'] for row in data] == [
+        True,
+        False,
+    ]
+    assert submit.call_count == 6  # noqa: PLR2004
+
+
+class SelectableSerializer(serializers.Serializer):
+    permissions = PermissionField(
+        actions=('update', 'publish'),
+        children=[
+            PermissionFieldChild(
+                name='child_model',
+                manager=TestChildModelPermissionManager,
+                actions=['create'],
+            )
+        ],
+        query_param='permissions',
+    )
+
+
+def serialize_selectable(instance, *, many=False, **query_params):
+    request = Request(APIRequestFactory().get('/', query_params))
+    request.user = SimpleNamespace(is_staff=True)
+    view = SimpleNamespace(
+        request=request,
+        permission_manager=TestModelPermissionManager,
+    )
+    return SelectableSerializer(
+        instance, many=many, context={'view': view, 'request': request}
+    ).data
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('query_params', 'expected'),
+    [
+        ({}, ['update', 'publish', 'child_model']),
+        ({'permissions': 'update'}, ['update']),
+        ({'permissions': 'child_model, publish'}, ['publish', 'child_model']),
+        ({'permissions': 'none'}, []),
+        ({'permissions': ''}, []),
+    ],
+)
+@pytest.mark.parametrize('many', [False, True])
+def test_permission_field_query_param(query_params, expected, many):
+    instance = TestModel.objects.create(title='Test')
+
+    data = serialize_selectable(
+        [instance] if many else instance, many=many, **query_params
+    )
+
+    row = data[0] if many else data
+    assert list(row['permissions']) == expected
+
+
+@pytest.mark.django_db
+def test_permission_field_query_param_unknown():
+    instance = TestModel.objects.create(title='Test')
+
+    with pytest.raises(ValidationError) as exc_info:
+        serialize_selectable(instance, permissions='update,delete')
+
+    message = (
+        'Unknown permissions: delete. Allowed: child_model, publish, update.'
+    )
+    assert exc_info.value.detail == {'permissions': [message]}
+
+
+@pytest.mark.django_db
+def test_permission_field_query_param_none(mocker):
+    instances = [TestModel.objects.create(title=str(i)) for i in range(3)]
+    get_permission_managers = mocker.spy(
+        permission_manager_drf.fields, 'get_permission_managers'
+    )
+
+    data = serialize_selectable(instances, many=True, permissions='none')
+
+    assert [row['permissions'] for row in data] == [{}] * 3
+    get_permission_managers.assert_not_called()
+
+
+child_calls = Counter()
+
+
+class CountingChildPermissionManager(TestChildModelPermissionManager):
+    def has_create_permission(self) -> bool:
+        child_calls[type(self)] += 1
+        return super().has_create_permission()
+
+
+class KeyedChildPermissionManager(CountingChildPermissionManager):
+    @classmethod
+    def get_child_cache_key(
+        cls, *, parent_permission_manager, **_kwargs
+    ) -> bool:
+        return bool(parent_permission_manager.has_update_permission())
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('manager_class', 'expected_calls'),
+    [
+        (CountingChildPermissionManager, 3),
+        (KeyedChildPermissionManager, 1),
+    ],
+)
+def test_permission_field_child_cache_key(manager_class, expected_calls):
+    class ChildSerializer(serializers.Serializer):
+        permissions = PermissionField(
+            actions=(),
+            children=[
+                PermissionFieldChild(
+                    name='child_model',
+                    manager=manager_class,
+                    actions=['create'],
+                )
+            ],
+        )
+
+    instances = [TestModel.objects.create(title=str(i)) for i in range(3)]
+    request = Request(APIRequestFactory().get('/'))
+    request.user = SimpleNamespace(is_staff=False)
+    view = SimpleNamespace(
+        request=request,
+        permission_manager=TestModelPermissionManager,
+    )
+    child_calls.clear()
+
+    data = ChildSerializer(
+        instances, many=True, context={'view': view, 'request': request}
+    ).data
+
+    assert [row['permissions'] for row in data] == [
+        {
+            'child_model': {
+                'create': {
+                    'allow': False,
+                    'messages': ['Parent is not editable'],
+                }
+            }
+        }
+    ] * 3
+    assert child_calls[manager_class] == expected_calls
+
+
+class RelatedUpdatePermissionManager(TestModelPermissionManager):
+    def has_update_permission(self) -> bool:
+        return self.instance.testchildmodel_set.exists()
+
+
+class ConcurrentSerializer(serializers.Serializer):
+    permissions = PermissionField(actions=('update',), concurrent=True)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('method', ['GET', 'POST'])
+def test_permission_field_concurrent_in_transaction(method, mocker):
+    instance = TestModel.objects.create(title='Test')
+    TestChildModel.objects.create(title='Child', test_model=instance)
+    submit = mocker.spy(permission_manager_drf.fields, 'submit')
+    view = SimpleNamespace(
+        request=SimpleNamespace(
+            method=method, user=SimpleNamespace(is_staff=True)
+        ),
+        permission_manager=RelatedUpdatePermissionManager,
+    )
+
+    data = ConcurrentSerializer(
+        [instance], many=True, context={'view': view, 'request': None}
+    ).data
+
+    assert data[0]['permissions']['update']['allow'] is True
+    assert submit.call_count == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize(
+    ('method', 'expected'), [('GET', True), (None, True), ('POST', False)]
+)
+def test_can_submit(method, expected):
+    request = SimpleNamespace(method=method)
+
+    assert can_submit(request) is expected
+    with transaction.atomic():
+        assert can_submit(request) is False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_connections(settings, mocker):
+    settings.PERMISSION_MANAGER_DRF_EXECUTOR_MAX_WORKERS = 1
+    close = mocker.spy(
+        type(connections['default']), 'close_if_unusable_or_obsolete'
+    )
+
+    def get_connection() -> object:
+        connection.ensure_connection()
+        return connection.connection
+
+    first = submit(get_connection).result()
+    close.reset_mock()
+    second = submit(get_connection).result()
+
+    assert second is first
+    assert close.call_count == 0
+
+    request_finished.send(sender=None)
+    close.reset_mock()
+    submit(get_connection).result()
+
+    assert close.call_count == 1
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+from rest_framework import status
+
+from permission_manager_drf import fields, streaming
+from permission_manager_drf.streaming import iter_chunks
+from tests.app.models import TestModel
+
+
+def get_streamed_json(client, path):
+    response = client.get(path=path)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response['Content-Type'] == 'application/json'
+    return json.loads(b''.join(response.streaming_content))
+
+
+@pytest.mark.parametrize(
+    ('objects', 'expected'),
+    [
+        ([], []),
+        ([1, 2, 3, 4], [[1, 2], [3, 4]]),
+        (range(5), [[0, 1], [2, 3], [4]]),
+    ],
+)
+def test_iter_chunks(objects, expected):
+    assert list(iter_chunks(objects, 2)) == expected
+
+
+@pytest.mark.django_db
+def test_stream_empty(admin_client):
+    assert get_streamed_json(admin_client, '/streaming_model/') == []
+
+
+@pytest.mark.django_db
+def test_stream(admin_client, mocker):
+    TestModel.objects.bulk_create(
+        TestModel(title=f'Test {i}') for i in range(5)
+    )
+    expected = admin_client.get(path='/model/').json()['results']
+    get_permission_managers = mocker.patch.object(
+        fields,
+        'get_permission_managers',
+        wraps=fields.get_permission_managers,
+    )
+    clear_manager_registry = mocker.patch.object(
+        streaming,
+        'clear_manager_registry',
+        wraps=streaming.clear_manager_registry,
+    )
+
+    data = get_streamed_json(admin_client, '/streaming_model/')
+
+    assert data == expected
+    assert [
+        len(call.kwargs['instances'])
+        for call in get_permission_managers.call_args_list
+    ] == [2, 2, 1]
+    assert clear_manager_registry.call_count == 3  # noqa: PLR2004
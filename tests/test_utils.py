@@ -7,14 +7,24 @@ import pytest
 from django.core.exceptions import ImproperlyConfigured
 from django.test import override_settings
 from permission_manager import BasePermissionManager
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
 
 import permission_manager_drf.settings
 from permission_manager_drf.managers import DRFPermissionManager
-from permission_manager_drf.utils import get_permission_manager
+from permission_manager_drf.utils import (
+    clear_manager_registry,
+    clear_model_permission_manager_classes,
+    get_permission_manager,
+    get_permission_manager_class,
+    get_permission_manager_context,
+    get_view_dispatch,
+)
 from tests.app.models import (
     TestModel,
     TestModelPermissionManager,
 )
+from tests.app.views import TestModelViewSet
 
 
 def custom_permission_manager_drf_for_model_getter(model):
@@ -201,3 +211,181 @@ def test_get_permission_manager_with_context():
     permission_manager = get_permission_manager(view=View())
 
     assert permission_manager.context == context
+
+
+@pytest.mark.django_db
+def test_permission_manager_shared_in_request(admin_client, mocker):
+    instance = TestModel.objects.create(title='Test')
+    init = mocker.spy(TestModelPermissionManager, '__init__')
+
+    admin_client.get(path=f'/model/{instance.pk}/')
+
+    init.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_permission_manager_not_shared_in_unsafe_request(admin_client, mocker):
+    instance = TestModel.objects.create(title='Test')
+    init = mocker.spy(TestModelPermissionManager, '__init__')
+
+    admin_client.patch(
+        path=f'/model/{instance.pk}/',
+        data={'title': 'New'},
+        content_type='application/json',
+    )
+
+    assert init.call_count == 2  # noqa: PLR2004
+
+
+def test_manager_registry():
+    class Request:
+        user = None
+        method = 'GET'
+
+    class View:
+        request = Request()
+        permission_manager = TestModelPermissionManager
+
+    view = View()
+    instance = TestModel(title='Test')
+    manager = get_permission_manager(view=view, instance=instance, cache=True)
+
+    assert (
+        get_permission_manager(view=view, instance=instance, cache=True)
+        is manager
+    )
+    assert get_permission_manager(view=view, cache=True) is not manager
+    assert get_permission_manager(view=view, instance=instance) is not manager
+
+    clear_manager_registry(view.request)
+
+    assert (
+        get_permission_manager(view=view, instance=instance, cache=True)
+        is not manager
+    )
+
+
+def test_view_dispatch_is_cached():
+    class View:
+        permission_manager = TestModelPermissionManager
+
+    dispatch = get_view_dispatch(View())
+
+    assert get_view_dispatch(View()) is dispatch
+    assert get_view_dispatch(View) is dispatch
+    assert dispatch.get_context(View()) == {}
+
+
+def test_view_dispatch_with_instance_attributes():
+    class Request(NamedTuple):
+        user = None
+
+    class View:
+        request = Request()
+
+    view = View()
+    view.permission_manager = TestModelPermissionManager
+
+    assert isinstance(
+        get_permission_manager(view=view), TestModelPermissionManager
+    )
+
+
+class DenyingPermissionManager(TestModelPermissionManager):
+    def has_list_permission(self) -> bool:
+        return False
+
+
+class ManagerViewSet(TestModelViewSet):
+    __test__ = False
+
+    # Taken from the queryset, unless it's passed to `as_view`
+    permission_manager = None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('initkwargs', 'expected_status'),
+    [
+        ({}, status.HTTP_200_OK),
+        (
+            {'permission_manager': DenyingPermissionManager},
+            status.HTTP_403_FORBIDDEN,
+        ),
+    ],
+)
+def test_view_dispatch_with_initkwargs(
+    admin_user, initkwargs, expected_status
+):
+    # The dispatch of the view class is cached first
+    get_view_dispatch(ManagerViewSet)
+    request = APIRequestFactory().get('/')
+    force_authenticate(request, user=admin_user)
+
+    response = ManagerViewSet.as_view({'get': 'list'}, **initkwargs)(request)
+
+    assert response.status_code == expected_status
+
+
+def test_view_dispatch_with_instance_context():
+    view = ManagerViewSet(
+        get_permission_manager_context=lambda: {'source': 'initkwargs'},
+        queryset=TestModel.objects.none(),
+    )
+
+    assert get_permission_manager_context(view) == {'source': 'initkwargs'}
+    assert get_permission_manager_class(view) is TestModelPermissionManager
+
+
+getter_calls = []
+
+
+def counting_permission_manager_drf_for_model_getter(model):
+    getter_calls.append(model)
+    return DRFPermissionManager
+
+
+def test_settings_follow_setting_changed():
+    assert (
+        permission_manager_drf.settings.PERMISSION_MANAGER_DRF_CACHE_ALIAS
+        == 'default'
+    )
+    with override_settings(PERMISSION_MANAGER_DRF_CACHE_ALIAS='other'):
+        assert (
+            permission_manager_drf.settings.PERMISSION_MANAGER_DRF_CACHE_ALIAS
+            == 'other'
+        )
+    assert (
+        permission_manager_drf.settings.PERMISSION_MANAGER_DRF_CACHE_ALIAS
+        == 'default'
+    )
+
+
+def test_unknown_setting():
+    with pytest.raises(AttributeError):
+        permission_manager_drf.settings.UNKNOWN  # noqa: B018
+
+
+@override_settings(
+    PERMISSION_MANAGER_DRF_FOR_MODEL_GETTER=(
+        'tests.test_utils.counting_permission_manager_drf_for_model_getter'
+    )
+)
+def test_model_getter_is_memoized():
+    class Request(NamedTuple):
+        user = None
+
+    class View:
+        request = Request()
+        queryset = TestModel.objects.all()
+
+    getter_calls.clear()
+    for _ in range(3):
+        manager = get_permission_manager(view=View())
+
+    assert type(manager) is DRFPermissionManager
+    assert getter_calls == [TestModel]
+
+    clear_model_permission_manager_classes()
+    get_permission_manager(view=View())
+    assert getter_calls == [TestModel, TestModel]
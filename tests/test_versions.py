@@ -0,0 +1,205 @@
+from collections import Counter
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+
+from permission_manager_drf.versions import (
+    REMOVED_KEYS_ATTR,
+    CacheDependency,
+    get_version_keys,
+)
+from tests.app.models import (
+    TestChildModel,
+    TestModel,
+    TestModelPermissionManager,
+    TestModelStatus,
+    TestTagModel,
+)
+
+
+calls = Counter()
+
+
+class VersionedTestModelPermissionManager(TestModelPermissionManager):
+    cache_timeouts = {'view': 60}
+    cache_dependencies = (
+        CacheDependency(model='app.TestModel', fields=('status',)),
+        CacheDependency(model=TestChildModel, instance='test_model'),
+        CacheDependency(model=User, instance=None, user=''),
+        CacheDependency(
+            model=TestTagModel.test_models.through, instance='testmodel'
+        ),
+    )
+
+    def has_view_permission(self) -> bool:
+        calls['view'] += 1
+        return super().has_view_permission()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    calls.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username='user')
+
+
+@pytest.fixture
+def instance():
+    return TestModel.objects.create(title='Test')
+
+
+def check_view(user, instance):
+    return VersionedTestModelPermissionManager(
+        user=user, instance=instance
+    ).has_permission('view')
+
+
+@pytest.mark.django_db
+def test_version_bumped_by_instance_change(user, instance):
+    assert check_view(user, instance) is False
+
+    instance.status = TestModelStatus.PUBLISHED
+    instance.save()
+
+    assert check_view(user, instance) is True
+    assert check_view(user, instance) is True
+    assert calls['view'] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_version_not_bumped_by_other_fields(user, instance):
+    check_view(user, instance)
+
+    instance.title = 'New'
+    instance.save(update_fields=['title'])
+    check_view(user, instance)
+
+    assert calls['view'] == 1
+
+
+@pytest.mark.django_db
+def test_version_bumped_by_related_change(user, instance):
+    check_view(user, instance)
+
+    TestChildModel.objects.create(title='Child', test_model=instance)
+    check_view(user, instance)
+
+    assert calls['view'] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_version_bumped_by_user_change(user, instance):
+    check_view(user, instance)
+
+    user.is_staff = True
+    user.save()
+
+    assert check_view(user, instance) is True
+    assert calls['view'] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_version_bumped_by_delete(user, instance):
+    check_view(user, instance)
+    pk = instance.pk
+
+    instance.delete()
+    instance.pk = pk
+    check_view(user, instance)
+
+    assert calls['view'] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_version_after_eviction(user, instance):
+    check_view(user, instance)
+
+    cache.delete_many(get_version_keys(user=user, objects=[instance]))
+    check_view(user, instance)
+
+    assert calls['view'] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_version_bumped_on_commit(
+    user, instance, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks() as callbacks:
+        instance.status = TestModelStatus.PUBLISHED
+        instance.save()
+
+    # Cached before the commit, e.g. by a request reading the old rows
+    check_view(user, instance)
+    for callback in callbacks:
+        callback()
+    check_view(user, instance)
+
+    assert len(callbacks) == 1
+    assert calls['view'] == 2  # noqa: PLR2004
+
+
+@pytest.mark.django_db
+def test_version_not_bumped_on_commit_outside_transaction(
+    user, instance, mocker
+):
+    on_commit = mocker.patch('django.db.transaction.on_commit')
+    mocker.patch(
+        'django.db.transaction.get_connection'
+    ).return_value.in_atomic_block = False
+
+    instance.status = TestModelStatus.PUBLISHED
+    instance.save()
+
+    assert check_view(user, instance) is True
+    on_commit.assert_not_called()
+
+
+M2M_CHANGES = {
+    'forward_add': lambda tag, instance: tag.test_models.add(instance),
+    'reverse_add': lambda tag, instance: instance.tags.add(tag),
+    'forward_remove': lambda tag, instance: tag.test_models.remove(instance),
+    'reverse_remove': lambda tag, instance: instance.tags.remove(tag),
+    'forward_clear': lambda tag, _instance: tag.test_models.clear(),
+    'reverse_clear': lambda _tag, instance: instance.tags.clear(),
+}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('change', M2M_CHANGES)
+def test_version_bumped_by_m2m_change(user, instance, change):
+    tag = TestTagModel.objects.create(title='Tag')
+    other = TestModel.objects.create(title='Other')
+    if not change.endswith('_add'):
+        tag.test_models.add(instance)
+    other.tags.add(tag)
+    check_view(user, instance)
+    check_view(user, other)
+
+    M2M_CHANGES[change](tag, instance)
+    check_view(user, instance)
+    check_view(user, instance)
+
+    assert calls['view'] == 3  # noqa: PLR2004
+
+    check_view(user, other)
+
+    assert calls['view'] == (4 if change == 'forward_clear' else 3)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('change', ['forward_remove', 'reverse_clear'])
+def test_m2m_removed_keys_on_instance(instance, change):
+    tag = TestTagModel.objects.create(title='Tag')
+    tag.test_models.add(instance)
+
+    M2M_CHANGES[change](tag, instance)
+
+    changed = tag if change.startswith('forward') else instance
+    assert changed.__dict__[REMOVED_KEYS_ATTR] == {}
@@ -1,7 +1,22 @@
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import ClassVar
+
 import pytest
 from rest_framework import status
-
-from tests.app.models import TestModel, TestModelStatus
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from permission_manager_drf import ManagerPermission
+from permission_manager_drf.permissions import ActionInfo
+from tests.app.models import (
+    TestModel,
+    TestModelPermissionManager,
+    TestModelStatus,
+)
+from tests.app.views import TestModelViewSet
 
 
 @pytest.mark.django_db
@@ -179,3 +194,237 @@ def test_view_without_action_negative(admin_client):
 
     response = admin_client.patch(path=f'/model/{instance.pk}/without_action/')
     assert response.status_code == status.HTTP_200_OK
+
+
+def test_action_map():
+    action_map = ManagerPermission().get_action_map(TestModelViewSet())
+
+    assert action_map['list'] == ActionInfo('list', detail=False)
+    assert action_map['partial_update'] == ActionInfo('update', detail=True)
+    assert action_map['publish'] == ActionInfo('publish', detail=True)
+    assert action_map['custom_non_detail'] == ActionInfo(
+        'custom_non_detail', detail=False
+    )
+
+
+class ArchivePermissionManager(TestModelPermissionManager):
+    def has_bulk_archive_permission(self) -> bool:
+        return (
+            self.instance is not None
+            and self.instance.status == TestModelStatus.DRAFT
+        )
+
+
+class ArchiveManagerPermission(ManagerPermission):
+    action_aliases: ClassVar[dict[str, str]] = {
+        **ManagerPermission.action_aliases,
+        'archive': 'bulk_archive',
+    }
+
+
+class ArchiveViewSet(TestModelViewSet):
+    __test__ = False
+
+    permission_classes: ClassVar[list] = [ArchiveManagerPermission]
+
+    @action(detail=True, methods=['post'])
+    def archive(self, request, **kwargs):
+        self.get_object()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=['post'])
+    def bulk_archive(self, request):
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+def test_action_map_detail_alias():
+    action_map = ArchiveManagerPermission().get_action_map(ArchiveViewSet())
+
+    assert action_map['archive'] == ActionInfo('bulk_archive', detail=True)
+    assert action_map['bulk_archive'] == ActionInfo(
+        'bulk_archive', detail=False
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('instance_status', 'expected_status'),
+    [
+        (TestModelStatus.DRAFT, status.HTTP_204_NO_CONTENT),
+        (TestModelStatus.PUBLISHED, status.HTTP_403_FORBIDDEN),
+    ],
+)
+def test_detail_action_alias(
+    admin_user, monkeypatch, instance_status, expected_status
+):
+    monkeypatch.setattr(
+        TestModel, 'permission_manager', ArchivePermissionManager
+    )
+    instance = TestModel.objects.create(title='Test', status=instance_status)
+    request = APIRequestFactory().post('/')
+    force_authenticate(request, user=admin_user)
+
+    response = ArchiveViewSet.as_view({'post': 'archive'})(
+        request, pk=instance.pk
+    )
+
+    assert response.status_code == expected_status
+
+
+def test_action_map_is_cached(mocker):
+    permission = ManagerPermission()
+    permission.get_action_map(TestModelViewSet())
+    is_detail = mocker.spy(ManagerPermission, 'is_detail')
+
+    assert permission.get_action_info(TestModelViewSet(), 'publish').detail
+    assert not permission.get_action_info(TestModelViewSet(), 'unknown').detail
+    assert not permission.get_action_info(TestModelViewSet(), 'unknown').detail
+    is_detail.assert_called_once()
+
+
+class BulkPermissionManager(TestModelPermissionManager):
+    calls: ClassVar[list] = []
+
+    @classmethod
+    def check_instances(cls, action, managers) -> Iterator:
+        cls.calls.append((action, len(managers)))
+        return super().check_instances(action, managers)
+
+
+def get_bulk_view(action, *, is_staff):
+    return SimpleNamespace(
+        action=action,
+        request=SimpleNamespace(user=SimpleNamespace(is_staff=is_staff)),
+        permission_manager=BulkPermissionManager,
+    )
+
+
+@pytest.fixture
+def bulk_objects():
+    BulkPermissionManager.calls.clear()
+    return [
+        TestModel(pk=pk, title=f'Test {pk}', status=instance_status)
+        for pk, instance_status in enumerate(
+            [
+                TestModelStatus.DRAFT,
+                TestModelStatus.PUBLISHED,
+                TestModelStatus.DRAFT,
+                TestModelStatus.PUBLISHED,
+            ],
+            start=1,
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    ('action', 'is_staff', 'expected'),
+    [
+        ('destroy', True, []),
+        ('destroy', False, [(pk, None) for pk in (1, 2, 3, 4)]),
+        ('publish', True, [(pk, ['Already published']) for pk in (2, 4)]),
+        (None, False, []),
+    ],
+)
+def test_check_objects(bulk_objects, action, is_staff, expected):
+    denied = ManagerPermission().check_objects(
+        None, get_bulk_view(action, is_staff=is_staff), bulk_objects
+    )
+
+    assert [(item.obj.pk, item.messages) for item in denied] == expected
+    if action:
+        assert BulkPermissionManager.calls == [(action, 4)]
+
+
+@pytest.mark.parametrize('from_class', [True, False])
+def test_check_objects_stop_on_first_denial(
+    bulk_objects, monkeypatch, from_class
+):
+    permission = ManagerPermission()
+    kwargs = {}
+    if from_class:
+        monkeypatch.setattr(ManagerPermission, 'stop_on_first_denial', True)
+    else:
+        kwargs['stop_on_first_denial'] = True
+
+    denied = permission.check_objects(
+        None, get_bulk_view('publish', is_staff=True), bulk_objects, **kwargs
+    )
+
+    assert [item.obj.pk for item in denied] == [2]
+
+
+def test_check_objects_empty():
+    BulkPermissionManager.calls.clear()
+    view = get_bulk_view('destroy', is_staff=False)
+
+    assert ManagerPermission().check_objects(None, view, []) == []
+    assert BulkPermissionManager.calls == []
+
+
+def test_check_objects_action(bulk_objects):
+    denied = ManagerPermission().check_objects(
+        None,
+        get_bulk_view('bulk_publish', is_staff=True),
+        bulk_objects,
+        action='publish',
+    )
+
+    assert [item.obj.pk for item in denied] == [2, 4]
+    assert BulkPermissionManager.calls == [('publish', 4)]
+
+
+class BulkPublishPermissionManager(TestModelPermissionManager):
+    def has_bulk_publish_permission(self) -> bool:
+        return self.user.is_staff
+
+
+class BulkPublishViewSet(TestModelViewSet):
+    __test__ = False
+
+    @action(detail=False, methods=['post'])
+    def bulk_publish(self, request):
+        objs = self.get_queryset().filter(pk__in=request.data['ids'])
+        if denied := ManagerPermission().check_objects(
+            request, self, objs, action='publish'
+        ):
+            raise PermissionDenied(
+                {str(item.obj.pk): item.messages for item in denied}
+            )
+        objs.update(status=TestModelStatus.PUBLISHED)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ('published', 'expected_status'),
+    [(False, status.HTTP_204_NO_CONTENT), (True, status.HTTP_403_FORBIDDEN)],
+)
+def test_check_objects_bulk_action(
+    admin_user, monkeypatch, published, expected_status
+):
+    monkeypatch.setattr(
+        TestModel, 'permission_manager', BulkPublishPermissionManager
+    )
+    objs = [
+        TestModel.objects.create(title='Draft'),
+        TestModel.objects.create(
+            title='Published',
+            status=TestModelStatus.PUBLISHED
+            if published
+            else TestModelStatus.DRAFT,
+        ),
+    ]
+    request = APIRequestFactory().post(
+        '/', {'ids': [obj.pk for obj in objs]}, format='json'
+    )
+    force_authenticate(request, user=admin_user)
+
+    response = BulkPublishViewSet.as_view({'post': 'bulk_publish'})(request)
+
+    assert response.status_code == expected_status
+    if published:
+        assert response.data == {str(objs[1].pk): ['Already published']}
+    else:
+        assert set(TestModel.objects.values_list('status', flat=True)) == {
+            TestModelStatus.PUBLISHED
+        }